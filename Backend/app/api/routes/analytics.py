@@ -1,61 +1,508 @@
-from typing import List, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func, desc
+from datetime import date
+from typing import List, Dict, Any, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import case, desc, extract, func, literal, select, union_all
 from sqlalchemy.orm import Session
 
+from app.core import config
+from app.core.broadcast import SnapshotBroadcaster
+from app.core.pagination import parse_sort
+from app.core.pivot import FactSnapshot
+from app.core.proration import prorate
 from app.db.session import get_db
 from app.models.departments import Department
 from app.models.faculty import Faculty
 from app.models.students import Student
 from app.models.projects import Project
 from app.models.publications import Publication
-from app.models.funding import ProjectFunding
+from app.models.funding import FundingSource, ProjectFunding
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
+# Faculty, student and project aggregates per department, for outer-joining onto departments
+_faculty_counts = select(
+    Faculty.dept_id,
+    func.count(Faculty.faculty_id).label("faculty_count")
+).group_by(Faculty.dept_id).subquery()
+
+_student_counts = select(
+    Student.dept_id,
+    func.count(Student.student_id).label("student_count")
+).group_by(Student.dept_id).subquery()
+
+_project_totals = select(
+    Project.dept_id,
+    func.count(Project.project_id).label("project_count"),
+    func.count(case((Project.status == 'Active', Project.project_id))).label("active_projects"),
+    func.sum(Project.budget).label("total_project_budget")
+).group_by(Project.dept_id).subquery()
+
+# Allowed values for the ``sort`` parameter of /departments (prefix with "-" for descending)
+DEPARTMENT_SORT_COLUMNS = {
+    "dept_id": [Department.dept_id],
+    "dept_name": [Department.dept_name],
+    "faculty_count": [func.coalesce(_faculty_counts.c.faculty_count, 0)],
+    "student_count": [func.coalesce(_student_counts.c.student_count, 0)],
+    "project_count": [func.coalesce(_project_totals.c.project_count, 0)],
+    "active_projects": [func.coalesce(_project_totals.c.active_projects, 0)],
+    "total_project_budget": [func.coalesce(_project_totals.c.total_project_budget, 0)],
+    "established_year": [Department.established_year],
+    "budget": [Department.budget],
+}
+
+
+def _dashboard_statistics(db: Session) -> Dict[str, Any]:
+    """Headline counts and totals, computed with two aggregate queries."""
+    totals = db.query(
+        select(func.count(Department.dept_id)).scalar_subquery().label("departments_count"),
+        select(func.count(Faculty.faculty_id)).scalar_subquery().label("faculty_count"),
+        select(func.count(Project.project_id)).where(Project.status == 'Active').scalar_subquery().label("active_projects"),
+        select(func.coalesce(func.sum(Project.budget), 0)).scalar_subquery().label("total_project_budget"),
+        select(func.coalesce(func.sum(ProjectFunding.amount), 0)).scalar_subquery().label("total_funding"),
+        select(func.count(Publication.publication_id)).scalar_subquery().label("total_publications")
+    ).one()
+    
+    # Count students by program type
+    student_counts = db.query(
+        Student.program_type,
+        func.count(Student.student_id)
+    ).group_by(Student.program_type).all()
+    student_by_program = {program: count for program, count in student_counts}
+    
+    return {
+        "departments_count": totals.departments_count,
+        "faculty_count": totals.faculty_count,
+        "student_count": sum(student_by_program.values()),
+        "students_by_program": student_by_program,
+        "active_projects": totals.active_projects,
+        "total_project_budget": totals.total_project_budget,
+        "total_funding": totals.total_funding,
+        # Use the higher of the two values for total funding
+        "total_budget": max(totals.total_project_budget, totals.total_funding),
+        "total_publications": totals.total_publications
+    }
+
+
+def _department_statistics(db: Session) -> List[Dict[str, Any]]:
+    """Faculty and active project counts for every department in one query."""
+    faculty_counts = db.query(
+        Faculty.dept_id,
+        func.count(Faculty.faculty_id).label("faculty_count")
+    ).group_by(Faculty.dept_id).subquery()
+    
+    active_counts = db.query(
+        Project.dept_id,
+        func.count(Project.project_id).label("active_projects")
+    ).filter(Project.status == 'Active').group_by(Project.dept_id).subquery()
+    
+    rows = db.query(
+        Department.dept_id,
+        Department.dept_name,
+        Department.research_focus,
+        func.coalesce(faculty_counts.c.faculty_count, 0).label("faculty_count"),
+        func.coalesce(active_counts.c.active_projects, 0).label("active_projects")
+    ).outerjoin(
+        faculty_counts, faculty_counts.c.dept_id == Department.dept_id
+    ).outerjoin(
+        active_counts, active_counts.c.dept_id == Department.dept_id
+    ).all()
+    
+    return [
+        {
+            "dept_id": row.dept_id,
+            "dept_name": row.dept_name,
+            "research_focus": row.research_focus,
+            "faculty_count": row.faculty_count,
+            "active_projects": row.active_projects
+        }
+        for row in rows
+    ]
+
+
+def _publications_by_department(db: Session) -> Dict[str, int]:
+    """Publication counts keyed by department name; unlinked ones count as "General"."""
+    bucket = case(
+        (Publication.project_id.is_(None), literal("General")),
+        else_=Department.dept_name
+    ).label("bucket")
+    
+    rows = db.query(
+        bucket,
+        func.count(Publication.publication_id)
+    ).outerjoin(
+        Project, Publication.project_id == Project.project_id
+    ).outerjoin(
+        Department, Project.dept_id == Department.dept_id
+    ).group_by(bucket).all()
+    
+    # Publications whose project has no department are left out
+    return {name: count for name, count in rows if name}
+
+
+def _funding_trends(db: Session) -> Dict[int, float]:
+    """Project budgets plus funding allocations, spread over the years they run, in one query."""
+    budgets = select(
+        Project.start_date,
+        Project.end_date,
+        Project.budget.label("amount")
+    ).where(
+        Project.budget.isnot(None),
+        Project.start_date.isnot(None)
+    )
+    allocations = select(
+        ProjectFunding.start_date,
+        ProjectFunding.end_date,
+        ProjectFunding.amount
+    ).where(
+        ProjectFunding.amount.isnot(None),
+        ProjectFunding.start_date.isnot(None)
+    )
+    rows = db.execute(union_all(budgets, allocations)).all()
+    
+    years, totals = prorate(
+        [row.start_date for row in rows],
+        [row.end_date for row in rows],
+        [row.amount for row in rows],
+        period="year"
+    )
+    return {int(str(year)): round(float(total), 2) for year, total in zip(years, totals)}
+
+
+def _funding_burn(
+    db: Session,
+    period: str,
+    granularity: str,
+    dept_id: Optional[int] = None,
+    source_type: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Funding allocations spread over their date ranges, totalled per month or year."""
+    query = db.query(
+        ProjectFunding.start_date,
+        ProjectFunding.end_date,
+        ProjectFunding.amount
+    )
+    if dept_id:
+        query = query.join(Project, ProjectFunding.project_id == Project.project_id).filter(Project.dept_id == dept_id)
+    if source_type:
+        query = query.join(
+            FundingSource, ProjectFunding.funding_id == FundingSource.funding_id
+        ).filter(FundingSource.source_type == source_type)
+    rows = query.all()
+    
+    periods, totals = prorate(
+        [row.start_date for row in rows],
+        [row.end_date for row in rows],
+        [row.amount for row in rows],
+        period=period,
+        granularity=granularity
+    )
+    return [{"period": str(p), "amount": float(total)} for p, total in zip(periods, totals)]
+
+
+def _recent_projects(db: Session, limit: int = 5) -> List[Dict[str, Any]]:
+    """Most recently started active projects with PI and department names."""
+    rows = db.query(
+        Project.project_id,
+        Project.project_title,
+        Project.description,
+        Project.start_date,
+        Project.end_date,
+        Project.status,
+        Project.budget,
+        Project.dept_id,
+        Department.dept_name,
+        Project.principal_investigator_id,
+        Faculty.first_name,
+        Faculty.last_name
+    ).outerjoin(
+        Faculty, Project.principal_investigator_id == Faculty.faculty_id
+    ).outerjoin(
+        Department, Project.dept_id == Department.dept_id
+    ).filter(
+        Project.status == 'Active'
+    ).order_by(
+        Project.start_date.desc()
+    ).limit(limit).all()
+    
+    return [
+        {
+            "project_id": row.project_id,
+            "project_title": row.project_title,
+            "description": row.description,
+            "start_date": row.start_date,
+            "end_date": row.end_date,
+            "status": row.status,
+            "budget": row.budget,
+            "dept_id": row.dept_id,
+            "dept_name": row.dept_name,
+            "principal_investigator_id": row.principal_investigator_id,
+            "principal_investigator_name": f"{row.first_name} {row.last_name}" if row.first_name else None
+        }
+        for row in rows
+    ]
+
+
+def _top_researchers(db: Session, limit: int = 5) -> List[Dict[str, Any]]:
+    """Faculty ranked by projects led, then by the budget of those projects."""
+    led = db.query(
+        Project.principal_investigator_id.label("faculty_id"),
+        func.count(Project.project_id).label("project_count"),
+        func.coalesce(func.sum(Project.budget), 0).label("total_funding")
+    ).group_by(Project.principal_investigator_id).subquery()
+    
+    project_count = func.coalesce(led.c.project_count, 0)
+    total_funding = func.coalesce(led.c.total_funding, 0)
+    rows = db.query(
+        Faculty.faculty_id,
+        Faculty.first_name,
+        Faculty.last_name,
+        Faculty.position,
+        project_count.label("project_count"),
+        total_funding.label("total_funding")
+    ).outerjoin(
+        led, led.c.faculty_id == Faculty.faculty_id
+    ).order_by(
+        project_count.desc(), total_funding.desc(), Faculty.faculty_id
+    ).limit(limit).all()
+    
+    return [
+        {
+            "faculty_id": row.faculty_id,
+            "first_name": row.first_name,
+            "last_name": row.last_name,
+            "position": row.position,
+            "project_count": row.project_count,
+            "total_funding": row.total_funding
+        }
+        for row in rows
+    ]
+
+
+def _department_analytics(db: Session, *criteria, sort: str = "dept_id") -> List[Dict[str, Any]]:
+    """Counts, distributions and budgets for the departments matching ``criteria``, in three queries."""
+    sort_columns, descending = parse_sort(sort, DEPARTMENT_SORT_COLUMNS)
+    order_by = [c.desc() if descending else c for c in sort_columns] + [Department.dept_id]
+
+    rows = db.query(
+        Department,
+        func.coalesce(_faculty_counts.c.faculty_count, 0).label("faculty_count"),
+        func.coalesce(_student_counts.c.student_count, 0).label("student_count"),
+        func.coalesce(_project_totals.c.project_count, 0).label("project_count"),
+        func.coalesce(_project_totals.c.active_projects, 0).label("active_projects"),
+        func.coalesce(_project_totals.c.total_project_budget, 0).label("total_project_budget")
+    ).outerjoin(
+        _faculty_counts, _faculty_counts.c.dept_id == Department.dept_id
+    ).outerjoin(
+        _student_counts, _student_counts.c.dept_id == Department.dept_id
+    ).outerjoin(
+        _project_totals, _project_totals.c.dept_id == Department.dept_id
+    ).filter(*criteria).order_by(*order_by).all()
+    if not rows:
+        return []
+
+    # Distributions for all the departments at once, grouped by (department, value)
+    dept_ids = [row.Department.dept_id for row in rows]
+    positions: Dict[int, Dict[str, int]] = {dept_id: {} for dept_id in dept_ids}
+    for dept_id, position, count in db.query(
+        Faculty.dept_id, Faculty.position, func.count(Faculty.faculty_id)
+    ).filter(Faculty.dept_id.in_(dept_ids)).group_by(Faculty.dept_id, Faculty.position):
+        positions[dept_id][position] = count
+
+    programs: Dict[int, Dict[str, int]] = {dept_id: {} for dept_id in dept_ids}
+    for dept_id, program, count in db.query(
+        Student.dept_id, Student.program_type, func.count(Student.student_id)
+    ).filter(Student.dept_id.in_(dept_ids)).group_by(Student.dept_id, Student.program_type):
+        programs[dept_id][program] = count
+
+    return [
+        {
+            "dept_id": row.Department.dept_id,
+            "department_name": row.Department.dept_name,
+            "faculty_count": row.faculty_count,
+            "faculty_positions_distribution": positions[row.Department.dept_id],
+            "student_count": row.student_count,
+            "student_program_distribution": programs[row.Department.dept_id],
+            "project_count": row.project_count,
+            "active_projects": row.active_projects,
+            "total_project_budget": row.total_project_budget,
+            "research_focus": row.Department.research_focus,
+            "established_year": row.Department.established_year,
+            "budget": row.Department.budget
+        }
+        for row in rows
+    ]
+
+
+def _columns(db: Session, statement) -> Dict[str, List[Any]]:
+    """Result of ``statement`` as one list per column."""
+    result = db.execute(statement)
+    names = list(result.keys())
+    rows = result.all()
+    return {name: [row[i] for row in rows] for i, name in enumerate(names)}
+
+
+def _publication_facts(db: Session) -> Dict[str, List[Any]]:
+    return _columns(db, select(
+        Department.dept_name.label("department"),
+        extract('year', Publication.publication_date).label("year"),
+        Publication.publication_type.label("type"),
+        Project.status.label("status"),
+        Publication.citation_count.label("citations")
+    ).outerjoin(
+        Project, Publication.project_id == Project.project_id
+    ).outerjoin(
+        Department, Project.dept_id == Department.dept_id
+    ))
+
+
+def _project_facts(db: Session) -> Dict[str, List[Any]]:
+    return _columns(db, select(
+        Department.dept_name.label("department"),
+        extract('year', Project.start_date).label("year"),
+        Project.status.label("status"),
+        Project.budget.label("budget")
+    ).outerjoin(
+        Department, Project.dept_id == Department.dept_id
+    ))
+
+
+def _funding_facts(db: Session) -> Dict[str, List[Any]]:
+    return _columns(db, select(
+        Department.dept_name.label("department"),
+        extract('year', ProjectFunding.start_date).label("year"),
+        FundingSource.source_type.label("source_type"),
+        Project.status.label("status"),
+        ProjectFunding.amount.label("amount")
+    ).join(
+        FundingSource, ProjectFunding.funding_id == FundingSource.funding_id
+    ).join(
+        Project, ProjectFunding.project_id == Project.project_id
+    ).outerjoin(
+        Department, Project.dept_id == Department.dept_id
+    ))
+
+
+def _faculty_facts(db: Session) -> Dict[str, List[Any]]:
+    return _columns(db, select(
+        Department.dept_name.label("department"),
+        extract('year', Faculty.hire_date).label("year"),
+        Faculty.position.label("position")
+    ).outerjoin(
+        Department, Faculty.dept_id == Department.dept_id
+    ))
+
+
+def _pivot_snapshot(load, dimensions, measures, models) -> FactSnapshot:
+    return FactSnapshot(
+        load=load,
+        dimensions=dimensions,
+        measures=measures,
+        tables=[model.__tablename__ for model in models],
+        refresh_interval=config.ANALYTICS_PIVOT_REFRESH_SECONDS
+    )
+
+
+# Columnar snapshots behind /pivot, one per fact table; "year" is the
+# publication, project start, allocation start or hire year respectively
+PIVOT_FACTS = {
+    "publications": _pivot_snapshot(
+        _publication_facts, ("department", "year", "type", "status"), ("citations",),
+        (Publication, Project, Department)
+    ),
+    "projects": _pivot_snapshot(
+        _project_facts, ("department", "year", "status"), ("budget",),
+        (Project, Department)
+    ),
+    "funding": _pivot_snapshot(
+        _funding_facts, ("department", "year", "source_type", "status"), ("amount",),
+        (ProjectFunding, FundingSource, Project, Department)
+    ),
+    "faculty": _pivot_snapshot(
+        _faculty_facts, ("department", "year", "position"), (),
+        (Faculty, Department)
+    ),
+}
+
+# Measures offered by /pivot: (fact table, summed column or None to count rows)
+PIVOT_MEASURES = {
+    "publications": ("publications", None),
+    "citations": ("publications", "citations"),
+    "projects": ("projects", None),
+    "budget": ("projects", "budget"),
+    "grants": ("funding", None),
+    "funding": ("funding", "amount"),
+    "faculty": ("faculty", None),
+}
+
+
+def _overview(db: Session) -> Dict[str, Any]:
+    """Everything the home dashboard shows."""
+    statistics = _dashboard_statistics(db)
+    department_stats = _department_statistics(db)
+    
+    top_dept = max(department_stats, key=lambda d: d["faculty_count"], default=None)
+    statistics["department_with_most_faculty"] = (
+        {"name": top_dept["dept_name"], "faculty_count": top_dept["faculty_count"]}
+        if top_dept and top_dept["faculty_count"] else None
+    )
+    
+    research_areas = sorted(department_stats, key=lambda d: d["active_projects"], reverse=True)[:6]
+    
+    return {
+        "statistics": statistics,
+        "funding_trends": _funding_trends(db),
+        "publications_by_department": _publications_by_department(db),
+        "recent_projects": _recent_projects(db),
+        "top_researchers": _top_researchers(db),
+        "research_areas": research_areas
+    }
+
+
+# Tables the overview reads; writes to any of them trigger a live update
+OVERVIEW_TABLES = (
+    Department.__tablename__, Faculty.__tablename__, Student.__tablename__,
+    Project.__tablename__, Publication.__tablename__, ProjectFunding.__tablename__
+)
+
+dashboard_updates = SnapshotBroadcaster(
+    compute=_overview,
+    tables=OVERVIEW_TABLES,
+    interval=config.ANALYTICS_STREAM_INTERVAL_SECONDS,
+    poll_interval=config.ANALYTICS_STREAM_POLL_SECONDS,
+    heartbeat=config.ANALYTICS_STREAM_HEARTBEAT_SECONDS,
+    queue_size=config.ANALYTICS_STREAM_QUEUE_SIZE
+)
+
+
+@router.get("/overview")
+def get_dashboard_overview(db: Session = Depends(get_db)):
+    """Get everything the home dashboard shows in a single response"""
+    try:
+        return _overview(db)
+        
+    except Exception as e:
+        print(f"❌ Error in dashboard overview: {e}")
+        import traceback
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"Error calculating dashboard overview: {str(e)}")
+
+
+@router.get("/stream")
+async def stream_dashboard_overview():
+    """Stream the dashboard overview as Server-Sent Events: a snapshot, then merge patches as data changes"""
+    return StreamingResponse(
+        dashboard_updates.stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 
 @router.get("/dashboard")
 def get_dashboard_statistics(db: Session = Depends(get_db)):
     """Get overall statistics for dashboard"""
     try:
-        print("🔄 Starting dashboard statistics calculation...")
-        
-        # Count departments
-        dept_count = db.query(func.count(Department.dept_id)).scalar()
-        print(f"📊 Departments count: {dept_count}")
-        
-        # Count faculty
-        faculty_count = db.query(func.count(Faculty.faculty_id)).scalar()
-        print(f"📊 Faculty count: {faculty_count}")
-        
-        # Count students by program type
-        student_counts = db.query(
-            Student.program_type,
-            func.count(Student.student_id)
-        ).group_by(Student.program_type).all()
-        student_by_program = {program: count for program, count in student_counts}
-        total_students = sum(student_by_program.values())
-        print(f"📊 Students count: {total_students}")
-        
-        # Count active projects
-        active_projects = db.query(func.count(Project.project_id)).filter(Project.status == 'Active').scalar()
-        print(f"📊 Active projects count: {active_projects}")
-        
-        # Total project budget
-        total_project_budget = db.query(func.sum(Project.budget)).scalar() or 0
-        print(f"💰 Project budget total: ${total_project_budget:,.2f}")
-        
-        # Total funding from funding sources (more accurate)
-        total_funding = db.query(func.sum(ProjectFunding.amount)).scalar() or 0
-        print(f"💰 Funding sources total: ${total_funding:,.2f}")
-        
-        # Use the higher of the two values for total funding
-        total_budget = max(total_project_budget, total_funding)
-        print(f"💰 Total budget: ${total_budget:,.2f}")
-        
-        # Count total publications
-        total_publications = db.query(func.count(Publication.publication_id)).scalar()
-        print(f"📚 Publications count: {total_publications}")
+        result = _dashboard_statistics(db)
         
         # Department with most faculty
         dept_faculty_counts = db.query(
@@ -67,22 +514,8 @@ def get_dashboard_statistics(db: Session = Depends(get_db)):
          .first()
         
         top_dept = {"name": dept_faculty_counts[0], "faculty_count": dept_faculty_counts[1]} if dept_faculty_counts else None
-        print(f"🏆 Top department: {top_dept}")
-        
-        result = {
-            "departments_count": dept_count,
-            "faculty_count": faculty_count,
-            "student_count": total_students,
-            "students_by_program": student_by_program,
-            "active_projects": active_projects,
-            "total_project_budget": total_project_budget,
-            "total_funding": total_funding,
-            "total_budget": total_budget,
-            "total_publications": total_publications,
-            "department_with_most_faculty": top_dept
-        }
+        result["department_with_most_faculty"] = top_dept
         
-        print("✅ Dashboard statistics calculated successfully")
         return result
         
     except Exception as e:
@@ -96,40 +529,7 @@ def get_dashboard_statistics(db: Session = Depends(get_db)):
 def get_publications_by_department(db: Session = Depends(get_db)):
     """Get publications count by department"""
     try:
-        print("🔄 Getting publications by department...")
-        
-        # Get publications with their project departments
-        publications_by_dept = db.query(
-            Department.dept_name,
-            func.count(Publication.publication_id).label("publication_count")
-        ).outerjoin(
-            Project, Publication.project_id == Project.project_id
-        ).outerjoin(
-            Department, Project.dept_id == Department.dept_id
-        ).group_by(
-            Department.dept_name
-        ).all()
-        
-        # Also get publications without projects (count them as "General")
-        publications_without_project = db.query(
-            func.count(Publication.publication_id)
-        ).filter(
-            Publication.project_id.is_(None)
-        ).scalar() or 0
-        
-        result = {}
-        
-        # Add department publications
-        for dept_name, count in publications_by_dept:
-            if dept_name:  # Only add if department name exists
-                result[dept_name] = count
-        
-        # Add publications without projects
-        if publications_without_project > 0:
-            result["General"] = publications_without_project
-        
-        print(f"✅ Publications by department: {result}")
-        return result
+        return _publications_by_department(db)
         
     except Exception as e:
         print(f"❌ Error getting publications by department: {e}")
@@ -142,54 +542,7 @@ def get_publications_by_department(db: Session = Depends(get_db)):
 def get_funding_trends(db: Session = Depends(get_db)):
     """Get funding trends by year for dashboard chart"""
     try:
-        print("🔄 Getting funding trends...")
-        
-        # Get funding by year from projects
-        funding_by_year = db.query(
-            func.extract('year', Project.start_date).label('year'),
-            func.sum(Project.budget).label("total_budget")
-        ).filter(
-            Project.budget.isnot(None),
-            Project.start_date.isnot(None)
-        ).group_by(
-            func.extract('year', Project.start_date)
-        ).order_by(
-            func.extract('year', Project.start_date)
-        ).all()
-        
-        # Also get funding by year from funding sources
-        funding_sources_by_year = db.query(
-            func.extract('year', ProjectFunding.start_date).label('year'),
-            func.sum(ProjectFunding.amount).label("total_amount")
-        ).filter(
-            ProjectFunding.amount.isnot(None),
-            ProjectFunding.start_date.isnot(None)
-        ).group_by(
-            func.extract('year', ProjectFunding.start_date)
-        ).order_by(
-            func.extract('year', ProjectFunding.start_date)
-        ).all()
-        
-        # Combine both sources
-        combined_funding = {}
-        
-        # Add project budgets
-        for year, budget in funding_by_year:
-            if year is not None:
-                year_int = int(year)
-                combined_funding[year_int] = combined_funding.get(year_int, 0) + (budget or 0)
-        
-        # Add funding source amounts
-        for year, amount in funding_sources_by_year:
-            if year is not None:
-                year_int = int(year)
-                combined_funding[year_int] = combined_funding.get(year_int, 0) + (amount or 0)
-        
-        # Sort by year
-        sorted_funding = dict(sorted(combined_funding.items()))
-        
-        print(f"✅ Funding trends: {sorted_funding}")
-        return sorted_funding
+        return _funding_trends(db)
         
     except Exception as e:
         print(f"❌ Error getting funding trends: {e}")
@@ -198,67 +551,110 @@ def get_funding_trends(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error getting funding trends: {str(e)}")
 
 
+@router.get("/departments")
+def get_all_department_analytics(sort: str = "dept_id", db: Session = Depends(get_db)):
+    """Get analytics for every department, for comparison views.
+
+    ``sort`` orders the departments by any of the returned counts or totals
+    (prefix with "-" for descending).
+    """
+    return _department_analytics(db, sort=sort)
+
+
+@router.get("/funding-burn")
+def get_funding_burn(
+    period: Literal["month", "year"] = "month",
+    granularity: Literal["day", "month"] = "day",
+    dept_id: Optional[int] = None,
+    source_type: Optional[str] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    db: Session = Depends(get_db)
+):
+    """Funding committed per month or year, each allocation spread over its start-end range.
+
+    With ``granularity=day`` an allocation is spread evenly over its days, so
+    partial months get a partial share; with ``month`` every month it touches
+    gets an equal share. ``start``/``end`` limit the periods returned.
+    """
+    series = _funding_burn(db, period, granularity, dept_id, source_type)
+    if start:
+        first = str(start)[:7] if period == "month" else str(start.year)
+        series = [item for item in series if item["period"] >= first]
+    if end:
+        last = str(end)[:7] if period == "month" else str(end.year)
+        series = [item for item in series if item["period"] <= last]
+    
+    return {
+        "period": period,
+        "granularity": granularity,
+        "filters": {"dept_id": dept_id, "source_type": source_type, "start": start, "end": end},
+        "series": [{"period": item["period"], "amount": round(item["amount"], 2)} for item in series],
+        "total": round(sum(item["amount"] for item in series), 2)
+    }
+
+
+@router.get("/pivot")
+def get_pivot(
+    measure: str = "publications",
+    by: List[str] = Query([]),
+    department: Optional[str] = None,
+    year: Optional[str] = None,
+    publication_type: Optional[str] = Query(None, alias="type"),
+    status: Optional[str] = None,
+    source_type: Optional[str] = None,
+    position: Optional[str] = None
+):
+    """Aggregate a measure by any combination of dimensions.
+
+    ``by`` may be repeated to group by several dimensions; the dimension
+    parameters (``department``, ``year``, ``type``, ...) slice the data to
+    one value each. Served from an in-memory snapshot instead of the database.
+    """
+    if measure not in PIVOT_MEASURES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid measure '{measure}'. Allowed: {', '.join(PIVOT_MEASURES)}"
+        )
+    fact, column = PIVOT_MEASURES[measure]
+    snapshot = PIVOT_FACTS[fact]
+
+    filters = {
+        name: value
+        for name, value in (
+            ("department", department), ("year", year), ("type", publication_type),
+            ("status", status), ("source_type", source_type), ("position", position)
+        )
+        if value is not None
+    }
+    for name in [*by, *filters]:
+        if name not in snapshot.dimensions:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Cannot break down '{measure}' by '{name}'. Allowed: {', '.join(snapshot.dimensions)}"
+            )
+    if len(set(by)) != len(by):
+        raise HTTPException(status_code=400, detail="Each dimension may appear in 'by' only once")
+
+    table = snapshot.get()
+    cells = table.pivot(column, by, filters)
+    return {
+        "measure": measure,
+        "by": by,
+        "filters": filters,
+        "rows": [{**dict(zip(by, labels)), "value": total} for labels, total in cells],
+        "total": sum(total for _, total in cells),
+        "snapshot": {"rows": table.size, "refreshed_at": table.refreshed_at}
+    }
+
+
 @router.get("/department/{dept_id}")
 def get_department_analytics(dept_id: int, db: Session = Depends(get_db)):
     """Get analytics for a specific department"""
-    # Check if department exists
-    department = db.query(Department).filter(Department.dept_id == dept_id).first()
-    if not department:
+    analytics = _department_analytics(db, Department.dept_id == dept_id)
+    if not analytics:
         raise HTTPException(status_code=404, detail="Department not found")
-    
-    # Faculty count in department
-    faculty_count = db.query(func.count(Faculty.faculty_id))\
-        .filter(Faculty.dept_id == dept_id)\
-        .scalar()
-    
-    # Faculty positions distribution
-    faculty_positions = db.query(
-        Faculty.position,
-        func.count(Faculty.faculty_id).label("count")
-    ).filter(Faculty.dept_id == dept_id)\
-     .group_by(Faculty.position)\
-     .all()
-    positions_dist = {position: count for position, count in faculty_positions}
-    
-    # Student count in department
-    student_count = db.query(func.count(Student.student_id))\
-        .filter(Student.dept_id == dept_id)\
-        .scalar()
-    
-    # Student program type distribution
-    student_programs = db.query(
-        Student.program_type,
-        func.count(Student.student_id).label("count")
-    ).filter(Student.dept_id == dept_id)\
-     .group_by(Student.program_type)\
-     .all()
-    programs_dist = {program: count for program, count in student_programs}
-    
-    # Project count for department
-    project_count = db.query(func.count(Project.project_id))\
-        .filter(Project.dept_id == dept_id)\
-        .scalar()
-    
-    # Active projects count
-    active_project_count = db.query(func.count(Project.project_id))\
-        .filter(Project.dept_id == dept_id, Project.status == 'Active')\
-        .scalar()
-    
-    # Total project budget
-    total_budget = db.query(func.sum(Project.budget))\
-        .filter(Project.dept_id == dept_id)\
-        .scalar() or 0
-    
-    return {
-        "department_name": department.dept_name,
-        "faculty_count": faculty_count,
-        "faculty_positions_distribution": positions_dist,
-        "student_count": student_count,
-        "student_program_distribution": programs_dist,
-        "project_count": project_count,
-        "active_projects": active_project_count,
-        "total_project_budget": total_budget,
-        "research_focus": department.research_focus,
-        "established_year": department.established_year,
-        "budget": department.budget
-    }
+
+    result = analytics[0]
+    del result["dept_id"]
+    return result
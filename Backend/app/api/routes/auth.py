@@ -6,7 +6,7 @@ from typing import List
 
 from app.db.session import get_db
 from app.core.auth import (
-    verify_password, get_password_hash, create_access_token,
+    verify_and_update_password, get_password_hash, create_access_token,
     get_current_user, require_admin, require_owner_or_admin
 )
 from app.schemas.auth import UserCreate, UserLogin, UserProfile, UserUpdate, Token
@@ -18,11 +18,14 @@ from app.models.departments import Department
 router = APIRouter()
 
 @router.post("/login", response_model=Token)
-async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
+def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
     """User login endpoint."""
     user = db.query(User).filter(User.email == user_credentials.email).first()
     
-    if not user or not verify_password(user_credentials.password, user.hashed_password):
+    verified, new_hash = (False, None)
+    if user:
+        verified, new_hash = verify_and_update_password(user_credentials.password, user.hashed_password)
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -35,6 +38,11 @@ async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
             detail="Inactive user"
         )
     
+    # Migrate the stored hash to the current scheme and cost while the password is at hand
+    if new_hash:
+        user.hashed_password = new_hash
+        db.commit()
+    
     access_token_expires = timedelta(minutes=30)
     access_token = create_access_token(
         data={"sub": user.email, "user_type": user.user_type, "user_id": user.user_id},
@@ -50,7 +58,7 @@ async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
     }
 
 @router.post("/register", response_model=Token)
-async def register(user_data: UserCreate, db: Session = Depends(get_db)):
+def register(user_data: UserCreate, db: Session = Depends(get_db)):
     """User registration endpoint."""
     # Check if user already exists
     existing_user = db.query(User).filter(User.email == user_data.email).first()
@@ -1,8 +1,9 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
+from app.core.pagination import paginate_keyset, parse_sort, set_next_cursor
 from app.db.session import get_db
 from app.models.collaborators import ProjectCollaborator
 from app.models.projects import Project
@@ -10,6 +11,15 @@ from app.models.faculty import Faculty
 
 router = APIRouter(prefix="/project-collaborators", tags=["collaborators"])
 
+# Allowed values for the ``sort`` parameter (prefix with "-" for descending)
+COLLABORATOR_SORT_COLUMNS = {
+    "project_id": [ProjectCollaborator.project_id],
+    "faculty_id": [ProjectCollaborator.faculty_id],
+    "role": [ProjectCollaborator.role],
+    "project_title": [Project.project_title],
+    "faculty_name": [Faculty.last_name, Faculty.first_name],
+}
+
 # Pydantic model for JSON requests
 class CollaboratorCreate(BaseModel):
     project_id: int
@@ -20,37 +30,61 @@ class CollaboratorCreate(BaseModel):
 
 @router.get("/", response_model=List[dict])
 def get_project_collaborators(
+    response: Response,
     project_id: int = None,
     faculty_id: int = None,
+    sort: str = "project_id",
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    """Get project collaborators with optional filters"""
-    query = db.query(ProjectCollaborator)
+    """Get project collaborators with optional filters.
+
+    Results are keyset-paginated: when more rows are available the cursor for
+    the next page is returned in the ``X-Next-Cursor`` response header.
+    """
+    sort_columns, descending = parse_sort(sort, COLLABORATOR_SORT_COLUMNS)
+
+    query = db.query(
+        ProjectCollaborator.project_id,
+        ProjectCollaborator.faculty_id,
+        ProjectCollaborator.role,
+        ProjectCollaborator.involvement_percentage,
+        Project.project_title,
+        Faculty.first_name,
+        Faculty.last_name
+    ).join(
+        Project, ProjectCollaborator.project_id == Project.project_id
+    ).join(
+        Faculty, ProjectCollaborator.faculty_id == Faculty.faculty_id
+    )
     
     if project_id:
         query = query.filter(ProjectCollaborator.project_id == project_id)
     if faculty_id:
         query = query.filter(ProjectCollaborator.faculty_id == faculty_id)
     
-    collaborators = query.all()
-    
-    result = []
-    for collab in collaborators:
-        # Get project and faculty details
-        project = db.query(Project).filter(Project.project_id == collab.project_id).first()
-        faculty = db.query(Faculty).filter(Faculty.faculty_id == collab.faculty_id).first()
-        
-        if project and faculty:
-            result.append({
-                "project_id": collab.project_id,
-                "project_title": project.project_title,
-                "faculty_id": collab.faculty_id,
-                "faculty_name": f"{faculty.first_name} {faculty.last_name}",
-                "role": collab.role,
-                "involvement_percentage": collab.involvement_percentage
-            })
-    
-    return result
+    rows, next_cursor = paginate_keyset(
+        query,
+        sort_columns,
+        [ProjectCollaborator.project_id, ProjectCollaborator.faculty_id],
+        descending,
+        limit,
+        cursor
+    )
+    set_next_cursor(response, next_cursor)
+    
+    return [
+        {
+            "project_id": row.project_id,
+            "project_title": row.project_title,
+            "faculty_id": row.faculty_id,
+            "faculty_name": f"{row.first_name} {row.last_name}",
+            "role": row.role,
+            "involvement_percentage": row.involvement_percentage
+        }
+        for row in rows
+    ]
 
 
 @router.post("/")
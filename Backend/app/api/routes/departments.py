@@ -2,12 +2,25 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
+from app.core.config import BATCH_CHUNK_SIZE
+from app.core.responses import list_response, trusted_json_response
+from app.core.conditional import conditional_get
+from app.core.delta import SINCE_DESCRIPTION, adapter_serializer, delta_response
+from app.db.batch import BatchSpec, run_batch
 from app.db.session import get_db
 from app.models.departments import Department
-from app.schemas.departments import DepartmentCreate, DepartmentUpdate, Department as DepartmentSchema
+from app.schemas.batch import BatchRequest, BatchResponse
+from app.schemas.departments import DepartmentCreate, DepartmentUpdate, Department as DepartmentSchema, DepartmentList
 
 router = APIRouter(prefix="/departments", tags=["departments"])
 
+DEPARTMENT_BATCH = BatchSpec(
+    model=Department,
+    create_schema=DepartmentCreate,
+    update_schema=DepartmentUpdate,
+    label="Department"
+)
+
 
 @router.post("/", response_model=DepartmentSchema, status_code=201)
 def create_department(department: DepartmentCreate, db: Session = Depends(get_db)):
@@ -19,15 +32,28 @@ def create_department(department: DepartmentCreate, db: Session = Depends(get_db
     return db_department
 
 
-@router.get("/", response_model=List[DepartmentSchema])
+@router.post("/batch", response_model=BatchResponse)
+def batch_departments(batch: BatchRequest, db: Session = Depends(get_db)):
+    """Create, update and delete departments in one request"""
+    result = run_batch(db, DEPARTMENT_BATCH, batch.operations, batch.atomic, BATCH_CHUNK_SIZE)
+    if result["failed"]:
+        # Atomic batches applied nothing; others applied everything that succeeded
+        return trusted_json_response(result, status_code=400 if batch.atomic else 207)
+    return result
+
+
+@router.get("/", response_model=List[DepartmentSchema], dependencies=[conditional_get(Department)])
 def read_departments(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     dept_name: Optional[str] = None,
     established_year: Optional[int] = None,
+    since: Optional[int] = Query(None, ge=0, description=SINCE_DESCRIPTION),
     db: Session = Depends(get_db)
 ):
     """Get all departments with optional filters"""
+    if since is not None:
+        return delta_response(db, Department, since, adapter_serializer(DepartmentList))
     query = db.query(Department)
     
     if dept_name:
@@ -36,10 +62,10 @@ def read_departments(
         query = query.filter(Department.established_year == established_year)
     
     departments = query.offset(skip).limit(limit).all()
-    return departments
+    return list_response(DepartmentList, departments)
 
 
-@router.get("/{dept_id}", response_model=DepartmentSchema)
+@router.get("/{dept_id}", response_model=DepartmentSchema, dependencies=[conditional_get(Department)])
 def read_department(dept_id: int, db: Session = Depends(get_db)):
     """Get a specific department by ID"""
     db_department = db.query(Department).filter(Department.dept_id == dept_id).first()
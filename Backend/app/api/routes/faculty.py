@@ -1,13 +1,42 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, selectinload
 
+from app.core.config import BATCH_CHUNK_SIZE
+from app.core.responses import list_response, trusted_json_response
+from app.core.conditional import conditional_get
+from app.core.delta import SINCE_DESCRIPTION, adapter_serializer, delta_response
+from app.core.selection import parse_fields, parse_sections, select_fields
+from app.db.batch import BatchSpec, run_batch
+from app.db.cascade import FACULTY_CASCADE, cascade_delete
+from app.db.loaders import funding_by_source_type, load_projects, load_publications, project_summary
 from app.db.session import get_db
+from app.models.collaborators import ProjectCollaborator
+from app.models.departments import Department
 from app.models.faculty import Faculty
-from app.schemas.faculty import FacultyCreate, FacultyUpdate, Faculty as FacultySchema
+from app.models.funding import FundingSource, ProjectFunding
+from app.models.projects import Project
+from app.models.publication_authors import PublicationAuthor
+from app.models.publications import Publication
+from app.models.students import Student
+from app.schemas.faculty import FacultyCreate, FacultyUpdate, Faculty as FacultySchema, FacultyList
+from app.schemas.batch import BatchRequest, BatchResponse
+from app.schemas.students import StudentList
 
 router = APIRouter(prefix="/faculty", tags=["faculty"])
 
+# Fields selectable through ?fields= on list endpoints
+FACULTY_FIELDS = tuple(FacultySchema.model_fields)
+
+FACULTY_BATCH = BatchSpec(
+    model=Faculty,
+    create_schema=FacultyCreate,
+    update_schema=FacultyUpdate,
+    label="Faculty member",
+    foreign_keys={"dept_id": Department},
+    cascade=FACULTY_CASCADE
+)
+
 
 @router.post("/", response_model=FacultySchema)
 def create_faculty(faculty: FacultyCreate, db: Session = Depends(get_db)):
@@ -19,16 +48,31 @@ def create_faculty(faculty: FacultyCreate, db: Session = Depends(get_db)):
     return db_faculty
 
 
-@router.get("/", response_model=List[FacultySchema])
+@router.post("/batch", response_model=BatchResponse)
+def batch_faculty(batch: BatchRequest, db: Session = Depends(get_db)):
+    """Create, update and delete faculty members in one request"""
+    result = run_batch(db, FACULTY_BATCH, batch.operations, batch.atomic, BATCH_CHUNK_SIZE)
+    if result["failed"]:
+        # Atomic batches applied nothing; others applied everything that succeeded
+        return trusted_json_response(result, status_code=400 if batch.atomic else 207)
+    return result
+
+
+@router.get("/", response_model=List[FacultySchema], dependencies=[conditional_get(Faculty)])
 def read_faculty_members(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     dept_id: Optional[int] = None,
     position: Optional[str] = None,
     name: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated subset of fields to return"),
+    since: Optional[int] = Query(None, ge=0, description=SINCE_DESCRIPTION),
     db: Session = Depends(get_db)
 ):
     """Get all faculty members with optional filters"""
+    if since is not None:
+        return delta_response(db, Faculty, since, adapter_serializer(FacultyList))
+    selected = parse_fields(fields, FACULTY_FIELDS, always=("faculty_id",))
     query = db.query(Faculty)
     
     if dept_id:
@@ -39,10 +83,14 @@ def read_faculty_members(
         query = query.filter((Faculty.first_name.ilike(f"%{name}%")) | 
                             (Faculty.last_name.ilike(f"%{name}%")))
     
-    faculty_members = query.offset(skip).limit(limit).all()
-    return faculty_members
+    query = query.offset(skip).limit(limit)
+    if selected:
+        return trusted_json_response(select_fields(query, Faculty, selected))
+    
+    faculty_members = query.all()
+    return list_response(FacultyList, faculty_members)
 
-@router.get("/search", response_model=List[FacultySchema])
+@router.get("/search", response_model=List[FacultySchema], dependencies=[conditional_get(Faculty)])
 def search_faculty(
     name: Optional[str] = None,
     dept_id: Optional[int] = None,
@@ -66,10 +114,10 @@ def search_faculty(
         query = query.filter(Faculty.research_interests.ilike(f"%{research_interests}%"))
     
     faculty_members = query.offset(skip).limit(limit).all()
-    return faculty_members
+    return list_response(FacultyList, faculty_members)
 
 
-@router.get("/{faculty_id}", response_model=FacultySchema)
+@router.get("/{faculty_id}", response_model=FacultySchema, dependencies=[conditional_get(Faculty)])
 def read_faculty(faculty_id: int, db: Session = Depends(get_db)):
     """Get a specific faculty member by ID"""
     db_faculty = db.query(Faculty).filter(Faculty.faculty_id == faculty_id).first()
@@ -78,6 +126,78 @@ def read_faculty(faculty_id: int, db: Session = Depends(get_db)):
     return db_faculty
 
 
+FACULTY_PORTFOLIO_SECTIONS = ("department", "advisees", "projects", "publications", "funding")
+
+
+@router.get(
+    "/{faculty_id}/portfolio",
+    dependencies=[conditional_get(
+        Faculty, Department, Student, Project, ProjectCollaborator,
+        Publication, PublicationAuthor, ProjectFunding, FundingSource
+    )]
+)
+def read_faculty_portfolio(
+    faculty_id: int,
+    sections: Optional[str] = Query(None, description=f"Comma-separated subset of: {', '.join(FACULTY_PORTFOLIO_SECTIONS)}"),
+    db: Session = Depends(get_db)
+):
+    """Get a faculty member's department, advisees, projects, publications and funding"""
+    selected = parse_sections(sections, FACULTY_PORTFOLIO_SECTIONS)
+
+    query = db.query(Faculty).options(joinedload(Faculty.department))
+    if "advisees" in selected:
+        query = query.options(selectinload(Faculty.advisees))
+    db_faculty = query.filter(Faculty.faculty_id == faculty_id).first()
+    if db_faculty is None:
+        raise HTTPException(status_code=404, detail="Faculty member not found")
+
+    portfolio = {"faculty": FacultySchema.model_validate(db_faculty)}
+
+    if "department" in selected:
+        department = db_faculty.department
+        portfolio["department"] = {
+            "dept_id": department.dept_id,
+            "dept_name": department.dept_name,
+            "research_focus": department.research_focus
+        } if department else None
+
+    if "advisees" in selected:
+        portfolio["advisees"] = StudentList.validate_python(db_faculty.advisees, from_attributes=True)
+
+    if "projects" in selected or "funding" in selected:
+        led = load_projects(db, Project.principal_investigator_id == faculty_id)
+        collaborating = load_projects(
+            db,
+            ProjectCollaborator.faculty_id == faculty_id,
+            extra_columns=(ProjectCollaborator.role, ProjectCollaborator.involvement_percentage),
+            joins=((ProjectCollaborator, ProjectCollaborator.project_id == Project.project_id),)
+        )
+
+        if "projects" in selected:
+            portfolio["projects"] = {
+                "as_principal_investigator": [project_summary(p, total) for p, total in led],
+                "as_collaborator": [
+                    {**project_summary(p, total), "role": role, "involvement_percentage": involvement}
+                    for p, total, role, involvement in collaborating
+                ]
+            }
+
+        if "funding" in selected:
+            portfolio["funding"] = {
+                "principal_investigator_budget": sum(p.budget or 0 for p, _ in led),
+                "principal_investigator_funding": sum(total or 0 for _, total in led),
+                "collaborator_budget": sum(p.budget or 0 for p, *_ in collaborating),
+                "collaborator_funding": sum(total or 0 for _, total, *_ in collaborating),
+                "by_source_type": funding_by_source_type(db, [p.project_id for p, _ in led])
+            }
+
+    if "publications" in selected:
+        authored = db.query(PublicationAuthor.publication_id).filter(PublicationAuthor.faculty_id == faculty_id)
+        portfolio["publications"] = load_publications(db, Publication.publication_id.in_(authored))
+
+    return trusted_json_response(portfolio)
+
+
 @router.put("/{faculty_id}", response_model=FacultySchema)
 def update_faculty(faculty_id: int, faculty: FacultyUpdate, db: Session = Depends(get_db)):
     """Update a faculty member"""
@@ -95,12 +215,21 @@ def update_faculty(faculty_id: int, faculty: FacultyUpdate, db: Session = Depend
 
 
 @router.delete("/{faculty_id}", response_model=FacultySchema)
-def delete_faculty(faculty_id: int, db: Session = Depends(get_db)):
-    """Delete a faculty member"""
+def delete_faculty(
+    faculty_id: int,
+    dry_run: bool = Query(False, description="Report the rows that would be affected without deleting"),
+    db: Session = Depends(get_db)
+):
+    """Delete a faculty member with their collaborations and authorships"""
     db_faculty = db.query(Faculty).filter(Faculty.faculty_id == faculty_id).first()
     if db_faculty is None:
         raise HTTPException(status_code=404, detail="Faculty member not found")
     
-    db.delete(db_faculty)
+    if dry_run:
+        return trusted_json_response({"dry_run": True, **cascade_delete(db, FACULTY_CASCADE, [faculty_id], dry_run=True)})
+    
+    # Led projects, advisees and the login account are kept but unlinked
+    deleted = FacultySchema.model_validate(db_faculty)
+    cascade_delete(db, FACULTY_CASCADE, [faculty_id])
     db.commit()
-    return db_faculty
+    return deleted
@@ -1,8 +1,16 @@
+from datetime import date
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from app.core.export import EXPORT_FORMAT_DESCRIPTION, ExportFormat, export_response
+from app.core.responses import list_response, trusted_json_response
+from app.core.conditional import conditional_get
+from app.core.intervals import OVERLAPS_DESCRIPTION
+from app.core.delta import SINCE_DESCRIPTION, adapter_serializer, delta_response
+from app.db.cascade import FUNDING_SOURCE_CASCADE, cascade_delete
+from app.db.intervals import funding_date_criteria
 from app.db.session import get_db
 from app.models.funding import FundingSource, ProjectFunding
 from app.models.projects import Project
@@ -10,6 +18,7 @@ from app.schemas.funding import (
     FundingSourceCreate, 
     FundingSourceUpdate, 
     FundingSourceInDB,
+    FundingSourceList,
     FundingSourceWithProjects,
     ProjectFundingCreate,
     ProjectFundingUpdate,
@@ -20,13 +29,16 @@ from app.schemas.funding import (
 router = APIRouter(tags=["funding"]) 
 
 # Funding Sources endpoints
-@router.get("/funding-sources", response_model=List[FundingSourceInDB])
+@router.get("/funding-sources", response_model=List[FundingSourceInDB], dependencies=[conditional_get(FundingSource)])
 def get_funding_sources(
     search: Optional[str] = None,
     type: Optional[str] = None,
+    since: Optional[int] = Query(None, ge=0, description=SINCE_DESCRIPTION),
     db: Session = Depends(get_db)
 ):
     """Get all funding sources with optional filtering"""
+    if since is not None:
+        return delta_response(db, FundingSource, since, adapter_serializer(FundingSourceList))
     query = db.query(FundingSource)
     
     # Apply filters
@@ -37,9 +49,9 @@ def get_funding_sources(
         query = query.filter(FundingSource.source_type == type)
     
     funding_sources = query.order_by(FundingSource.source_name).all()
-    return funding_sources
+    return list_response(FundingSourceList, funding_sources)
 
-@router.get("/funding-sources/summary")
+@router.get("/funding-sources/summary", dependencies=[conditional_get(FundingSource, ProjectFunding)])
 def get_funding_summary(db: Session = Depends(get_db)):
     """Get funding summary statistics for dashboard"""
     # Total funding across all projects
@@ -84,7 +96,7 @@ def get_funding_summary(db: Session = Depends(get_db)):
         "top_funding_sources": top_sources_list
     }
 
-@router.get("/funding-sources/{funding_id}", response_model=FundingSourceWithProjects)
+@router.get("/funding-sources/{funding_id}", response_model=FundingSourceWithProjects, dependencies=[conditional_get(FundingSource, ProjectFunding, Project)])
 def get_funding_source(funding_id: int, db: Session = Depends(get_db)):
     """Get a specific funding source by ID with funded projects"""
     funding_source = db.query(FundingSource).filter(FundingSource.funding_id == funding_id).first()
@@ -165,30 +177,35 @@ def update_funding_source(funding_id: int, funding_source: FundingSourceUpdate,
     return db_funding_source
 
 @router.delete("/funding-sources/{funding_id}")
-def delete_funding_source(funding_id: int, db: Session = Depends(get_db)):
-    """Delete a funding source"""
+def delete_funding_source(
+    funding_id: int,
+    dry_run: bool = Query(False, description="Report the rows that would be affected without deleting"),
+    db: Session = Depends(get_db)
+):
+    """Delete a funding source with its project allocations"""
     db_funding_source = db.query(FundingSource).filter(FundingSource.funding_id == funding_id).first()
     
     if not db_funding_source:
         raise HTTPException(status_code=404, detail=f"Funding source with ID {funding_id} not found")
     
-    # Check if funding source has allocations
-    allocations = db.query(ProjectFunding).filter(ProjectFunding.funding_id == funding_id).first()
-    if allocations:
-        raise HTTPException(status_code=400, detail="Cannot delete funding source with existing project allocations")
+    if dry_run:
+        return {"dry_run": True, **cascade_delete(db, FUNDING_SOURCE_CASCADE, [funding_id], dry_run=True)}
     
-    db.delete(db_funding_source)
+    affected = cascade_delete(db, FUNDING_SOURCE_CASCADE, [funding_id])
     db.commit()
     
-    return {"message": "Funding source deleted successfully"}
+    return {"message": "Funding source deleted successfully", **affected}
 
 # Project Funding endpoints
 @router.get("/project-funding", response_model=PaginatedProjectFunding)
 def get_project_funding(
     search: Optional[str] = None,
     type: Optional[str] = None,
+    active_on: Optional[date] = Query(None, description="Only allocations running on this date"),
+    overlaps: Optional[str] = Query(None, description=OVERLAPS_DESCRIPTION),
     page: int = 1,
     limit: int = 10,
+    export_format: Optional[ExportFormat] = Query(None, alias="format", description=EXPORT_FORMAT_DESCRIPTION),
     db: Session = Depends(get_db)
 ):
     """Get all project funding allocations with optional filtering and pagination"""
@@ -217,6 +234,12 @@ def get_project_funding(
     
     if type:
         query = query.filter(FundingSource.source_type == type)
+    query = query.filter(*funding_date_criteria(active_on, overlaps))
+    
+    # Exports hold every matching allocation, so pagination does not apply
+    if export_format:
+        statement = query.order_by(ProjectFunding.start_date.desc(), ProjectFunding.project_id, ProjectFunding.funding_id).statement
+        return export_response(statement, export_format, "project_funding")
     
     # Count total items
     total = query.count()
@@ -243,12 +266,12 @@ def get_project_funding(
             "source_type": allocation.source_type
         })
     
-    return {
+    return trusted_json_response({
         "total": total,
         "total_pages": total_pages,
         "current_page": page,
         "items": results
-    }
+    })
 
 @router.post("/project-funding", response_model=ProjectFundingWithDetails)
 def create_project_funding(funding: ProjectFundingCreate, db: Session = Depends(get_db)):
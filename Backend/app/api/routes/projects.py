@@ -1,15 +1,49 @@
+from datetime import date
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, selectinload
 
+from app.core.config import BATCH_CHUNK_SIZE
+from app.core.responses import list_response, trusted_json_response
+from app.core.conditional import conditional_get
+from app.core.intervals import OVERLAPS_DESCRIPTION
+from app.core.delta import SINCE_DESCRIPTION, adapter_serializer, delta_response
+from app.core.selection import parse_fields, select_fields
+from app.db.batch import BatchSpec, run_batch
+from app.db.cascade import PROJECT_CASCADE, cascade_delete
+from app.db.intervals import project_date_criteria
+from app.db.loaders import project_summary, publication_summary
 from app.db.session import get_db
+from app.db.team import missing_ids, sync_members
+from app.models.collaborators import ProjectCollaborator
+from app.models.departments import Department
+from app.models.funding import FundingSource, ProjectFunding
 from app.models.projects import Project
 from app.models.faculty import Faculty
+from app.models.publication_authors import PublicationAuthor
+from app.models.publications import Publication
+from app.models.student_research import StudentResearch
 from app.models.students import Student
-from app.schemas.projects import ProjectCreate, ProjectUpdate, Project as ProjectSchema
+from app.schemas.batch import BatchRequest, BatchResponse
+from app.schemas.projects import (
+    ProjectCreate, ProjectFieldsUpdate, ProjectUpdate, Project as ProjectSchema, ProjectList,
+    ProjectTeamSync, ProjectTeamUpdate
+)
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
+# Fields selectable through ?fields= on list endpoints
+PROJECT_FIELDS = tuple(ProjectSchema.model_fields)
+
+PROJECT_BATCH = BatchSpec(
+    model=Project,
+    create_schema=ProjectCreate,
+    update_schema=ProjectFieldsUpdate,
+    label="Project",
+    foreign_keys={"principal_investigator_id": Faculty, "dept_id": Department},
+    cascade=PROJECT_CASCADE
+)
+
 
 @router.post("/", response_model=ProjectSchema, status_code=201)
 def create_project(project: ProjectCreate, db: Session = Depends(get_db)):
@@ -26,38 +60,69 @@ def create_project(project: ProjectCreate, db: Session = Depends(get_db)):
     return db_project
 
 
-@router.get("/", response_model=List[ProjectSchema])
+@router.post("/batch", response_model=BatchResponse)
+def batch_projects(batch: BatchRequest, db: Session = Depends(get_db)):
+    """Create, update and delete projects in one request"""
+    result = run_batch(db, PROJECT_BATCH, batch.operations, batch.atomic, BATCH_CHUNK_SIZE)
+    if result["failed"]:
+        # Atomic batches applied nothing; others applied everything that succeeded
+        return trusted_json_response(result, status_code=400 if batch.atomic else 207)
+    return result
+
+
+@router.get("/", response_model=List[ProjectSchema], dependencies=[conditional_get(Project)])
 def read_projects(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     title: Optional[str] = None,
     is_active: Optional[bool] = None,
+    principal_investigator_id: Optional[int] = None,
+    dept_id: Optional[int] = None,
+    status: Optional[str] = None,
+    active_on: Optional[date] = Query(None, description="Only projects running on this date"),
+    overlaps: Optional[str] = Query(None, description=OVERLAPS_DESCRIPTION),
+    fields: Optional[str] = Query(None, description="Comma-separated subset of fields to return"),
+    since: Optional[int] = Query(None, ge=0, description=SINCE_DESCRIPTION),
     db: Session = Depends(get_db)
 ):
     """Get all projects with optional filters"""
+    if since is not None:
+        return delta_response(db, Project, since, adapter_serializer(ProjectList))
+    selected = parse_fields(fields, PROJECT_FIELDS, always=("project_id",))
     query = db.query(Project)
     
+    if principal_investigator_id:
+        query = query.filter(Project.principal_investigator_id == principal_investigator_id)
+    if dept_id:
+        query = query.filter(Project.dept_id == dept_id)
+    if status:
+        query = query.filter(Project.status == status)
     if title:
-        query = query.filter(Project.title.ilike(f"%{title}%"))
+        query = query.filter(Project.project_title.ilike(f"%{title}%"))
     if is_active is not None:
-        query = query.filter(Project.is_active == is_active)
+        query = query.filter((Project.status == 'Active') if is_active else (Project.status != 'Active'))
+    query = query.filter(*project_date_criteria(active_on, overlaps))
     
-    projects = query.offset(skip).limit(limit).all()
-    return projects
+    query = query.offset(skip).limit(limit)
+    if selected:
+        return trusted_json_response(select_fields(query, Project, selected))
+    
+    projects = query.all()
+    return list_response(ProjectList, projects)
 
 
-@router.get("/active", response_model=List[ProjectSchema])
+@router.get("/active", response_model=List[ProjectSchema], dependencies=[conditional_get(Project)])
 def read_active_projects(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     db: Session = Depends(get_db)
 ):
     """Get all active projects"""
-    projects = db.query(Project).filter(Project.is_active == True).offset(skip).limit(limit).all()
-    return projects
+    projects = db.query(Project).filter(Project.status == 'Active').offset(skip).limit(limit).all()
+    return list_response(ProjectList, projects)
 
 
-@router.get("/by-department/{dept_id}", response_model=List[ProjectSchema])
+@router.get("/by-department/{dept_id}", response_model=List[ProjectSchema], dependencies=[conditional_get(Project)])
 def read_projects_by_department(
     dept_id: int,
     skip: int = Query(0, ge=0),
@@ -66,10 +131,10 @@ def read_projects_by_department(
 ):
     """Get projects by department"""
     projects = db.query(Project).filter(Project.dept_id == dept_id).offset(skip).limit(limit).all()
-    return projects
+    return list_response(ProjectList, projects)
 
 
-@router.get("/{project_id}", response_model=ProjectSchema)
+@router.get("/{project_id}", response_model=ProjectSchema, dependencies=[conditional_get(Project)])
 def read_project(project_id: int, db: Session = Depends(get_db)):
     """Get a specific project by ID"""
     db_project = db.query(Project).filter(Project.project_id == project_id).first()
@@ -78,6 +143,100 @@ def read_project(project_id: int, db: Session = Depends(get_db)):
     return db_project
 
 
+@router.get(
+    "/{project_id}/full",
+    dependencies=[conditional_get(
+        Project, Faculty, Department, ProjectCollaborator, StudentResearch, Student,
+        ProjectFunding, FundingSource, Publication, PublicationAuthor
+    )]
+)
+def read_project_full(project_id: int, db: Session = Depends(get_db)):
+    """Get a project with its PI, department, team, funding and publications"""
+    db_project = db.query(Project).options(
+        joinedload(Project.principal_investigator),
+        joinedload(Project.department),
+        selectinload(Project.collaborators).joinedload(ProjectCollaborator.faculty),
+        selectinload(Project.student_research).joinedload(StudentResearch.student),
+        selectinload(Project.funding).joinedload(ProjectFunding.funding_source),
+        selectinload(Project.publications).selectinload(Publication.authors).joinedload(PublicationAuthor.faculty)
+    ).filter(Project.project_id == project_id).first()
+    if db_project is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    
+    pi = db_project.principal_investigator
+    department = db_project.department
+    funding_total = sum(f.amount or 0 for f in db_project.funding)
+    
+    return trusted_json_response({
+        **project_summary(db_project, funding_total),
+        "principal_investigator": {
+            "faculty_id": pi.faculty_id,
+            "name": f"{pi.first_name} {pi.last_name}",
+            "position": pi.position,
+            "email": pi.email
+        } if pi else None,
+        "department": {
+            "dept_id": department.dept_id,
+            "dept_name": department.dept_name
+        } if department else None,
+        "collaborators": [
+            {
+                "faculty_id": c.faculty_id,
+                "name": f"{c.faculty.first_name} {c.faculty.last_name}" if c.faculty else None,
+                "position": c.faculty.position if c.faculty else None,
+                "role": c.role,
+                "involvement_percentage": c.involvement_percentage
+            }
+            for c in sorted(db_project.collaborators, key=lambda c: c.faculty_id)
+        ],
+        "students": [
+            {
+                "student_id": r.student_id,
+                "name": f"{r.student.first_name} {r.student.last_name}" if r.student else None,
+                "program_type": r.student.program_type if r.student else None,
+                "role": r.role,
+                "start_date": r.start_date,
+                "end_date": r.end_date
+            }
+            for r in sorted(db_project.student_research, key=lambda r: r.student_id)
+        ],
+        "funding": [
+            {
+                "funding_id": f.funding_id,
+                "source_name": f.funding_source.source_name if f.funding_source else None,
+                "source_type": f.funding_source.source_type if f.funding_source else None,
+                "amount": f.amount,
+                "start_date": f.start_date,
+                "end_date": f.end_date,
+                "grant_number": f.grant_number
+            }
+            for f in sorted(db_project.funding, key=lambda f: f.funding_id)
+        ],
+        "publications": [
+            publication_summary(pub)
+            for pub in sorted(db_project.publications, key=lambda p: p.publication_date, reverse=True)
+        ]
+    })
+
+
+def _require_existing(db: Session, model, ids, label: str) -> None:
+    missing = missing_ids(db, model, ids)
+    if missing:
+        raise HTTPException(status_code=404, detail=f"{label} not found: {', '.join(map(str, missing))}")
+
+
+def _members_by_id(members, key: str):
+    """Desired team members keyed by id, rejecting duplicates."""
+    desired = {}
+    for member in members:
+        values = member.model_dump()
+        member_id = values.pop(key)
+        if member_id in desired:
+            raise HTTPException(status_code=400, detail=f"Duplicate {key} {member_id}")
+        desired[member_id] = values
+    return desired
+
+
 @router.put("/{project_id}", response_model=ProjectSchema)
 def update_project(project_id: int, project: ProjectUpdate, db: Session = Depends(get_db)):
     """Update a project"""
@@ -90,32 +249,64 @@ def update_project(project_id: int, project: ProjectUpdate, db: Session = Depend
     for key, value in update_data.items():
         setattr(db_project, key, value)
     
-    # Update faculty members if provided
+    # Bare ids keep existing members' roles; new members get default ones
     if project.faculty_ids is not None:
-        db_project.faculty_members = []
-        if project.faculty_ids:
-            faculty_members = db.query(Faculty).filter(Faculty.faculty_id.in_(project.faculty_ids)).all()
-            db_project.faculty_members.extend(faculty_members)
+        _require_existing(db, Faculty, project.faculty_ids, "Faculty")
+        sync_members(
+            db, ProjectCollaborator, project_id, "faculty_id",
+            dict.fromkeys(project.faculty_ids, {}),
+            defaults={"role": "Collaborator"}
+        )
     
-    # Update students if provided
     if project.student_ids is not None:
-        db_project.students = []
-        if project.student_ids:
-            students = db.query(Student).filter(Student.student_id.in_(project.student_ids)).all()
-            db_project.students.extend(students)
+        _require_existing(db, Student, project.student_ids, "Student")
+        sync_members(
+            db, StudentResearch, project_id, "student_id",
+            dict.fromkeys(project.student_ids, {}),
+            defaults={"role": "Research Assistant", "start_date": date.today()}
+        )
     
     db.commit()
     db.refresh(db_project)
     return db_project
 
 
+@router.put("/{project_id}/team", response_model=ProjectTeamSync)
+def update_project_team(project_id: int, team: ProjectTeamUpdate, db: Session = Depends(get_db)):
+    """Replace a project's collaborators and student researchers in one transaction"""
+    if db.query(Project.project_id).filter(Project.project_id == project_id).first() is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    
+    result = {"project_id": project_id}
+    if team.collaborators is not None:
+        collaborators = _members_by_id(team.collaborators, "faculty_id")
+        _require_existing(db, Faculty, collaborators, "Faculty")
+        result["collaborators"] = sync_members(db, ProjectCollaborator, project_id, "faculty_id", collaborators)
+    
+    if team.students is not None:
+        students = _members_by_id(team.students, "student_id")
+        _require_existing(db, Student, students, "Student")
+        result["students"] = sync_members(db, StudentResearch, project_id, "student_id", students)
+    
+    db.commit()
+    return result
+
+
 @router.delete("/{project_id}", response_model=ProjectSchema)
-def delete_project(project_id: int, db: Session = Depends(get_db)):
-    """Delete a project"""
+def delete_project(
+    project_id: int,
+    dry_run: bool = Query(False, description="Report the rows that would be affected without deleting"),
+    db: Session = Depends(get_db)
+):
+    """Delete a project with its collaborators, student researchers and funding allocations"""
     db_project = db.query(Project).filter(Project.project_id == project_id).first()
     if db_project is None:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    db.delete(db_project)
+    if dry_run:
+        return trusted_json_response({"dry_run": True, **cascade_delete(db, PROJECT_CASCADE, [project_id], dry_run=True)})
+    
+    deleted = ProjectSchema.model_validate(db_project)
+    cascade_delete(db, PROJECT_CASCADE, [project_id])
     db.commit()
-    return db_project
+    return deleted
@@ -1,10 +1,15 @@
-from typing import List, Optional
+from typing import List, Optional, Set
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import func, extract
 from sqlalchemy.orm import Session, joinedload
 from pydantic import BaseModel
 
+from app.core.conditional import conditional_get
+from app.core.delta import SINCE_DESCRIPTION, delta_response
+from app.core.responses import trusted_json_response
+from app.core.selection import parse_fields
 from app.db.session import get_db
+from app.db.versioning import changed_keys
 from app.models.publications import Publication
 from app.models.faculty import Faculty
 from app.models.projects import Project
@@ -19,6 +24,12 @@ from app.schemas.publications import (
 
 router = APIRouter(prefix="/publications", tags=["publications"])
 
+# Fields selectable through ?fields= on the list endpoint
+PUBLICATION_FIELDS = (
+    "publication_id", "title", "publication_type", "journal_name", "publication_date",
+    "doi", "citation_count", "project_id", "project_title", "authors"
+)
+
 # Pydantic model for publication authors
 class PublicationAuthorCreate(BaseModel):
     publication_id: int
@@ -26,16 +37,98 @@ class PublicationAuthorCreate(BaseModel):
     author_order: int
     is_corresponding: str = "N"
 
-@router.get("", response_model=PaginatedPublications)
+def _publication_items(db: Session, query, selected, offset: int = 0, limit: Optional[int] = None):
+    """Serialize the publications matched by ``query`` with the ``selected`` fields"""
+    # Select only the requested columns; project_title and authors are joined in
+    columns = [getattr(Publication, f) for f in selected if f not in ("project_title", "authors")]
+    page_query = query.with_entities(*columns)
+    if "project_title" in selected:
+        page_query = page_query.add_columns(Project.project_title).outerjoin(
+            Project, Publication.project_id == Project.project_id
+        )
+    rows = page_query.order_by(Publication.publication_date.desc()).offset(offset).limit(limit).all()
+    results = [dict(row._mapping) for row in rows]
+    
+    if "authors" in selected and results:
+        # Authors for the whole page in one query
+        authors_by_publication = {pub["publication_id"]: [] for pub in results}
+        authors_query = db.query(
+            PublicationAuthor.publication_id,
+            Faculty.faculty_id,
+            Faculty.first_name,
+            Faculty.last_name,
+            PublicationAuthor.author_order,
+            PublicationAuthor.is_corresponding
+        ).join(
+            Faculty, Faculty.faculty_id == PublicationAuthor.faculty_id
+        ).filter(
+            PublicationAuthor.publication_id.in_(list(authors_by_publication))
+        ).order_by(
+            PublicationAuthor.publication_id, PublicationAuthor.author_order
+        )
+        
+        for author in authors_query.all():
+            authors_by_publication[author.publication_id].append({
+                "faculty_id": author.faculty_id,
+                "name": f"{author.first_name} {author.last_name}",
+                "author_order": author.author_order,
+                "is_corresponding": author.is_corresponding
+            })
+        
+        for pub in results:
+            pub["authors"] = authors_by_publication[pub["publication_id"]]
+    
+    return results
+
+
+def _publications_with_changed_relations(db: Session, selected, since: int, version: int) -> Set[int]:
+    """Publications whose embedded authors or project title changed between two versions"""
+    keys = set()
+    if "authors" in selected:
+        # Author rows are keyed "publication_id,faculty_id"
+        keys.update(
+            int(key.split(",")[0])
+            for key in changed_keys(db, PublicationAuthor.__tablename__, since, version)
+        )
+        renamed = [int(key) for key in changed_keys(db, Faculty.__tablename__, since, version)]
+        if renamed:
+            keys.update(
+                pub_id for pub_id, in db.query(PublicationAuthor.publication_id).filter(
+                    PublicationAuthor.faculty_id.in_(renamed)
+                )
+            )
+    if "project_title" in selected:
+        projects = [int(key) for key in changed_keys(db, Project.__tablename__, since, version)]
+        if projects:
+            keys.update(
+                pub_id for pub_id, in db.query(Publication.publication_id).filter(
+                    Publication.project_id.in_(projects)
+                )
+            )
+    return keys
+
+
+@router.get("", response_model=PaginatedPublications, dependencies=[conditional_get(Publication, PublicationAuthor, Project, Faculty)])
 def get_publications(
     search: Optional[str] = None,
     type: Optional[str] = None,
     year: Optional[int] = None,
+    faculty_id: Optional[int] = None,
+    project_id: Optional[int] = None,
     page: int = 1,
     limit: int = 10,
+    fields: Optional[str] = Query(None, description="Comma-separated subset of fields to return"),
+    since: Optional[int] = Query(None, ge=0, description=SINCE_DESCRIPTION),
     db: Session = Depends(get_db)
 ):
     """Get all publications with optional filtering and pagination"""
+    selected = parse_fields(fields, PUBLICATION_FIELDS, always=("publication_id",)) or PUBLICATION_FIELDS
+    if since is not None:
+        return delta_response(
+            db, Publication, since,
+            lambda changed: _publication_items(db, changed, selected),
+            lambda since, version: _publications_with_changed_relations(db, selected, since, version)
+        )
     query = db.query(Publication)
     
     # Apply filters
@@ -51,6 +144,14 @@ def get_publications(
     if year:
         query = query.filter(extract('year', Publication.publication_date) == year)
     
+    if faculty_id:
+        # Semi-join on the author index, so co-authored papers appear once
+        authored = db.query(PublicationAuthor.publication_id).filter(PublicationAuthor.faculty_id == faculty_id)
+        query = query.filter(Publication.publication_id.in_(authored))
+    
+    if project_id:
+        query = query.filter(Publication.project_id == project_id)
+    
     # Count total items
     total = query.count()
     
@@ -58,66 +159,15 @@ def get_publications(
     total_pages = (total + limit - 1) // limit
     offset = (page - 1) * limit
     
-    # Apply pagination and get results
-    publications = query.order_by(Publication.publication_date.desc()).offset(offset).limit(limit).all()
-    
-    # Fetch additional data
-    results = []
-    for pub in publications:
-        # Get author data using the new PublicationAuthor model
-        authors_query = db.query(
-            Faculty.faculty_id,
-            Faculty.first_name,
-            Faculty.last_name,
-            PublicationAuthor.author_order,
-            PublicationAuthor.is_corresponding
-        ).join(
-            PublicationAuthor, Faculty.faculty_id == PublicationAuthor.faculty_id
-        ).filter(
-            PublicationAuthor.publication_id == pub.publication_id
-        ).order_by(
-            PublicationAuthor.author_order
-        )
-        
-        authors = []
-        for author in authors_query.all():
-            authors.append({
-                "faculty_id": author.faculty_id,
-                "name": f"{author.first_name} {author.last_name}",
-                "author_order": author.author_order,
-                "is_corresponding": author.is_corresponding
-            })
-        
-        # Get project title if available
-        project_title = None
-        if pub.project_id:
-            project = db.query(Project.project_title).filter(Project.project_id == pub.project_id).first()
-            if project:
-                project_title = project.project_title
-        
-        # Construct publication data
-        pub_data = {
-            "publication_id": pub.publication_id,
-            "title": pub.title,
-            "publication_type": pub.publication_type,
-            "journal_name": pub.journal_name,
-            "publication_date": pub.publication_date,
-            "doi": pub.doi,
-            "citation_count": pub.citation_count,
-            "project_id": pub.project_id,
-            "project_title": project_title,
-            "authors": authors
-        }
-        
-        results.append(pub_data)
+    results = _publication_items(db, query, selected, offset, limit)
     
-    return PaginatedPublications(
-        items=results,
-        total=total,
-        page=page,
-        limit=limit,
-        total_pages=total_pages
-    )
+    return trusted_json_response({
+        "items": results,
+        "total": total,
+        "page": page,
+        "limit": limit,
+        "total_pages": total_pages
+    })
 
 
 @router.get("/{publication_id}", response_model=PublicationWithAuthors)
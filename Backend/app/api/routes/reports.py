@@ -1,8 +1,14 @@
-from typing import List, Dict, Any
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, desc, extract
-from sqlalchemy.orm import Session, joinedload
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request
+from sqlalchemy import Select, func, extract, select
+from sqlalchemy.orm import Session, contains_eager, joinedload, selectinload
 
+from app.core import config
+from app.core.export import EXPORT_FORMAT_DESCRIPTION, ExportFormat, export_response
+from app.core.files import ranged_file_response
+from app.core.jobs import Job, JobQueueFull, ReportJobManager
+from app.core.responses import trusted_json_response
+from app.db.loaders import publication_summary
 from app.db.session import get_db
 from app.models.departments import Department
 from app.models.faculty import Faculty
@@ -10,17 +16,13 @@ from app.models.students import Student
 from app.models.projects import Project
 from app.models.publications import Publication
 from app.models.publication_authors import PublicationAuthor
+from app.schemas.reports import ReportJob, ReportJobRequest
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
 
-@router.get("/faculty")
-def get_faculty_reports(
-    dept_id: int = None,
-    position: str = None,
-    db: Session = Depends(get_db)
-):
-    """Generate faculty reports with optional filters"""
+def _faculty_report(db: Session, dept_id: Optional[int] = None, position: Optional[str] = None) -> Dict[str, Any]:
+    """Faculty report with optional filters"""
     query = db.query(Faculty)
     
     if dept_id:
@@ -73,13 +75,18 @@ def get_faculty_reports(
     }
 
 
-@router.get("/projects")
-def get_project_reports(
+@router.get("/faculty")
+def get_faculty_reports(
     dept_id: int = None,
-    status: str = None,
+    position: str = None,
     db: Session = Depends(get_db)
 ):
-    """Generate project reports with optional filters"""
+    """Generate faculty reports with optional filters"""
+    return trusted_json_response(_faculty_report(db, dept_id, position))
+
+
+def _project_report(db: Session, dept_id: Optional[int] = None, status: Optional[str] = None) -> Dict[str, Any]:
+    """Project report with optional filters"""
     query = db.query(Project)
     
     if dept_id:
@@ -121,14 +128,78 @@ def get_project_reports(
     }
 
 
-@router.get("/publications")
-def get_publication_reports(
-    dept_id: int | None = None,
-    year: int | None = None,
-    publication_type: str | None = Query(None, alias="type"),
+@router.get("/projects")
+def get_project_reports(
+    dept_id: int = None,
+    status: str = None,
     db: Session = Depends(get_db)
 ):
-    """Generate publications report with optional filters.
+    """Generate project reports with optional filters"""
+    return trusted_json_response(_project_report(db, dept_id, status))
+
+
+def _publication_filters(dept_id: int | None, year: int | None, publication_type: str | None) -> List[Any]:
+    """Criteria shared by the publications report and its export (projects outer-joined)"""
+    criteria = []
+    if dept_id:
+        criteria.append(Project.dept_id == dept_id)
+    if year:
+        criteria.append(extract('year', Publication.publication_date) == year)
+    if publication_type:
+        criteria.append(Publication.publication_type == publication_type)
+    return criteria
+
+
+def _publication_rows(dept_id: int | None, year: int | None, publication_type: str | None) -> Select:
+    """One flat row per publication, for columnar and spreadsheet exports"""
+    # Author names in author order, one row per publication. SQLite leaves the
+    # order of a grouped group_concat undefined, but a window aggregate adds
+    # rows in its ORDER BY order
+    by_publication = dict(
+        partition_by=PublicationAuthor.publication_id,
+        order_by=PublicationAuthor.author_order,
+        rows=(None, None)
+    )
+    authors = select(
+        PublicationAuthor.publication_id,
+        func.group_concat(Faculty.first_name + " " + Faculty.last_name, "; ").over(**by_publication).label("authors"),
+        func.count().over(**by_publication).label("author_count")
+    ).join(
+        Faculty, Faculty.faculty_id == PublicationAuthor.faculty_id
+    ).distinct().subquery()
+
+    return select(
+        Publication.publication_id,
+        Publication.title,
+        Publication.publication_type,
+        Publication.journal_name,
+        Publication.publication_date,
+        Publication.doi,
+        Publication.citation_count,
+        Publication.project_id,
+        Project.project_title,
+        Project.dept_id.label("department_id"),
+        Department.dept_name.label("department_name"),
+        authors.c.authors,
+        func.coalesce(authors.c.author_count, 0).label("author_count")
+    ).outerjoin(
+        Project, Publication.project_id == Project.project_id
+    ).outerjoin(
+        Department, Department.dept_id == Project.dept_id
+    ).outerjoin(
+        authors, authors.c.publication_id == Publication.publication_id
+    ).where(
+        *_publication_filters(dept_id, year, publication_type)
+    ).order_by(Publication.publication_date.desc(), Publication.publication_id)
+
+
+def _publication_report(
+    db: Session,
+    dept_id: int | None = None,
+    year: int | None = None,
+    publication_type: str | None = None
+) -> Dict[str, Any]:
+    """Publications report with optional filters.
 
     Filters:
     - dept_id: Filter publications by department via linked project department
@@ -136,147 +207,76 @@ def get_publication_reports(
     - type: Filter by publication type (Journal Article, Conference Paper, etc.)
     """
 
-    # Base query: publications, optionally joined to projects for department filtering
-    pub_query = db.query(Publication).outerjoin(Project, Publication.project_id == Project.project_id)
-
-    if dept_id:
-        pub_query = pub_query.filter(Project.dept_id == dept_id)
-    if year:
-        pub_query = pub_query.filter(extract('year', Publication.publication_date) == year)
-    if publication_type:
-        pub_query = pub_query.filter(Publication.publication_type == publication_type)
-
-    publications = pub_query.order_by(Publication.publication_date.desc()).all()
+    # One scan of the filtered publications: projects and departments are joined in,
+    # authors (with their faculty and departments) arrive in one batched query
+    publications = db.query(Publication).outerjoin(
+        Publication.project
+    ).options(
+        contains_eager(Publication.project).joinedload(Project.department),
+        selectinload(Publication.authors).joinedload(PublicationAuthor.faculty).joinedload(Faculty.department)
+    ).filter(
+        *_publication_filters(dept_id, year, publication_type)
+    ).order_by(Publication.publication_date.desc()).all()
 
-    # Build publications list with authors and project/department info
+    # Every summary facet is accumulated from the same rows
     publications_data: List[Dict[str, Any]] = []
     total_citations = 0
+    by_type: Dict[str, int] = {}
+    by_year: Dict[int, int] = {}
+    authors_seen: Dict[int, Dict[str, Any]] = {}
+    departments_seen: Dict[int, Dict[str, Any]] = {}
 
     for pub in publications:
-        total_citations += pub.citation_count or 0
-
-        # Authors ordered by author_order
-        authors_rows = db.query(
-            Faculty.faculty_id,
-            Faculty.first_name,
-            Faculty.last_name,
-            PublicationAuthor.author_order,
-            PublicationAuthor.is_corresponding
-        ).join(
-            PublicationAuthor, Faculty.faculty_id == PublicationAuthor.faculty_id
-        ).filter(
-            PublicationAuthor.publication_id == pub.publication_id
-        ).order_by(
-            PublicationAuthor.author_order
-        ).all()
-
-        authors = [
-            {
-                "faculty_id": row.faculty_id,
-                "name": f"{row.first_name} {row.last_name}",
-                "author_order": row.author_order,
-                "is_corresponding": row.is_corresponding,
-            }
-            for row in authors_rows
-        ]
-
-        dept_name = None
-        dept_id_value = None
-        project_title = None
-        if pub.project_id:
-            proj = db.query(Project).filter(Project.project_id == pub.project_id).first()
-            if proj:
-                project_title = proj.project_title
-                dept_id_value = proj.dept_id
-                dept = db.query(Department).filter(Department.dept_id == proj.dept_id).first()
-                if dept:
-                    dept_name = dept.dept_name
-
-        publications_data.append(
-            {
-                "publication_id": pub.publication_id,
-                "title": pub.title,
-                "publication_type": pub.publication_type,
-                "journal_name": pub.journal_name,
-                "publication_date": pub.publication_date,
-                "doi": pub.doi,
-                "citation_count": pub.citation_count,
-                "project_id": pub.project_id,
-                "project_title": project_title,
-                "department_id": dept_id_value,
-                "department_name": dept_name,
-                "authors": authors,
-            }
-        )
-
-    # Summary
-    total_publications = len(publications_data)
-
-    # Publications by type
-    by_type_rows = pub_query.with_entities(
-        Publication.publication_type, func.count(Publication.publication_id)
-    ).group_by(Publication.publication_type).all()
-    by_type: Dict[str, int] = {t: c for t, c in by_type_rows}
-
-    # Publications by year
-    by_year_rows = pub_query.with_entities(
-        extract('year', Publication.publication_date).label('year'),
-        func.count(Publication.publication_id)
-    ).group_by(extract('year', Publication.publication_date)).order_by(extract('year', Publication.publication_date)).all()
-    by_year: Dict[int, int] = {int(y): c for y, c in by_year_rows if y is not None}
-
-    # Top authors (by number of publications and citations) within the filtered set
-    author_base = db.query(
-        PublicationAuthor.faculty_id,
-        func.count(PublicationAuthor.publication_id).label("pub_count"),
-        func.coalesce(func.sum(Publication.citation_count), 0).label("citations")
-    ).join(
-        Publication, Publication.publication_id == PublicationAuthor.publication_id
-    ).outerjoin(
-        Project, Publication.project_id == Project.project_id
-    )
-
-    if dept_id:
-        author_base = author_base.filter(Project.dept_id == dept_id)
-    if year:
-        author_base = author_base.filter(extract('year', Publication.publication_date) == year)
-    if publication_type:
-        author_base = author_base.filter(Publication.publication_type == publication_type)
+        citations = pub.citation_count or 0
+        total_citations += citations
+        by_type[pub.publication_type] = by_type.get(pub.publication_type, 0) + 1
+        if pub.publication_date:
+            by_year[pub.publication_date.year] = by_year.get(pub.publication_date.year, 0) + 1
 
-    author_rows = author_base.group_by(PublicationAuthor.faculty_id).order_by(desc("pub_count")).limit(10).all()
+        project = pub.project
+        department = project.department if project else None
+        if department:
+            dept_totals = departments_seen.setdefault(
+                department.dept_id,
+                {"department_name": department.dept_name, "publication_count": 0, "total_citations": 0}
+            )
+            dept_totals["publication_count"] += 1
+            dept_totals["total_citations"] += citations
 
-    top_authors: List[Dict[str, Any]] = []
-    for row in author_rows:
-        fac = db.query(Faculty).filter(Faculty.faculty_id == row.faculty_id).first()
-        if fac:
-            top_authors.append(
+        for author in pub.authors:
+            faculty = author.faculty
+            if faculty is None:
+                continue
+            author_totals = authors_seen.setdefault(
+                faculty.faculty_id,
                 {
-                    "faculty_id": fac.faculty_id,
-                    "name": f"{fac.first_name} {fac.last_name}",
-                    "department_id": fac.dept_id,
-                    "department_name": db.query(Department.dept_name).filter(Department.dept_id == fac.dept_id).scalar(),
-                    "publications": row.pub_count,
-                    "citations": int(row.citations or 0),
+                    "faculty_id": faculty.faculty_id,
+                    "name": f"{faculty.first_name} {faculty.last_name}",
+                    "department_id": faculty.dept_id,
+                    "department_name": faculty.department.dept_name if faculty.department else None,
+                    "publications": 0,
+                    "citations": 0,
                 }
             )
+            author_totals["publications"] += 1
+            author_totals["citations"] += citations
+
+        summary = publication_summary(pub)
+        summary.update(
+            project_title=project.project_title if project else None,
+            department_id=project.dept_id if project else None,
+            department_name=department.dept_name if department else None
+        )
+        publications_data.append(summary)
+
+    total_publications = len(publications_data)
+    by_year = dict(sorted(by_year.items()))
+
+    # Top authors (by number of publications) within the filtered set
+    top_authors = sorted(authors_seen.values(), key=lambda a: (-a["publications"], a["faculty_id"]))[:10]
 
     # Publications by department (only when not filtering to a single department)
-    by_department: Dict[int, Dict[str, Any]] | None = None
-    if not dept_id:
-        dept_rows = db.query(
-            Project.dept_id,
-            func.count(Publication.publication_id),
-            func.coalesce(func.sum(Publication.citation_count), 0)
-        ).join(Project, Publication.project_id == Project.project_id).group_by(Project.dept_id).all()
-
-        by_department = {}
-        for d_id, count, cites in dept_rows:
-            name = db.query(Department.dept_name).filter(Department.dept_id == d_id).scalar()
-            by_department[d_id] = {
-                "department_name": name,
-                "publication_count": count,
-                "total_citations": int(cites or 0),
-            }
+    by_department = None if dept_id else dict(sorted(departments_seen.items()))
 
     return {
         "filters": {
@@ -294,3 +294,92 @@ def get_publication_reports(
         "by_department": by_department,
         "publications": publications_data,
     }
+
+
+@router.get("/publications")
+def get_publication_reports(
+    dept_id: int | None = None,
+    year: int | None = None,
+    publication_type: str | None = Query(None, alias="type"),
+    export_format: Optional[ExportFormat] = Query(None, alias="format", description=EXPORT_FORMAT_DESCRIPTION),
+    db: Session = Depends(get_db)
+):
+    """Generate publications report with optional filters"""
+    if export_format:
+        return export_response(_publication_rows(dept_id, year, publication_type), export_format, "publications")
+    return trusted_json_response(_publication_report(db, dept_id, year, publication_type))
+
+
+# Report builders available as background jobs, with the models each one reads
+REPORT_JOB_BUILDERS = {
+    "faculty": (_faculty_report, (Faculty, Department, Student)),
+    "projects": (_project_report, (Project,)),
+    "publications": (_publication_report, (Publication, PublicationAuthor, Project, Faculty, Department)),
+}
+
+report_jobs = ReportJobManager(
+    results_dir=config.REPORT_RESULTS_DIR,
+    workers=config.REPORT_JOB_WORKERS,
+    max_pending=config.REPORT_JOB_MAX_PENDING,
+    max_age=config.REPORT_RESULTS_MAX_AGE_SECONDS
+)
+
+
+def _job_status(request: Request, job: Job, cached: bool = False) -> Dict[str, Any]:
+    return {
+        "job_id": job.job_id,
+        "report": job.report,
+        "status": job.status,
+        "progress": job.progress,
+        "cached": cached,
+        "error": job.error,
+        "created_at": job.created_at,
+        "finished_at": job.finished_at,
+        "result_url": str(request.url_for("download_report_job", job_id=job.job_id)) if job.status == "completed" else None
+    }
+
+
+@router.post("/jobs", response_model=ReportJob, status_code=202)
+def submit_report_job(
+    request: Request,
+    job: ReportJobRequest = Body(...),
+    db: Session = Depends(get_db)
+):
+    """Queue a report to be built in the background; identical requests on unchanged data reuse the same job"""
+    build, models = REPORT_JOB_BUILDERS[job.report]
+    params = job.model_dump(exclude={"report"})
+    try:
+        submitted, cached = report_jobs.submit(
+            db, job.report, params, build, [model.__tablename__ for model in models]
+        )
+    except JobQueueFull:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many report jobs in progress, try again later",
+            headers={"Retry-After": "5"}
+        )
+    status_code = 200 if submitted.status == "completed" else 202
+    return trusted_json_response(_job_status(request, submitted, cached), status_code=status_code)
+
+
+@router.get("/jobs/{job_id}", response_model=ReportJob)
+def read_report_job(job_id: str, request: Request):
+    """Get the status and progress of a report job"""
+    job = report_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Report job not found")
+    return trusted_json_response(_job_status(request, job))
+
+
+@router.get("/jobs/{job_id}/result", name="download_report_job")
+def download_report_job(job_id: str, request: Request):
+    """Download a completed report; supports HTTP Range requests"""
+    job = report_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Report job not found")
+    if job.status != "completed":
+        raise HTTPException(status_code=409, detail=f"Report job is {job.status}")
+    try:
+        return ranged_file_response(request, job.path, "application/json", filename=f"{job_id}.json")
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Report result has expired")
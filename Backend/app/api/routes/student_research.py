@@ -1,9 +1,10 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from datetime import date, datetime
 
+from app.core.pagination import paginate_keyset, parse_sort, set_next_cursor
 from app.db.session import get_db
 from app.models.student_research import StudentResearch
 from app.models.projects import Project
@@ -11,6 +12,16 @@ from app.models.students import Student
 
 router = APIRouter(prefix="/student-research", tags=["student-research"])
 
+# Allowed values for the ``sort`` parameter (prefix with "-" for descending)
+STUDENT_RESEARCH_SORT_COLUMNS = {
+    "student_id": [StudentResearch.student_id],
+    "project_id": [StudentResearch.project_id],
+    "start_date": [StudentResearch.start_date],
+    "role": [StudentResearch.role],
+    "project_title": [Project.project_title],
+    "student_name": [Student.last_name, Student.first_name],
+}
+
 # Pydantic model for JSON requests
 class StudentResearchCreate(BaseModel):
     student_id: int
@@ -22,38 +33,63 @@ class StudentResearchCreate(BaseModel):
 
 @router.get("/", response_model=List[dict])
 def get_student_research(
+    response: Response,
     student_id: int = None,
     project_id: int = None,
+    sort: str = "student_id",
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    """Get student research participation with optional filters"""
-    query = db.query(StudentResearch)
+    """Get student research participation with optional filters.
+
+    Results are keyset-paginated: when more rows are available the cursor for
+    the next page is returned in the ``X-Next-Cursor`` response header.
+    """
+    sort_columns, descending = parse_sort(sort, STUDENT_RESEARCH_SORT_COLUMNS)
+
+    query = db.query(
+        StudentResearch.student_id,
+        StudentResearch.project_id,
+        StudentResearch.start_date,
+        StudentResearch.end_date,
+        StudentResearch.role,
+        Project.project_title,
+        Student.first_name,
+        Student.last_name
+    ).join(
+        Project, StudentResearch.project_id == Project.project_id
+    ).join(
+        Student, StudentResearch.student_id == Student.student_id
+    )
     
     if student_id:
         query = query.filter(StudentResearch.student_id == student_id)
     if project_id:
         query = query.filter(StudentResearch.project_id == project_id)
     
-    participations = query.all()
-    
-    result = []
-    for participation in participations:
-        # Get project and student details
-        project = db.query(Project).filter(Project.project_id == participation.project_id).first()
-        student = db.query(Student).filter(Student.student_id == participation.student_id).first()
-        
-        if project and student:
-            result.append({
-                "student_id": participation.student_id,
-                "student_name": f"{student.first_name} {student.last_name}",
-                "project_id": participation.project_id,
-                "project_title": project.project_title,
-                "start_date": participation.start_date,
-                "end_date": participation.end_date,
-                "role": participation.role
-            })
-    
-    return result
+    rows, next_cursor = paginate_keyset(
+        query,
+        sort_columns,
+        [StudentResearch.student_id, StudentResearch.project_id],
+        descending,
+        limit,
+        cursor
+    )
+    set_next_cursor(response, next_cursor)
+    
+    return [
+        {
+            "student_id": row.student_id,
+            "student_name": f"{row.first_name} {row.last_name}",
+            "project_id": row.project_id,
+            "project_title": row.project_title,
+            "start_date": row.start_date,
+            "end_date": row.end_date,
+            "role": row.role
+        }
+        for row in rows
+    ]
 
 
 @router.post("/")
@@ -1,14 +1,39 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from app.core.config import BATCH_CHUNK_SIZE
+from app.core.responses import list_response, trusted_json_response
+from app.core.conditional import conditional_get
+from app.core.delta import SINCE_DESCRIPTION, adapter_serializer, delta_response
+from app.core.selection import parse_fields, parse_sections, select_fields
+from app.db.batch import BatchSpec, run_batch
+from app.db.loaders import funding_by_source_type, load_projects, load_publications, project_summary
 from app.db.session import get_db
+from app.models.departments import Department
+from app.models.funding import FundingSource, ProjectFunding
+from app.models.projects import Project
+from app.models.publication_authors import PublicationAuthor
+from app.models.publications import Publication
+from app.models.student_research import StudentResearch
 from app.models.students import Student
 from app.models.faculty import Faculty
-from app.schemas.students import StudentCreate, StudentUpdate, Student as StudentSchema
+from app.schemas.batch import BatchRequest, BatchResponse
+from app.schemas.students import StudentCreate, StudentUpdate, Student as StudentSchema, StudentList
 
 router = APIRouter(prefix="/students", tags=["students"])
 
+# Fields selectable through ?fields= on list endpoints
+STUDENT_FIELDS = tuple(StudentSchema.model_fields)
+
+STUDENT_BATCH = BatchSpec(
+    model=Student,
+    create_schema=StudentCreate,
+    update_schema=StudentUpdate,
+    label="Student",
+    foreign_keys={"dept_id": Department, "advisor_id": Faculty}
+)
+
 
 @router.post("/", response_model=StudentSchema)
 def create_student(student: StudentCreate, db: Session = Depends(get_db)):
@@ -20,7 +45,17 @@ def create_student(student: StudentCreate, db: Session = Depends(get_db)):
     return db_student
 
 
-@router.get("/", response_model=List[StudentSchema])
+@router.post("/batch", response_model=BatchResponse)
+def batch_students(batch: BatchRequest, db: Session = Depends(get_db)):
+    """Create, update and delete students in one request"""
+    result = run_batch(db, STUDENT_BATCH, batch.operations, batch.atomic, BATCH_CHUNK_SIZE)
+    if result["failed"]:
+        # Atomic batches applied nothing; others applied everything that succeeded
+        return trusted_json_response(result, status_code=400 if batch.atomic else 207)
+    return result
+
+
+@router.get("/", response_model=List[StudentSchema], dependencies=[conditional_get(Student)])
 def read_students(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
@@ -28,9 +63,14 @@ def read_students(
     program_type: Optional[str] = None,
     advisor_id: Optional[int] = None,
     name: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated subset of fields to return"),
+    since: Optional[int] = Query(None, ge=0, description=SINCE_DESCRIPTION),
     db: Session = Depends(get_db)
 ):
     """Get all students with optional filters"""
+    if since is not None:
+        return delta_response(db, Student, since, adapter_serializer(StudentList))
+    selected = parse_fields(fields, STUDENT_FIELDS, always=("student_id",))
     query = db.query(Student)
     
     if dept_id:
@@ -43,10 +83,14 @@ def read_students(
         query = query.filter((Student.first_name.ilike(f"%{name}%")) | 
                             (Student.last_name.ilike(f"%{name}%")))
     
-    students = query.offset(skip).limit(limit).all()
-    return students
+    query = query.offset(skip).limit(limit)
+    if selected:
+        return trusted_json_response(select_fields(query, Student, selected))
+    
+    students = query.all()
+    return list_response(StudentList, students)
 
-@router.get("/by-advisor/{advisor_id}", response_model=List[StudentSchema])
+@router.get("/by-advisor/{advisor_id}", response_model=List[StudentSchema], dependencies=[conditional_get(Student, Faculty)])
 def get_students_by_advisor(
     advisor_id: int,
     skip: int = Query(0, ge=0),
@@ -60,10 +104,10 @@ def get_students_by_advisor(
         raise HTTPException(status_code=404, detail="Faculty advisor not found")
         
     students = db.query(Student).filter(Student.advisor_id == advisor_id).offset(skip).limit(limit).all()
-    return students
+    return list_response(StudentList, students)
 
 
-@router.get("/{student_id}", response_model=StudentSchema)
+@router.get("/{student_id}", response_model=StudentSchema, dependencies=[conditional_get(Student)])
 def read_student(student_id: int, db: Session = Depends(get_db)):
     """Get a specific student by ID"""
     db_student = db.query(Student).filter(Student.student_id == student_id).first()
@@ -72,6 +116,83 @@ def read_student(student_id: int, db: Session = Depends(get_db)):
     return db_student
 
 
+STUDENT_PORTFOLIO_SECTIONS = ("department", "advisor", "projects", "publications", "funding")
+
+
+@router.get(
+    "/{student_id}/portfolio",
+    dependencies=[conditional_get(
+        Student, Department, Faculty, Project, StudentResearch,
+        Publication, PublicationAuthor, ProjectFunding, FundingSource
+    )]
+)
+def read_student_portfolio(
+    student_id: int,
+    sections: Optional[str] = Query(None, description=f"Comma-separated subset of: {', '.join(STUDENT_PORTFOLIO_SECTIONS)}"),
+    db: Session = Depends(get_db)
+):
+    """Get a student's department, advisor, research projects, publications and funding"""
+    selected = parse_sections(sections, STUDENT_PORTFOLIO_SECTIONS)
+
+    db_student = db.query(Student).options(
+        joinedload(Student.department),
+        joinedload(Student.advisor)
+    ).filter(Student.student_id == student_id).first()
+    if db_student is None:
+        raise HTTPException(status_code=404, detail="Student not found")
+
+    portfolio = {"student": StudentSchema.model_validate(db_student)}
+
+    if "department" in selected:
+        department = db_student.department
+        portfolio["department"] = {
+            "dept_id": department.dept_id,
+            "dept_name": department.dept_name,
+            "research_focus": department.research_focus
+        } if department else None
+
+    if "advisor" in selected:
+        advisor = db_student.advisor
+        portfolio["advisor"] = {
+            "faculty_id": advisor.faculty_id,
+            "name": f"{advisor.first_name} {advisor.last_name}",
+            "position": advisor.position,
+            "email": advisor.email
+        } if advisor else None
+
+    if {"projects", "publications", "funding"} & set(selected):
+        participation = load_projects(
+            db,
+            StudentResearch.student_id == student_id,
+            extra_columns=(StudentResearch.role, StudentResearch.start_date, StudentResearch.end_date),
+            joins=((StudentResearch, StudentResearch.project_id == Project.project_id),)
+        )
+        project_ids = [p.project_id for p, *_ in participation]
+
+        if "projects" in selected:
+            portfolio["projects"] = [
+                {
+                    **project_summary(p, total),
+                    "role": role,
+                    "research_start_date": start_date,
+                    "research_end_date": end_date
+                }
+                for p, total, role, start_date, end_date in participation
+            ]
+
+        if "publications" in selected:
+            portfolio["publications"] = load_publications(db, Publication.project_id.in_(project_ids)) if project_ids else []
+
+        if "funding" in selected:
+            portfolio["funding"] = {
+                "project_budget": sum(p.budget or 0 for p, *_ in participation),
+                "project_funding": sum(total or 0 for _, total, *_ in participation),
+                "by_source_type": funding_by_source_type(db, project_ids)
+            }
+
+    return trusted_json_response(portfolio)
+
+
 @router.put("/{student_id}", response_model=StudentSchema)
 def update_student(student_id: int, student: StudentUpdate, db: Session = Depends(get_db)):
     """Update a student"""
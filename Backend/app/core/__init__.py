@@ -1,6 +1,7 @@
 # core package init file
 from .auth import (
     verify_password,
+    verify_and_update_password,
     get_password_hash,
     create_access_token,
     verify_token,
@@ -13,6 +14,7 @@ from .auth import (
 
 __all__ = [
     "verify_password",
+    "verify_and_update_password",
     "get_password_hash", 
     "create_access_token",
     "verify_token",
@@ -0,0 +1,139 @@
+"""Admission control: per-route-class concurrency limits (bulkheads).
+
+Expensive endpoints (reports, analytics, batch writes) each get a fixed
+number of concurrent slots and a short wait queue. Requests beyond both are
+rejected straight away with ``503`` and ``Retry-After`` instead of piling
+up in the shared threadpool, so cheap endpoints keep their threads and stay
+fast while a class is overloaded. Requests that match no class are never
+limited.
+"""
+import asyncio
+import json
+import re
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class Bulkhead:
+    """At most ``limit`` concurrent requests, plus ``queue_size`` waiting for a slot.
+
+    Waiters are admitted in arrival order. Both counters live on the event
+    loop, so no locking is needed.
+    """
+
+    def __init__(self, name: str, pattern: str, limit: int, queue_size: int, queue_timeout: float, retry_after: int):
+        self.name = name
+        self.pattern = re.compile(pattern)
+        self.limit = limit
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+
+        self.active = 0
+        self.admitted = 0
+        self.shed = 0
+        self.timed_out = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    def matches(self, path: str) -> bool:
+        return self.pattern.match(path) is not None
+
+    async def acquire(self) -> bool:
+        """Take a slot, waiting in the queue if needed; ``False`` if shed."""
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            self.admitted += 1
+            return True
+        if len(self._waiters) >= self.queue_size:
+            self.shed += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except asyncio.TimeoutError:
+            # Since Python 3.12 the wait can time out after a slot was handed
+            # over; the slot is then ours and must not leak
+            if not waiter.done() or waiter.cancelled():
+                self.timed_out += 1
+                self.shed += 1
+                return False
+        except asyncio.CancelledError:
+            # The client went away; pass on a slot handed over at the last moment
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+        self.admitted += 1
+        return True
+
+    def release(self) -> None:
+        """Free a slot, handing it straight to the next waiter if there is one."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "queue_size": self.queue_size,
+            "active": self.active,
+            "waiting": len(self._waiters),
+            "admitted": self.admitted,
+            "shed": self.shed,
+            "timed_out": self.timed_out
+        }
+
+
+class AdmissionControlMiddleware:
+    """Run each request that matches a bulkhead inside one of its slots.
+
+    Slots are held until the response body has been sent, so streamed
+    exports count against their class for as long as they run.
+    """
+
+    def __init__(self, app: ASGIApp, bulkheads: Iterable[Bulkhead]):
+        self.app = app
+        self.bulkheads = list(bulkheads)
+
+    def _bulkhead(self, path: str) -> Optional[Bulkhead]:
+        for bulkhead in self.bulkheads:
+            if bulkhead.matches(path):
+                return bulkhead
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        bulkhead = self._bulkhead(scope["path"]) if scope["type"] == "http" else None
+        if bulkhead is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await bulkhead.acquire():
+            await _send_busy(send, bulkhead)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            bulkhead.release()
+
+
+async def _send_busy(send: Send, bulkhead: Bulkhead) -> None:
+    body = json.dumps({"detail": f"Too many concurrent {bulkhead.name} requests, try again later"}).encode()
+    await send({
+        "type": "http.response.start",
+        "status": 503,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", str(bulkhead.retry_after).encode()),
+        ]
+    })
+    await send({"type": "http.response.body", "body": body})
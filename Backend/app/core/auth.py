@@ -1,10 +1,11 @@
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
+from app.core import config
 from app.db.session import get_db
 from app.models.auth import User
 
@@ -13,8 +14,53 @@ SECRET_KEY = "your-secret-key-here-change-in-production"  # Change this in produ
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing schemes that can verify stored hashes, newest first
+KNOWN_HASH_SCHEMES = ("argon2", "bcrypt")
+
+
+def argon2_available() -> bool:
+    """Whether the optional argon2-cffi backend is installed."""
+    try:
+        import argon2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def build_password_context(
+    scheme: str = config.PASSWORD_HASH_SCHEME,
+    bcrypt_rounds: int = config.PASSWORD_BCRYPT_ROUNDS,
+    argon2_memory_kib: int = config.PASSWORD_ARGON2_MEMORY_KIB,
+    argon2_time_cost: int = config.PASSWORD_ARGON2_TIME_COST,
+    argon2_parallelism: int = config.PASSWORD_ARGON2_PARALLELISM,
+) -> CryptContext:
+    """Password context hashing with ``scheme`` at the given cost.
+
+    Hashes made with another known scheme, or with different cost
+    parameters, still verify but are reported by ``needs_update`` so they
+    can be replaced on the next successful login.
+    """
+    if scheme not in KNOWN_HASH_SCHEMES:
+        raise ValueError(f"Unknown password hash scheme '{scheme}'. Allowed: {', '.join(KNOWN_HASH_SCHEMES)}")
+    schemes = [s for s in KNOWN_HASH_SCHEMES if s != "argon2" or argon2_available()]
+    if scheme not in schemes:
+        print(f"⚠️ argon2-cffi is not installed; hashing passwords with bcrypt instead of {scheme}")
+        scheme = "bcrypt"
+    return CryptContext(
+        schemes=[scheme] + [s for s in schemes if s != scheme],
+        default=scheme,
+        deprecated="auto",
+        # Equal min/max rounds make hashes at any other cost count as outdated
+        bcrypt__rounds=bcrypt_rounds,
+        bcrypt__min_rounds=bcrypt_rounds,
+        bcrypt__max_rounds=bcrypt_rounds,
+        argon2__memory_cost=argon2_memory_kib,
+        argon2__time_cost=argon2_time_cost,
+        argon2__parallelism=argon2_parallelism,
+    )
+
+
+pwd_context = build_password_context()
 
 # JWT token bearer
 security = HTTPBearer()
@@ -27,6 +73,14 @@ def get_password_hash(password: str) -> str:
     """Hash a password."""
     return pwd_context.hash(password)
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Verify a password and, if its hash is outdated, return a replacement hash.
+
+    Returns ``(verified, new_hash)``; ``new_hash`` is ``None`` unless the
+    password verified and the stored hash uses an old scheme or cost.
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -0,0 +1,212 @@
+"""Live aggregate snapshots pushed to Server-Sent Events subscribers.
+
+One background task per process recomputes a snapshot when its source tables
+change and fans the difference out to every subscriber, so an update costs
+the same whether one dashboard or hundreds are connected, and idle
+connections cost only a queue. Writes committed in this process wake the
+task immediately; writes from other workers are noticed by polling the
+table versions. Bursts of writes are coalesced into at most one update per
+``interval``.
+"""
+import asyncio
+import json
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional, Set
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.db.session import SessionLocal
+from app.db.versioning import add_commit_listener, get_table_versions
+
+
+class UnrepresentablePatch(ValueError):
+    """The change sets a value to null, which a merge patch cannot express."""
+
+
+def _check_no_nulls(value: Any) -> None:
+    # Applying a patch object drops its null members, so none may be sent
+    if isinstance(value, dict):
+        for member in value.values():
+            if member is None:
+                raise UnrepresentablePatch()
+            _check_no_nulls(member)
+
+
+def merge_patch(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON merge patch (RFC 7396) turning ``old`` into ``new``.
+
+    Nested objects are diffed key by key, lists are replaced whole and
+    removed keys are sent as ``null``. In a merge patch ``null`` always means
+    "remove", so ``UnrepresentablePatch`` is raised when ``new`` has a
+    ``None`` value where ``old`` did not.
+    """
+    patch = {key: None for key in old.keys() - new.keys()}
+    for key, value in new.items():
+        if key in old and old[key] == value:
+            continue
+        if value is None:
+            raise UnrepresentablePatch()
+        if isinstance(value, dict) and isinstance(old.get(key), dict):
+            patch[key] = merge_patch(old[key], value)
+        else:
+            _check_no_nulls(value)
+            patch[key] = value
+    return patch
+
+
+def format_event(event: str, data: Any, event_id: Optional[int] = None) -> bytes:
+    """Encode one Server-Sent Event with a compact JSON payload."""
+    lines = [f"event: {event}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append("data: " + json.dumps(data, separators=(",", ":")))
+    return ("\n".join(lines) + "\n\n").encode()
+
+
+class _Subscription:
+    def __init__(self, queue_size: int):
+        self.queue: "asyncio.Queue[bytes]" = asyncio.Queue(queue_size)
+        # Set when the queue overflowed; the client is sent a fresh snapshot
+        self.resync = False
+
+
+class SnapshotBroadcaster:
+    """Keep a snapshot of ``compute(db)`` current and stream changes to it.
+
+    Subscribers first receive a ``snapshot`` event with the full payload,
+    then ``patch`` events holding merge patches against the previous state.
+    """
+
+    def __init__(
+        self,
+        compute: Callable[[Session], Dict[str, Any]],
+        tables: Iterable[str],
+        interval: float,
+        poll_interval: float,
+        heartbeat: float,
+        queue_size: int,
+    ):
+        self.compute = compute
+        self.tables = frozenset(tables)
+        self.interval = interval
+        self.poll_interval = poll_interval
+        self.heartbeat = heartbeat
+        self.queue_size = queue_size
+
+        self.snapshot: Optional[Dict[str, Any]] = None
+        self.sequence = 0
+        self._versions = None
+        self._subscribers: Set[_Subscription] = set()
+        self._lock = asyncio.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+        add_commit_listener(self._on_commit)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def _on_commit(self, tables: Set[str]) -> None:
+        """Wake the refresh task; called from whichever thread committed."""
+        loop, wake = self._loop, self._wake
+        if loop is None or wake is None or not (tables & self.tables):
+            return
+        try:
+            loop.call_soon_threadsafe(wake.set)
+        except RuntimeError:
+            # The loop has already shut down
+            pass
+
+    def _load(self, known_versions) -> tuple:
+        """Read the table versions and, if they moved, recompute the snapshot."""
+        db = SessionLocal()
+        try:
+            versions = {name: version for name, (version, _) in get_table_versions(db, self.tables).items()}
+            if versions == known_versions:
+                return versions, None
+            return versions, jsonable_encoder(self.compute(db))
+        finally:
+            db.close()
+
+    async def _refresh(self) -> None:
+        async with self._lock:
+            versions, snapshot = await run_in_threadpool(self._load, self._versions)
+            if snapshot is None:
+                return
+            previous, self.snapshot, self._versions = self.snapshot, snapshot, versions
+            if previous is None:
+                self.sequence += 1
+                return
+            try:
+                patch = merge_patch(previous, snapshot)
+            except UnrepresentablePatch:
+                # Resend everything rather than a patch that would drop the null
+                self.sequence += 1
+                self._publish(format_event("snapshot", snapshot, self.sequence))
+                return
+            if not patch:
+                return
+            self.sequence += 1
+            self._publish(format_event("patch", patch, self.sequence))
+
+    def _publish(self, message: bytes) -> None:
+        for subscription in list(self._subscribers):
+            try:
+                subscription.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                subscription.resync = True
+
+    async def _run(self) -> None:
+        try:
+            while self._subscribers:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+                try:
+                    await self._refresh()
+                except Exception as e:
+                    print(f"❌ Error refreshing live snapshot: {e}")
+                # Writes arriving meanwhile only set the wake flag again
+                await asyncio.sleep(self.interval)
+        finally:
+            self._task = None
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        """Events for one subscriber, until the client disconnects."""
+        subscription = _Subscription(self.queue_size)
+        self._subscribers.add(subscription)
+        try:
+            stale = self.snapshot is None
+            if self._task is None:
+                # Nobody was listening, so the snapshot may be out of date
+                self._loop = asyncio.get_running_loop()
+                self._wake = asyncio.Event()
+                self._task = asyncio.create_task(self._run())
+                stale = True
+            if stale:
+                await self._refresh()
+
+            yield f"retry: {int(self.poll_interval * 1000)}\n".encode() + format_event(
+                "snapshot", self.snapshot, self.sequence
+            )
+            while True:
+                try:
+                    message = await asyncio.wait_for(subscription.queue.get(), self.heartbeat)
+                except asyncio.TimeoutError:
+                    # Comment line so proxies keep the idle connection open
+                    yield b": keep-alive\n\n"
+                    continue
+                if subscription.resync:
+                    subscription.resync = False
+                    while not subscription.queue.empty():
+                        subscription.queue.get_nowait()
+                    yield format_event("snapshot", self.snapshot, self.sequence)
+                    continue
+                yield message
+        finally:
+            self._subscribers.discard(subscription)
@@ -0,0 +1,184 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.compression import choose_encoding, compress_body, is_compressible
+
+
+class CachedResponse:
+    """A cached response body plus its compressed variants.
+
+    Each encoding is produced at most once, on first request, and reused for
+    every later client that accepts it.
+    """
+
+    def __init__(self, status: int, headers: List[Tuple[bytes, bytes]], body: bytes, expires_at: float):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.expires_at = expires_at
+        self._encoded: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def encoded(self, encoding: str, level: int) -> bytes:
+        with self._lock:
+            if encoding not in self._encoded:
+                self._encoded[encoding] = compress_body(self.body, encoding, level)
+            return self._encoded[encoding]
+
+
+class ResponseCache:
+    """Small in-process LRU cache of complete responses with a TTL."""
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, status: int, headers: List[Tuple[bytes, bytes]], body: bytes) -> CachedResponse:
+        entry = CachedResponse(status, headers, body, time.monotonic() + self.ttl)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class ResponseCacheMiddleware:
+    """Serve repeated GETs of expensive, public endpoints from memory.
+
+    Only successful, unauthenticated GET responses under ``path_prefixes``
+    (and not under ``excluded_prefixes``) are cached. Hits are sent
+    precompressed (``Content-Encoding`` already set), so the outer
+    ``CompressionMiddleware`` passes them through instead of recompressing
+    the same payload for every viewer.
+
+    ``version()``, when given, is called (in the threadpool) before every
+    lookup and becomes part of the key, so a write anywhere, including in
+    another worker, makes older entries unreachable instead of being served
+    until their TTL runs out.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        cache: ResponseCache,
+        path_prefixes: Sequence[str],
+        excluded_prefixes: Sequence[str] = (),
+        minimum_size: int = 1024,
+        compression_level: int = 9,
+        version: Optional[Callable[[], Any]] = None,
+    ):
+        self.app = app
+        self.cache = cache
+        self.path_prefixes = tuple(path_prefixes)
+        self.excluded_prefixes = tuple(excluded_prefixes)
+        self.minimum_size = minimum_size
+        self.compression_level = compression_level
+        self.version = version
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not scope["path"].startswith(self.path_prefixes)
+            or (self.excluded_prefixes and scope["path"].startswith(self.excluded_prefixes))
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        if "authorization" in request_headers:
+            await self.app(scope, receive, send)
+            return
+
+        key = cache_key(scope)
+        if self.version is not None:
+            key += f"#{await run_in_threadpool(self.version)}"
+        encoding = choose_encoding(request_headers.get("accept-encoding", ""))
+
+        entry = self.cache.get(key)
+        if entry is None:
+            entry = await self._capture(scope, receive, send, key)
+            if entry is None:
+                return
+
+        await self._send_entry(entry, encoding, send)
+
+    async def _capture(self, scope: Scope, receive: Receive, send: Send, key: str) -> Optional[CachedResponse]:
+        """Run the route, caching its response when it is cacheable.
+
+        Returns the new cache entry, or ``None`` if the response was not
+        cacheable and has already been sent downstream.
+        """
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+        cacheable = True
+
+        async def capture_send(message: Message) -> None:
+            nonlocal start, cacheable
+            if message["type"] == "http.response.start":
+                start = message
+                headers = Headers(raw=message["headers"])
+                cacheable = (
+                    message["status"] == 200
+                    and "content-encoding" not in headers
+                    # Streamed bodies (event streams, file exports) have no
+                    # length and may never finish, so they are not buffered
+                    and "content-length" in headers
+                )
+                if not cacheable:
+                    await send(message)
+                return
+            if not cacheable:
+                await send(message)
+                return
+            chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, capture_send)
+
+        if not cacheable or start is None:
+            return None
+        return self.cache.set(key, start["status"], list(start["headers"]), b"".join(chunks))
+
+    async def _send_entry(self, entry: CachedResponse, encoding: Optional[str], send: Send) -> None:
+        headers = MutableHeaders(raw=list(entry.headers))
+        body = entry.body
+        if len(body) >= self.minimum_size and is_compressible(headers.get("content-type", "")):
+            headers.add_vary_header("Accept-Encoding")
+            if encoding:
+                body = entry.encoded(encoding, self.compression_level)
+                headers["Content-Encoding"] = encoding
+        headers["Content-Length"] = str(len(body))
+
+        await send({"type": "http.response.start", "status": entry.status, "headers": headers.raw})
+        await send({"type": "http.response.body", "body": body})
+
+
+def cache_key(scope: Scope) -> str:
+    """Cache key for a request: path plus normalised query string."""
+    query = scope.get("query_string", b"").decode("latin-1")
+    params = "&".join(sorted(p for p in query.split("&") if p))
+    return f"{scope['path']}?{params}"
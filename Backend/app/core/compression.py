@@ -0,0 +1,202 @@
+import zlib
+from typing import List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+# Content types worth compressing; everything else is passed through untouched
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "text/",
+)
+
+# Event streams must be flushed immediately, so they are never buffered
+UNCOMPRESSED_TYPES = ("text/event-stream",)
+
+
+def supported_encodings() -> List[str]:
+    """Encodings this server can produce, in order of preference."""
+    return ["br", "gzip"] if brotli else ["gzip"]
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the best supported encoding from an ``Accept-Encoding`` header."""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if token:
+            accepted[token.lower()] = quality
+
+    for encoding in supported_encodings():
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > 0:
+            return encoding
+    return None
+
+
+def is_compressible(content_type: str) -> bool:
+    """Whether a response with this content type should be compressed."""
+    content_type = content_type.lower()
+    if content_type.startswith(UNCOMPRESSED_TYPES):
+        return False
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def compress_body(body: bytes, encoding: str, level: int) -> bytes:
+    """Compress a complete body in one call."""
+    if encoding == "br":
+        return brotli.compress(body, quality=level)
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(body) + compressor.flush()
+
+
+class _StreamCompressor:
+    """Incremental compressor that flushes after every chunk."""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.flush()
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class CompressionMiddleware:
+    """Compress responses with brotli (when installed) or gzip.
+
+    Bodies are buffered only until ``minimum_size`` bytes have been produced,
+    so small responses are sent as-is and streamed responses are compressed
+    chunk by chunk. Responses that already carry a ``Content-Encoding`` (for
+    example precompressed cache hits) or that support byte ranges are passed
+    through.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.downstream = send
+        self.start_message: Optional[Message] = None
+        self.passthrough = False
+        self.compressor: Optional[_StreamCompressor] = None
+        self.pending: List[bytes] = []
+        self.pending_size = 0
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self.start_message = message
+            self.passthrough = (
+                "content-encoding" in headers
+                or message["status"] in (204, 206, 304)
+                # Byte ranges refer to the stored bytes, so ranged files stay identity-encoded
+                or "accept-ranges" in headers
+                or not is_compressible(headers.get("content-type", ""))
+            )
+            if self.passthrough:
+                await self.downstream(message)
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.downstream(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None:
+            self.pending.append(body)
+            self.pending_size += len(body)
+            if self.pending_size < self.middleware.minimum_size:
+                if more_body:
+                    return
+                # Whole response is below the threshold: send it unchanged
+                await self.downstream(self.start_message)
+                await self.downstream({"type": "http.response.body", "body": b"".join(self.pending)})
+                return
+
+            self.compressor = _StreamCompressor(
+                self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality
+            )
+            body = b"".join(self.pending)
+            self.pending = []
+            await self._start(more_body)
+
+        data = self.compressor.compress(body)
+        if more_body:
+            if data:
+                await self.downstream({"type": "http.response.body", "body": data, "more_body": True})
+            return
+
+        if self.start_message is not None:
+            # Single-shot body: the compressed length is known, so send it
+            data += self.compressor.finish()
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            headers["Content-Length"] = str(len(data))
+            await self.downstream(self.start_message)
+            self.start_message = None
+            await self.downstream({"type": "http.response.body", "body": data})
+            return
+
+        await self.downstream({"type": "http.response.body", "body": data + self.compressor.finish()})
+
+    async def _start(self, more_body: bool) -> None:
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if "content-length" in headers:
+            del headers["Content-Length"]
+        if more_body:
+            # Streaming: headers go out now, without a length
+            await self.downstream(self.start_message)
+            self.start_message = None
@@ -0,0 +1,119 @@
+import hashlib
+from datetime import timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+
+from fastapi import Depends, Request
+from fastapi.responses import Response
+from sqlalchemy.orm import Session
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.db.session import get_db
+from app.db.versioning import get_change_version, get_table_versions
+
+# Key in ``request.state`` holding the validators for the current response
+_STATE_KEY = "conditional_headers"
+
+
+class NotModified(Exception):
+    """Raised by ``conditional_get`` when the client's cached copy is current."""
+
+    def __init__(self, headers: Dict[str, str]):
+        self.headers = headers
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison: W/"x" and "x" match
+    bare = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == bare for tag in if_none_match.split(","))
+
+
+def _not_modified_since(if_modified_since: str, last_modified) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return last_modified.replace(microsecond=0) <= since
+
+
+def conditional_get(*models):
+    """Dependency adding ``ETag``/``Last-Modified`` derived from table versions.
+
+    ``models`` are the ORM classes whose tables the endpoint reads. If the
+    request's ``If-None-Match`` (or ``If-Modified-Since``) shows the client
+    already has the current representation, ``NotModified`` is raised before
+    the endpoint runs, so its query is never executed. Use as
+    ``dependencies=[conditional_get(Department)]``.
+    """
+    tables = sorted(model.__tablename__ for model in models)
+
+    def check(request: Request, db: Session = Depends(get_db)) -> None:
+        versions = get_table_versions(db, tables)
+        fingerprint = ";".join(
+            f"{name}:{versions[name][0] if name in versions else 0}" for name in tables
+        )
+        # Include the query string so filtered views of a table differ
+        fingerprint += f"|{request.url.path}?{request.url.query}"
+        etag = 'W/"' + hashlib.sha1(fingerprint.encode()).hexdigest()[:20] + '"'
+
+        # Latest change version, for clients syncing lists with ?since=
+        headers = {"ETag": etag, "Cache-Control": "no-cache", "X-Change-Version": str(get_change_version(db))}
+        timestamps = [updated_at for _, updated_at in versions.values() if updated_at is not None]
+        last_modified = None
+        if timestamps:
+            last_modified = max(
+                ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc) for ts in timestamps
+            )
+            headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            if _etag_matches(if_none_match, etag):
+                raise NotModified(headers)
+        elif last_modified is not None:
+            if_modified_since = request.headers.get("if-modified-since")
+            if if_modified_since and _not_modified_since(if_modified_since, last_modified):
+                raise NotModified(headers)
+
+        setattr(request.state, _STATE_KEY, headers)
+
+    return Depends(check)
+
+
+async def not_modified_handler(request: Request, exc: NotModified) -> Response:
+    """Exception handler turning ``NotModified`` into an empty 304 response."""
+    return Response(status_code=304, headers=exc.headers)
+
+
+class ConditionalHeadersMiddleware:
+    """Attach validators computed by ``conditional_get`` to successful responses.
+
+    Routes frequently return ``Response`` objects directly (see
+    ``app.core.responses``), which bypass headers set on an injected
+    ``Response``, so the headers are applied here instead.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_validators(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                validators: Optional[Dict[str, str]] = scope.get("state", {}).get(_STATE_KEY)
+                if validators:
+                    headers = MutableHeaders(raw=message["headers"])
+                    for name, value in validators.items():
+                        if name not in headers:
+                            headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_validators)
@@ -0,0 +1,124 @@
+import os
+
+
+def env_bool(name: str, default: bool) -> bool:
+    """Read a boolean setting from the environment."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment."""
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def env_float(name: str, default: float) -> float:
+    """Read a float setting from the environment."""
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+# Serialization
+# Render every route's JSON with orjson (when installed) instead of the standard
+# library encoder; routes returning trusted_json_response use orjson regardless
+FAST_JSON_RESPONSES = env_bool("FAST_JSON_RESPONSES", False)
+
+# Compression
+# Responses smaller than this many bytes are sent uncompressed
+COMPRESSION_MINIMUM_SIZE = env_int("COMPRESSION_MINIMUM_SIZE", 1024)
+COMPRESSION_GZIP_LEVEL = env_int("COMPRESSION_GZIP_LEVEL", 6)
+COMPRESSION_BROTLI_QUALITY = env_int("COMPRESSION_BROTLI_QUALITY", 4)
+
+# Response cache for public dashboard and report endpoints
+RESPONSE_CACHE_TTL_SECONDS = env_float("RESPONSE_CACHE_TTL_SECONDS", 30.0)
+RESPONSE_CACHE_MAX_ENTRIES = env_int("RESPONSE_CACHE_MAX_ENTRIES", 256)
+RESPONSE_CACHE_PATHS = ("/api/analytics/", "/api/reports/")
+# Never cached: job status changes between polls and results are served from disk
+RESPONSE_CACHE_EXCLUDED_PATHS = ("/api/reports/jobs",)
+# Cached bodies are compressed once, so they can afford a higher level
+RESPONSE_CACHE_COMPRESSION_LEVEL = env_int("RESPONSE_CACHE_COMPRESSION_LEVEL", 9)
+
+# Batch create/update/delete endpoints
+BATCH_MAX_OPERATIONS = env_int("BATCH_MAX_OPERATIONS", 5000)
+# Non-atomic batches commit once per chunk of this many operations
+BATCH_CHUNK_SIZE = env_int("BATCH_CHUNK_SIZE", 500)
+
+# Live dashboard updates (/api/analytics/stream)
+# At most one update is pushed per interval, however many writes land in it
+ANALYTICS_STREAM_INTERVAL_SECONDS = env_float("ANALYTICS_STREAM_INTERVAL_SECONDS", 2.0)
+# How often table versions are checked for writes made by other workers
+ANALYTICS_STREAM_POLL_SECONDS = env_float("ANALYTICS_STREAM_POLL_SECONDS", 10.0)
+ANALYTICS_STREAM_HEARTBEAT_SECONDS = env_float("ANALYTICS_STREAM_HEARTBEAT_SECONDS", 15.0)
+# Pending updates per subscriber before it is resent a full snapshot instead
+ANALYTICS_STREAM_QUEUE_SIZE = env_int("ANALYTICS_STREAM_QUEUE_SIZE", 16)
+
+# Pivot snapshots (/api/analytics/pivot) are rebuilt at once after local writes;
+# writes by other workers are picked up at most this many seconds later
+ANALYTICS_PIVOT_REFRESH_SECONDS = env_float("ANALYTICS_PIVOT_REFRESH_SECONDS", 60.0)
+
+# Date-range indexes behind ?active_on= and ?overlaps= on project and funding lists;
+# rebuilt at once after local writes, within this many seconds of other workers' writes
+INTERVAL_INDEX_REFRESH_SECONDS = env_float("INTERVAL_INDEX_REFRESH_SECONDS", 60.0)
+# Ranges matching more rows than this are filtered in SQL instead of by a primary-key list
+INTERVAL_INDEX_MAX_KEYS = env_int("INTERVAL_INDEX_MAX_KEYS", 500)
+
+# Asynchronous report jobs (/api/reports/jobs)
+REPORT_JOB_WORKERS = env_int("REPORT_JOB_WORKERS", 2)
+# Jobs queued or running at once before submissions are refused with 503
+REPORT_JOB_MAX_PENDING = env_int("REPORT_JOB_MAX_PENDING", 32)
+REPORT_RESULTS_DIR = os.getenv("REPORT_RESULTS_DIR", "report_results")
+# Finished jobs and their result files are removed after this long
+REPORT_RESULTS_MAX_AGE_SECONDS = env_float("REPORT_RESULTS_MAX_AGE_SECONDS", 86400.0)
+
+# Arrow, Parquet and XLSX exports (?format= on report datasets)
+# Rows fetched from the cursor and encoded per batch (and per Parquet row group)
+EXPORT_BATCH_SIZE = env_int("EXPORT_BATCH_SIZE", 10000)
+# Set to an empty string to disable; Arrow IPC falls back to uncompressed if the codec is unavailable
+EXPORT_ARROW_COMPRESSION = os.getenv("EXPORT_ARROW_COMPRESSION", "zstd")
+EXPORT_PARQUET_COMPRESSION = os.getenv("EXPORT_PARQUET_COMPRESSION", "zstd") or "none"
+
+# Admission control: concurrency limits (bulkheads) for expensive route classes
+ADMISSION_CONTROL = env_bool("ADMISSION_CONTROL", True)
+# How long a queued request waits for a slot before it is shed
+ADMISSION_QUEUE_TIMEOUT_SECONDS = env_float("ADMISSION_QUEUE_TIMEOUT_SECONDS", 10.0)
+ADMISSION_RETRY_AFTER_SECONDS = env_int("ADMISSION_RETRY_AFTER_SECONDS", 5)
+ADMISSION_REPORTS_LIMIT = env_int("ADMISSION_REPORTS_LIMIT", 4)
+ADMISSION_REPORTS_QUEUE = env_int("ADMISSION_REPORTS_QUEUE", 8)
+ADMISSION_ANALYTICS_LIMIT = env_int("ADMISSION_ANALYTICS_LIMIT", 4)
+ADMISSION_ANALYTICS_QUEUE = env_int("ADMISSION_ANALYTICS_QUEUE", 16)
+ADMISSION_BATCH_LIMIT = env_int("ADMISSION_BATCH_LIMIT", 2)
+ADMISSION_BATCH_QUEUE = env_int("ADMISSION_BATCH_QUEUE", 4)
+# (class, path pattern, concurrent requests, queue size); report jobs and the
+# dashboard stream are excluded, as they hold no request thread while they run
+ADMISSION_CLASSES = (
+    ("reports", r"/api/reports/(?!jobs)", ADMISSION_REPORTS_LIMIT, ADMISSION_REPORTS_QUEUE),
+    ("analytics", r"/api/analytics/(?!stream)", ADMISSION_ANALYTICS_LIMIT, ADMISSION_ANALYTICS_QUEUE),
+    ("batch", r"/api/[\w-]+/batch$", ADMISSION_BATCH_LIMIT, ADMISSION_BATCH_QUEUE),
+)
+
+# Token-bucket rate limiting (per user, or per IP address for anonymous clients)
+RATE_LIMIT_ENABLED = env_bool("RATE_LIMIT_ENABLED", True)
+# "memory" (per worker) or "redis" (shared; needs the redis package)
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")
+RATE_LIMIT_REDIS_URL = os.getenv("RATE_LIMIT_REDIS_URL", "redis://localhost:6379/0")
+# Only enable behind a proxy that sets X-Forwarded-For; clients can forge it otherwise
+RATE_LIMIT_TRUST_FORWARDED_FOR = env_bool("RATE_LIMIT_TRUST_FORWARDED_FOR", False)
+# Each policy allows a burst, then refills at the given rate
+RATE_LIMIT_AUTH_BURST = env_int("RATE_LIMIT_AUTH_BURST", 5)
+RATE_LIMIT_AUTH_PER_MINUTE = env_float("RATE_LIMIT_AUTH_PER_MINUTE", 10.0)
+RATE_LIMIT_REPORTS_BURST = env_int("RATE_LIMIT_REPORTS_BURST", 10)
+RATE_LIMIT_REPORTS_PER_MINUTE = env_float("RATE_LIMIT_REPORTS_PER_MINUTE", 30.0)
+RATE_LIMIT_BULK_BURST = env_int("RATE_LIMIT_BULK_BURST", 5)
+RATE_LIMIT_BULK_PER_MINUTE = env_float("RATE_LIMIT_BULK_PER_MINUTE", 20.0)
+
+# Password hashing (see benchmark_password_hashing.py for choosing costs)
+# "bcrypt", or "argon2" when argon2-cffi is installed; hashes made with the
+# other scheme or a different cost are rehashed on the next successful login
+PASSWORD_HASH_SCHEME = os.getenv("PASSWORD_HASH_SCHEME", "bcrypt")
+PASSWORD_BCRYPT_ROUNDS = env_int("PASSWORD_BCRYPT_ROUNDS", 12)
+PASSWORD_ARGON2_MEMORY_KIB = env_int("PASSWORD_ARGON2_MEMORY_KIB", 65536)
+PASSWORD_ARGON2_TIME_COST = env_int("PASSWORD_ARGON2_TIME_COST", 3)
+PASSWORD_ARGON2_PARALLELISM = env_int("PASSWORD_ARGON2_PARALLELISM", 4)
@@ -0,0 +1,57 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from fastapi import HTTPException
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+from sqlalchemy import inspect
+from sqlalchemy.orm import Query, Session
+
+from app.core.responses import trusted_json_response
+from app.db.versioning import changed_keys, get_change_version
+
+SINCE_DESCRIPTION = "Return only rows changed or deleted after this change version (see X-Change-Version)"
+
+
+def adapter_serializer(adapter: TypeAdapter) -> Callable[[Query], List[Dict[str, Any]]]:
+    """Serialize a query's ORM rows through a precompiled list ``TypeAdapter``."""
+    def serialize(query: Query) -> List[Dict[str, Any]]:
+        return adapter.dump_python(adapter.validate_python(query.all(), from_attributes=True))
+    return serialize
+
+
+def delta_response(
+    db: Session,
+    model,
+    since: int,
+    serialize: Callable[[Query], List[Dict[str, Any]]],
+    related: Optional[Callable[[int, int], Iterable[int]]] = None
+) -> Response:
+    """Rows of ``model`` written after change version ``since``.
+
+    ``changed`` holds the current state of rows inserted or updated since
+    then, serialized by ``serialize`` from a query over them; ``deleted``
+    holds the keys of rows that no longer exist. ``version`` is the value
+    to pass as ``since`` next time. Filters and pagination do not apply.
+
+    Items that embed data from other tables pass ``related``, which returns
+    the keys of rows whose embedded data changed between two versions.
+    """
+    version = get_change_version(db)
+    if since > version:
+        raise HTTPException(
+            status_code=410,
+            detail=f"Change version {since} is ahead of the server ({version}); refetch the full list"
+        )
+
+    pk = inspect(model).primary_key[0]
+    keys = {int(key) for key in changed_keys(db, model.__tablename__, since, version)}
+    if related is not None:
+        keys.update(related(since, version))
+    changed = serialize(db.query(model).filter(pk.in_(keys)).order_by(pk)) if keys else []
+    present = {item[pk.key] for item in changed}
+    return trusted_json_response({
+        "since": since,
+        "version": version,
+        "changed": changed,
+        "deleted": sorted(keys - present)
+    })
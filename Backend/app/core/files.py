@@ -0,0 +1,97 @@
+"""File downloads with HTTP Range support.
+
+Starlette's ``FileResponse`` streams whole files (with sendfile where the
+server supports it) but ignores ``Range``. Full downloads are still handed
+to it; single byte ranges are served here so interrupted downloads of
+large results can resume.
+"""
+import os
+import re
+from typing import Optional, Tuple
+
+import anyio
+from fastapi import Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+_CHUNK_SIZE = 64 * 1024
+
+_BYTE_RANGE = re.compile(r"(\d*)-(\d*)")
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Resolve a single ``bytes=`` range to inclusive offsets.
+
+    Returns ``None`` for anything not understood (multiple ranges, other
+    units, malformed values), in which case the whole file is sent. Raises
+    ``ValueError`` when the range is well-formed but outside the file.
+    """
+    unit, _, spec = header.partition("=")
+    match = _BYTE_RANGE.fullmatch(spec.strip())
+    if unit.strip().lower() != "bytes" or match is None:
+        return None
+    first, last = match.groups()
+    if not first:
+        if not last:
+            return None
+        # Suffix range: the last N bytes
+        if int(last) == 0:
+            raise ValueError("empty suffix range")
+        return max(size - int(last), 0), size - 1
+    start = int(first)
+    end = int(last) if last else None
+    if end is not None and end < start:
+        return None
+    if start >= size:
+        raise ValueError("range starts past the end of the file")
+    if end is None:
+        end = size - 1
+    return start, min(end, size - 1)
+
+
+async def _read_range(path: str, start: int, end: int):
+    async with await anyio.open_file(path, "rb") as f:
+        await f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = await f.read(min(_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def ranged_file_response(request: Request, path: str, media_type: str, filename: Optional[str] = None) -> Response:
+    """Serve ``path`` in full, or the single byte range the client asked for."""
+    stat_result = os.stat(path)
+    response = FileResponse(
+        path, media_type=media_type, filename=filename,
+        headers={"Accept-Ranges": "bytes"}, stat_result=stat_result
+    )
+    range_header = request.headers.get("range")
+    if not range_header:
+        return response
+
+    # If-Range: only honour the range if the client's copy is still current
+    if_range = request.headers.get("if-range")
+    if if_range is not None and if_range.strip() != response.headers["etag"]:
+        return response
+
+    size = stat_result.st_size
+    try:
+        byte_range = _parse_range(range_header, size)
+    except ValueError:
+        return Response(status_code=416, headers={"Content-Range": f"bytes */{size}"})
+    if byte_range is None:
+        return response
+
+    start, end = byte_range
+    headers = {
+        key: value for key, value in response.headers.items()
+        if key in ("etag", "last-modified", "content-disposition")
+    }
+    headers.update({
+        "Accept-Ranges": "bytes",
+        "Content-Range": f"bytes {start}-{end}/{size}",
+        "Content-Length": str(end - start + 1)
+    })
+    return StreamingResponse(_read_range(path, start, end), status_code=206, media_type=media_type, headers=headers)
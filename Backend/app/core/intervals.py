@@ -0,0 +1,56 @@
+"""In-memory index of date intervals for "active on" and "overlaps" queries.
+
+Intervals are closed (``start <= day <= end``); a missing end means the
+interval is still open. They are kept sorted by start, so a query first
+binary-searches the intervals starting no later than the end of the range
+and then checks all of their ends in a single vectorised comparison.
+"""
+from datetime import date
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+from fastapi import HTTPException
+
+# Stands in for the end of open intervals
+_OPEN_END = np.datetime64("9999-12-31", "D")
+
+OVERLAPS_DESCRIPTION = "Only rows whose date range overlaps this one, as 'start,end' (e.g. 2023-01-01,2023-06-30)"
+
+
+class IntervalIndex:
+    """``keys`` with their ``[start, end]`` date ranges."""
+
+    def __init__(self, keys: Sequence[Any], starts: Sequence[date], ends: Sequence[Optional[date]]):
+        starts = np.asarray(starts, dtype="datetime64[D]")
+        ends = np.asarray(ends, dtype="datetime64[D]")
+        order = np.argsort(starts, kind="stable")
+        self._keys = [keys[i] for i in order]
+        self._starts = starts[order]
+        self._ends = np.where(np.isnat(ends), _OPEN_END, ends)[order]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def overlapping(self, first: date, last: date) -> List[Any]:
+        """Keys of the intervals sharing at least one day with ``[first, last]``."""
+        candidates = np.searchsorted(self._starts, np.datetime64(last, "D"), side="right")
+        hits = np.flatnonzero(self._ends[:candidates] >= np.datetime64(first, "D"))
+        return [self._keys[i] for i in hits]
+
+    def active_on(self, day: date) -> List[Any]:
+        """Keys of the intervals that include ``day``."""
+        return self.overlapping(day, day)
+
+
+def parse_date_range(value: str) -> Tuple[date, date]:
+    """Resolve an ``overlaps`` parameter such as ``2023-01-01,2023-06-30``."""
+    try:
+        first, last = (date.fromisoformat(part.strip()) for part in value.split(","))
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid date range '{value}'. Expected 'start,end' as ISO dates"
+        )
+    if last < first:
+        raise HTTPException(status_code=400, detail=f"Invalid date range '{value}': end is before start")
+    return first, last
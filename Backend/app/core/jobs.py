@@ -0,0 +1,199 @@
+"""Background report jobs with results cached on disk.
+
+Reports are built on a bounded thread pool instead of in the request. A
+job's id is derived from its parameters and the versions of the tables the
+report reads, so submitting the same report while the data is unchanged
+returns the existing job and its file instead of building it again. Any
+write to those tables produces a new id, so stale results are never reused
+and need no explicit invalidation. Result files are named after the job id,
+which lets every worker process find results built by the others.
+"""
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.responses import FastJSONResponse
+from app.db.session import SessionLocal
+from app.db.versioning import get_table_versions
+
+_JOB_ID = re.compile(r"[a-z]+-[0-9a-f]{32}")
+
+# Minimum time between scans of the results directory for expired files
+_PRUNE_INTERVAL_SECONDS = 60.0
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class JobQueueFull(Exception):
+    """Raised by ``submit`` when ``max_pending`` jobs are already queued or running."""
+
+
+@dataclass
+class Job:
+    job_id: str
+    report: str
+    params: Dict[str, Any]
+    path: str
+    status: str = "queued"
+    progress: float = 0.0
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=_now)
+    finished_at: Optional[datetime] = None
+
+    @property
+    def pending(self) -> bool:
+        return self.status in ("queued", "running")
+
+
+class ReportJobManager:
+    """Run report builders in the background and keep their results on disk."""
+
+    def __init__(self, results_dir: str, workers: int, max_pending: int, max_age: float):
+        self.results_dir = results_dir
+        self.max_pending = max_pending
+        self.max_age = max_age
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="report-job")
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._last_prune = 0.0
+
+    def job_id(self, db: Session, report: str, params: Dict[str, Any], tables: Iterable[str]) -> str:
+        """Id for ``report`` built with ``params`` against the current data."""
+        tables = sorted(tables)
+        versions = get_table_versions(db, tables)
+        fingerprint = json.dumps({
+            "report": report,
+            "params": params,
+            "versions": {name: versions[name][0] if name in versions else 0 for name in tables}
+        }, sort_keys=True, default=str)
+        return f"{report}-{hashlib.sha256(fingerprint.encode()).hexdigest()[:32]}"
+
+    def _path(self, job_id: str) -> str:
+        return os.path.join(self.results_dir, f"{job_id}.json")
+
+    def submit(
+        self,
+        db: Session,
+        report: str,
+        params: Dict[str, Any],
+        build: Callable[..., Any],
+        tables: Iterable[str],
+    ) -> Tuple[Job, bool]:
+        """Start ``build(db, **params)`` unless an identical job already exists.
+
+        Returns the job and whether it was reused. Raises ``JobQueueFull``
+        when a new job would exceed ``max_pending``.
+        """
+        self.prune()
+        job_id = self.job_id(db, report, params, tables)
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and job.status != "failed":
+                return job, True
+            existing = self._from_disk(job_id)
+            if existing is not None:
+                self._jobs[job_id] = existing
+                return existing, True
+            if sum(1 for j in self._jobs.values() if j.pending) >= self.max_pending:
+                raise JobQueueFull()
+            job = Job(job_id, report, params, self._path(job_id))
+            self._jobs[job_id] = job
+        self._executor.submit(self._run, job, build)
+        return job, False
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """The job with ``job_id``, including ones finished by another process."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                job = self._from_disk(job_id)
+                if job is not None:
+                    self._jobs[job_id] = job
+            return job
+
+    def _from_disk(self, job_id: str) -> Optional[Job]:
+        """A completed job for a result file built earlier, if there is one."""
+        if not _JOB_ID.fullmatch(job_id):
+            return None
+        path = self._path(job_id)
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return None
+        finished = datetime.fromtimestamp(mtime, timezone.utc)
+        return Job(
+            job_id, job_id.partition("-")[0], {}, path,
+            status="completed", progress=1.0, created_at=finished, finished_at=finished
+        )
+
+    def _run(self, job: Job, build: Callable[..., Any]) -> None:
+        job.status = "running"
+        job.progress = 0.1
+        db = SessionLocal()
+        tmp_path = None
+        try:
+            content = build(db, **job.params)
+            job.progress = 0.8
+            body = FastJSONResponse(content).body
+            os.makedirs(self.results_dir, exist_ok=True)
+            # Write under a temporary name so readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.results_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(body)
+            os.replace(tmp_path, job.path)
+            tmp_path = None
+        except Exception as e:
+            print(f"❌ Report job {job.job_id} failed: {e}")
+            job.error = str(e)
+            job.status = "failed"
+        else:
+            job.progress = 1.0
+            job.status = "completed"
+        finally:
+            db.close()
+            job.finished_at = _now()
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    def prune(self) -> None:
+        """Forget finished jobs and delete result files older than ``max_age``."""
+        now = time.time()
+        if now - self._last_prune < _PRUNE_INTERVAL_SECONDS:
+            return
+        self._last_prune = now
+        cutoff = now - self.max_age
+
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job.finished_at is not None and job.finished_at.timestamp() < cutoff
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+        try:
+            entries = list(os.scandir(self.results_dir))
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except OSError:
+                # Removed concurrently by another worker
+                pass
@@ -0,0 +1,85 @@
+import base64
+import json
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, Response
+from sqlalchemy import Date, tuple_
+from sqlalchemy.orm import Query
+
+# Response header carrying the cursor for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def parse_sort(sort: str, sort_columns: Dict[str, Sequence]) -> Tuple[List, bool]:
+    """Resolve a ``sort`` parameter such as ``project_title`` or ``-start_date``."""
+    descending = sort.startswith("-")
+    key = sort[1:] if descending else sort
+    if key not in sort_columns:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid sort field '{key}'. Allowed: {', '.join(sort_columns)}"
+        )
+    return list(sort_columns[key]), descending
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the keyset values of the last row of a page into an opaque cursor."""
+    payload = [v.isoformat() if isinstance(v, date) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence) -> List[Any]:
+    """Decode a cursor produced by ``encode_cursor`` for the given keyset columns."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError("cursor does not match sort order")
+        return [
+            date.fromisoformat(v) if isinstance(col.type, Date) and v is not None else v
+            for col, v in zip(columns, values)
+        ]
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def paginate_keyset(
+    query: Query,
+    sort_columns: Sequence,
+    key_columns: Sequence,
+    descending: bool,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> Tuple[list, Optional[str]]:
+    """Return one page of ``query`` ordered by ``sort_columns`` then ``key_columns``.
+
+    ``key_columns`` must make the ordering unique (normally the primary key) and
+    every column must be selected by ``query`` and be non-nullable, so the
+    row-value comparison used to seek past the cursor is well defined.
+    """
+    columns = list(sort_columns) + list(key_columns)
+
+    if cursor:
+        values = tuple(decode_cursor(cursor, columns))
+        if descending:
+            query = query.filter(tuple_(*columns) < values)
+        else:
+            query = query.filter(tuple_(*columns) > values)
+
+    order_by = [col.desc() if descending else col.asc() for col in columns]
+    rows = query.order_by(*order_by).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([rows[-1]._mapping[col] for col in columns])
+
+    return rows, next_cursor
+
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]) -> None:
+    """Expose the next-page cursor to the client, if there is another page."""
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
@@ -0,0 +1,122 @@
+"""Columnar in-memory snapshots for ad hoc aggregation (pivot tables).
+
+A fact table is loaded once into NumPy arrays: every dimension is
+dictionary-encoded into integer codes with a sorted list of labels, and
+every measure becomes a float array. Grouping by any combination of
+dimensions is then a handful of vectorised operations (combine the codes
+into one key, ``np.unique`` it, ``np.bincount`` the measure), so slicing
+the data never touches the database.
+
+Fact tables are kept as ``SnapshotCache`` values, so they are rebuilt when
+their source tables change.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.snapshots import SnapshotCache
+
+
+def _sort_key(label: Any) -> tuple:
+    # Missing values sort last
+    return (label is None, label)
+
+
+@dataclass
+class Dimension:
+    codes: np.ndarray
+    labels: List[Any]
+
+    @classmethod
+    def encode(cls, values: Sequence[Any]) -> "Dimension":
+        labels = sorted(set(values), key=_sort_key)
+        index = {label: code for code, label in enumerate(labels)}
+        codes = np.fromiter((index[value] for value in values), dtype=np.int64, count=len(values))
+        return cls(codes, labels)
+
+    def code_of(self, value: str) -> Optional[int]:
+        """Code of the label whose text is ``value`` (query parameters are strings)."""
+        for code, label in enumerate(self.labels):
+            if label is not None and str(label) == value:
+                return code
+        return None
+
+
+class FactTable:
+    """Dictionary-encoded dimensions and numeric measures of one snapshot."""
+
+    def __init__(self, columns: Dict[str, List[Any]], dimensions: Iterable[str], measures: Iterable[str]):
+        self.size = len(next(iter(columns.values()), []))
+        self.dimensions = {name: Dimension.encode(columns[name]) for name in dimensions}
+        # Integer columns stay integers (and are summed as such); missing values count as zero
+        self.measures = {name: np.array([value or 0 for value in columns[name]]) for name in measures}
+        self.refreshed_at = datetime.now(timezone.utc)
+
+    def pivot(
+        self,
+        measure: Optional[str],
+        dimensions: Sequence[str],
+        filters: Optional[Dict[str, str]] = None
+    ) -> List[Tuple[Tuple[Any, ...], Union[int, float]]]:
+        """Sum ``measure`` (or count rows when it is ``None``) per combination of ``dimensions``.
+
+        ``filters`` keeps only rows whose dimension label equals the given
+        text. Cells come back ordered by their labels, empty cells omitted;
+        counts and sums of integer measures are ``int``.
+        """
+        mask = np.ones(self.size, dtype=bool)
+        for name, value in (filters or {}).items():
+            dimension = self.dimensions[name]
+            code = dimension.code_of(value)
+            if code is None:
+                return []
+            mask &= dimension.codes == code
+        if not mask.any():
+            return []
+
+        weights = self.measures[measure][mask] if measure else None
+        value = float if weights is not None and weights.dtype.kind == "f" else int
+        if not dimensions:
+            total = weights.sum() if weights is not None else mask.sum()
+            return [((), value(total))]
+
+        encoded = [self.dimensions[name] for name in dimensions]
+        shape = tuple(len(dimension.labels) for dimension in encoded)
+        keys = np.ravel_multi_index([dimension.codes[mask] for dimension in encoded], shape)
+        cells, inverse = np.unique(keys, return_inverse=True)
+        totals = np.bincount(inverse, weights=weights, minlength=len(cells))
+        if value is int:
+            # bincount sums weights as floats
+            totals = np.rint(totals).astype(np.int64)
+        positions = np.unravel_index(cells, shape)
+
+        return [
+            (
+                tuple(dimension.labels[axis[i]] for dimension, axis in zip(encoded, positions)),
+                value(totals[i])
+            )
+            for i in range(len(cells))
+        ]
+
+
+class FactSnapshot(SnapshotCache[FactTable]):
+    """A ``FactTable`` of the columns returned by ``load(db)``, kept current with the source tables."""
+
+    def __init__(
+        self,
+        load: Callable[[Session], Dict[str, List[Any]]],
+        dimensions: Iterable[str],
+        measures: Iterable[str],
+        tables: Iterable[str],
+        refresh_interval: float,
+    ):
+        self.dimensions = tuple(dimensions)
+        self.measures = tuple(measures)
+        super().__init__(
+            lambda db: FactTable(load(db), self.dimensions, self.measures),
+            tables,
+            refresh_interval
+        )
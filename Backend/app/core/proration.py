@@ -0,0 +1,59 @@
+"""Proration of amounts committed over date ranges (grants, project budgets).
+
+Each amount is spread evenly over every unit (day or month) of its
+inclusive ``[start, end]`` range and the shares are totalled per month or
+year. Instead of visiting every allocation for every period, each one adds
+its per-unit rate at its first unit and removes it after its last in a
+difference array; a cumulative sum then gives the burn rate of every unit
+and ``np.add.reduceat`` folds the units into periods. The cost is linear in
+the number of allocations plus the number of units spanned.
+"""
+from typing import Sequence, Tuple
+
+import numpy as np
+
+PERIOD_UNITS = {"month": "M", "year": "Y"}
+GRANULARITY_UNITS = {"day": "D", "month": "M"}
+
+
+def prorate(
+    starts: Sequence,
+    ends: Sequence,
+    amounts: Sequence[float],
+    period: str = "month",
+    granularity: str = "day",
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Total per ``period`` of ``amounts`` spread over their ``starts``-``ends`` ranges.
+
+    Dates may be ``date`` objects or ``datetime64`` values; a missing end or
+    one before its start puts the whole amount on the start. Returns the
+    consecutive periods (``datetime64`` of the period unit) from the first
+    start to the last end, and the amount falling in each.
+    """
+    unit = GRANULARITY_UNITS[granularity]
+    period_unit = PERIOD_UNITS[period]
+    amounts = np.asarray(amounts, dtype=np.float64)
+    if not len(amounts):
+        return np.array([], dtype=f"datetime64[{period_unit}]"), np.array([], dtype=np.float64)
+
+    first = np.asarray(starts, dtype="datetime64[D]").astype(f"datetime64[{unit}]")
+    last = np.asarray(ends, dtype="datetime64[D]").astype(f"datetime64[{unit}]")
+    last = np.where(np.isnat(last) | (last < first), first, last)
+
+    periods = np.arange(
+        first.min().astype(f"datetime64[{period_unit}]"),
+        last.max().astype(f"datetime64[{period_unit}]") + 1
+    )
+    # Unit offsets of each period's first unit, counted from the first period
+    period_starts = periods.astype(f"datetime64[{unit}]")
+    origin = period_starts[0]
+    span = int(((periods[-1] + 1).astype(f"datetime64[{unit}]") - origin).astype(np.int64))
+
+    begin = (first - origin).astype(np.int64)
+    stop = (last - origin).astype(np.int64) + 1
+    rate = amounts / (stop - begin)
+    delta = np.bincount(begin, weights=rate, minlength=span + 1) - np.bincount(stop, weights=rate, minlength=span + 1)
+    per_unit = np.cumsum(delta[:span])
+
+    totals = np.add.reduceat(per_unit, (period_starts - origin).astype(np.int64))
+    return periods, totals
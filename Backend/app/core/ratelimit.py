@@ -0,0 +1,227 @@
+"""Token-bucket rate limiting for expensive endpoints.
+
+Each policy gives every client a bucket of ``burst`` tokens that refills at
+``per_minute`` tokens a minute; a request spends one token and is refused
+with ``429`` when the bucket is empty. Clients are identified by the user in
+their bearer token when there is one, otherwise by IP address.
+
+Buckets live in a backend. ``MemoryBackend`` keeps them in the process, so
+with several workers each worker enforces its own limit; ``RedisBackend``
+shares them between workers and hosts.
+"""
+import json
+import math
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional, Tuple
+
+from jose import JWTError, jwt
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # redis is optional; only RedisBackend needs it
+    aioredis = None
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    name: str
+    # Matched against the request path with re.match
+    pattern: str
+    burst: int
+    per_minute: float
+    # Only these methods are limited; empty means every method
+    methods: Tuple[str, ...] = ()
+    # "ip" always limits by address; "user" prefers the authenticated user
+    key: str = "user"
+
+    @property
+    def refill_rate(self) -> float:
+        """Tokens added per second."""
+        return self.per_minute / 60
+
+    def applies_to(self, method: str, path: str) -> bool:
+        return (not self.methods or method in self.methods) and re.match(self.pattern, path) is not None
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    remaining: int
+    # Seconds until a token is available (when refused) or the bucket is full again
+    retry_after: float
+    reset_after: float
+
+
+def _refill(tokens: float, elapsed: float, policy: RateLimitPolicy) -> float:
+    return min(policy.burst, tokens + max(elapsed, 0.0) * policy.refill_rate)
+
+
+def _result(allowed: bool, tokens: float, policy: RateLimitPolicy) -> RateLimitResult:
+    rate = policy.refill_rate
+    return RateLimitResult(
+        allowed=allowed,
+        remaining=int(tokens),
+        retry_after=0.0 if allowed else (1 - tokens) / rate,
+        reset_after=(policy.burst - tokens) / rate
+    )
+
+
+class MemoryBackend:
+    """Buckets in a bounded in-process LRU map.
+
+    Only the event loop touches the map, so no locking is needed. The least
+    recently used buckets are dropped beyond ``max_keys``; a dropped bucket
+    simply starts full again. ``clock`` returns the time in seconds.
+    """
+
+    def __init__(self, max_keys: int = 10000, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self.clock = clock
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def consume(self, key: str, policy: RateLimitPolicy) -> RateLimitResult:
+        now = self.clock()
+        tokens, updated = self._buckets.get(key, (policy.burst, now))
+        tokens = _refill(tokens, now - updated, policy)
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return _result(allowed, tokens, policy)
+
+
+# Refill and spend atomically on the Redis server, using its clock so that
+# every worker sees the same time
+_REDIS_TOKEN_BUCKET = """
+local burst = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(state[1]) or burst
+local updated = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return {allowed, tostring(tokens)}
+"""
+
+
+class RedisBackend:
+    """Buckets shared through Redis, for deployments with several workers.
+
+    If Redis cannot be reached the request is allowed, so an outage of the
+    limiter never takes the API down with it.
+    """
+
+    def __init__(self, url: str, prefix: str = "ratelimit:"):
+        if aioredis is None:
+            raise RuntimeError("RedisBackend requires the 'redis' package")
+        self.prefix = prefix
+        self._client = aioredis.Redis.from_url(url)
+        self._script = self._client.register_script(_REDIS_TOKEN_BUCKET)
+
+    async def consume(self, key: str, policy: RateLimitPolicy) -> RateLimitResult:
+        try:
+            allowed, tokens = await self._script(keys=[self.prefix + key], args=[policy.burst, policy.refill_rate])
+        except Exception as e:
+            print(f"⚠️ Rate limiter backend unavailable, allowing request: {e}")
+            return _result(True, policy.burst, policy)
+        return _result(bool(allowed), float(tokens), policy)
+
+
+def _client_address(scope: Scope, trust_forwarded_for: bool) -> str:
+    if trust_forwarded_for:
+        forwarded = Headers(scope=scope).get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+class RateLimitMiddleware:
+    """Apply the first matching policy to each request and add ``RateLimit-*`` headers."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        policies: Iterable[RateLimitPolicy],
+        backend,
+        secret_key: str,
+        algorithm: str,
+        trust_forwarded_for: bool = False,
+    ):
+        self.app = app
+        self.policies = list(policies)
+        self.backend = backend
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+        self.trust_forwarded_for = trust_forwarded_for
+
+    def _policy(self, method: str, path: str) -> Optional[RateLimitPolicy]:
+        for policy in self.policies:
+            if policy.applies_to(method, path):
+                return policy
+        return None
+
+    def _client_key(self, scope: Scope, policy: RateLimitPolicy) -> str:
+        if policy.key == "user":
+            authorization = Headers(scope=scope).get("authorization", "")
+            scheme, _, token = authorization.partition(" ")
+            if scheme.lower() == "bearer" and token:
+                try:
+                    user_id = jwt.decode(token, self.secret_key, algorithms=[self.algorithm]).get("user_id")
+                except JWTError:
+                    user_id = None
+                if user_id is not None:
+                    return f"{policy.name}:user:{user_id}"
+        return f"{policy.name}:ip:{_client_address(scope, self.trust_forwarded_for)}"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        policy = self._policy(scope["method"], scope["path"]) if scope["type"] == "http" else None
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        result = await self.backend.consume(self._client_key(scope, policy), policy)
+        headers = {
+            "RateLimit-Limit": str(policy.burst),
+            "RateLimit-Remaining": str(result.remaining),
+            "RateLimit-Reset": str(math.ceil(result.reset_after)),
+            "RateLimit-Policy": f"{policy.burst};w={math.ceil(policy.burst / policy.refill_rate)}",
+        }
+
+        if not result.allowed:
+            retry_after = str(max(1, math.ceil(result.retry_after)))
+            body = json.dumps({"detail": "Rate limit exceeded, try again later"}).encode()
+            response_headers = MutableHeaders(headers={
+                **headers,
+                "Retry-After": retry_after,
+                "Content-Type": "application/json",
+                "Content-Length": str(len(body)),
+            })
+            await send({"type": "http.response.start", "status": 429, "headers": response_headers.raw})
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                for name, value in headers.items():
+                    response_headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
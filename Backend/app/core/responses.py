@@ -0,0 +1,58 @@
+from typing import Any, Iterable
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
+
+from app.core.config import FAST_JSON_RESPONSES
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library encoder
+    orjson = None
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY if orjson else 0
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Handle values orjson cannot serialize natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    return jsonable_encoder(obj)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when it is installed.
+
+    Dates, datetimes, non-string dict keys (e.g. ``{2023: 4}``) and pydantic
+    models are handled, so route dicts can be passed through unchanged.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(jsonable_encoder(content))
+        return orjson.dumps(content, default=_orjson_default, option=ORJSON_OPTIONS)
+
+
+# Application-wide default response class
+DefaultJSONResponse = FastJSONResponse if FAST_JSON_RESPONSES and orjson else JSONResponse
+
+
+def trusted_json_response(content: Any, status_code: int = 200) -> Response:
+    """Return route-built data without ``response_model`` revalidation.
+
+    Only use this for payloads the route has assembled itself from database
+    rows; FastAPI skips validation for ``Response`` return values.
+    """
+    return FastJSONResponse(content, status_code=status_code)
+
+
+def list_response(adapter: TypeAdapter, items: Iterable[Any]) -> Response:
+    """Serialize ORM objects through a precompiled list ``TypeAdapter``.
+
+    Validation and JSON encoding both run in pydantic-core, skipping the
+    per-item model construction and ``jsonable_encoder`` pass FastAPI does
+    for ``response_model=List[...]``.
+    """
+    validated = adapter.validate_python(list(items), from_attributes=True)
+    return Response(content=adapter.dump_json(validated), media_type="application/json")
@@ -0,0 +1,44 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Query
+
+
+def parse_sections(sections: Optional[str], allowed: Sequence[str]) -> Tuple[str, ...]:
+    """Resolve a comma-separated ``sections`` parameter; ``None`` selects all."""
+    if not sections:
+        return tuple(allowed)
+    requested = tuple(dict.fromkeys(s.strip() for s in sections.split(",") if s.strip()))
+    unknown = [s for s in requested if s not in allowed]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid section '{unknown[0]}'. Allowed: {', '.join(allowed)}"
+        )
+    return requested
+
+
+def parse_fields(
+    fields: Optional[str], allowed: Sequence[str], always: Sequence[str] = ()
+) -> Optional[Tuple[str, ...]]:
+    """Resolve a comma-separated ``fields`` parameter into the fields to return.
+
+    Returns ``None`` when no sparse fieldset was requested. Fields in
+    ``always`` (typically the primary key) are included in every fieldset.
+    """
+    if not fields:
+        return None
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in allowed]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid field '{unknown[0]}'. Allowed: {', '.join(allowed)}"
+        )
+    return tuple(dict.fromkeys((*always, *requested)))
+
+
+def select_fields(query: Query, model, fields: Sequence[str]) -> List[Dict[str, Any]]:
+    """Run ``query`` selecting only the given columns of ``model``, as dicts."""
+    rows = query.with_entities(*(getattr(model, name) for name in fields)).all()
+    return [dict(row._mapping) for row in rows]
@@ -0,0 +1,65 @@
+"""In-process snapshots derived from database tables, rebuilt when they change.
+
+A snapshot is rebuilt lazily on the next ``get()``: straight away after a
+commit in this process wrote to one of its tables, and after
+``refresh_interval`` seconds when the table versions show that another
+worker did.
+"""
+import threading
+import time
+from typing import Callable, Generic, Iterable, Optional, Set, TypeVar
+
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+from app.db.versioning import add_commit_listener, get_table_versions
+
+T = TypeVar("T")
+
+
+class SnapshotCache(Generic[T]):
+    """The result of ``build(db)``, kept current with the source ``tables``."""
+
+    def __init__(self, build: Callable[[Session], T], tables: Iterable[str], refresh_interval: float):
+        self.build = build
+        self.tables = frozenset(tables)
+        self.refresh_interval = refresh_interval
+
+        self._value: Optional[T] = None
+        self._versions = None
+        self._checked = 0.0
+        self._stale = True
+        self._lock = threading.Lock()
+
+        add_commit_listener(self._on_commit)
+
+    def _on_commit(self, tables: Set[str]) -> None:
+        if tables & self.tables:
+            self._stale = True
+
+    def _fresh(self) -> bool:
+        return not self._stale and time.monotonic() - self._checked < self.refresh_interval
+
+    def get(self) -> T:
+        """The current snapshot, rebuilt first if its tables have changed."""
+        if self._fresh():
+            return self._value
+        with self._lock:
+            # Another thread may have refreshed while this one waited
+            if self._fresh():
+                return self._value
+            db = SessionLocal()
+            try:
+                # Clear the flag first so a commit racing the rebuild marks it stale again
+                self._stale = False
+                versions = {name: version for name, (version, _) in get_table_versions(db, self.tables).items()}
+                if self._value is None or versions != self._versions:
+                    self._value = self.build(db)
+                    self._versions = versions
+                self._checked = time.monotonic()
+            except Exception:
+                self._stale = True
+                raise
+            finally:
+                db.close()
+            return self._value
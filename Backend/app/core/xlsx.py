@@ -0,0 +1,156 @@
+"""Minimal streaming XLSX writer.
+
+Spreadsheet libraries build the whole workbook before saving it, so a
+large export would sit in memory until the last row is read. An XLSX file
+is a zip of XML parts, and only the worksheet grows with the data, so it
+is written row batch by row batch into a zip stream that is drained as it
+goes. Cells are limited to what exports need: numbers, booleans, dates and
+inline strings.
+"""
+import re
+import zipfile
+from datetime import date, datetime
+from typing import Iterable, Iterator, List, Sequence
+from xml.sax.saxutils import escape
+
+# Cell kinds understood by ``stream_xlsx``
+NUMBER, BOOLEAN, DATE, DATETIME, STRING = "number", "boolean", "date", "datetime", "string"
+
+_EPOCH = datetime(1899, 12, 30)
+
+# Characters XML 1.0 cannot represent, even escaped
+_INVALID_XML = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+_CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>
+<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>
+<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>
+</Types>"""
+
+_ROOT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>
+</Relationships>"""
+
+_WORKBOOK = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
+<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets>
+</workbook>"""
+
+_WORKBOOK_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>
+<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>
+</Relationships>"""
+
+# Cell styles: 0 general, 1 date (built-in format 14), 2 date and time (22), 3 bold header
+_STYLES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font><font><b/><sz val="11"/><name val="Calibri"/></font></fonts>
+<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>
+<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>
+<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>
+<cellXfs count="4">
+<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>
+<xf numFmtId="14" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>
+<xf numFmtId="22" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>
+<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>
+</cellXfs>
+</styleSheet>"""
+
+_SHEET_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<sheetViews><sheetView workbookViewId="0"><pane ySplit="1" topLeftCell="A2" state="frozen"/></sheetView></sheetViews>'
+    '<sheetData>'
+)
+_SHEET_END = "</sheetData></worksheet>"
+
+
+class ChunkSink:
+    """Write-only, unseekable file object whose contents are taken with ``drain``."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def writable(self) -> bool:
+        return True
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _string_cell(value) -> str:
+    text = escape(_INVALID_XML.sub("", str(value)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _cell(value, kind: str) -> str:
+    if value is None:
+        return "<c/>"
+    if kind == NUMBER:
+        return f"<c><v>{value}</v></c>"
+    if kind == BOOLEAN:
+        return f'<c t="b"><v>{int(bool(value))}</v></c>'
+    if kind == DATETIME and isinstance(value, datetime):
+        serial = (value.replace(tzinfo=None) - _EPOCH).total_seconds() / 86400
+        return f'<c s="2"><v>{serial}</v></c>'
+    if kind in (DATE, DATETIME) and isinstance(value, date):
+        return f'<c s="1"><v>{(value - _EPOCH.date()).days}</v></c>'
+    return _string_cell(value)
+
+
+def stream_xlsx(
+    columns: Sequence[str],
+    kinds: Sequence[str],
+    batches: Iterable[Sequence[Sequence]],
+    sheet_name: str = "Sheet1",
+) -> Iterator[bytes]:
+    """Yield an XLSX workbook holding one sheet of ``batches`` of rows.
+
+    ``kinds`` gives the cell kind of each column; the first row holds the
+    column names.
+    """
+    sink = ChunkSink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as workbook:
+        workbook.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        workbook.writestr("_rels/.rels", _ROOT_RELS)
+        workbook.writestr("xl/workbook.xml", _WORKBOOK.format(name=escape(sheet_name[:31], {'"': "&quot;"})))
+        workbook.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+        workbook.writestr("xl/styles.xml", _STYLES)
+        yield sink.drain()
+
+        # Sizes are unknown up front, so allow the sheet to grow past 4 GiB
+        with workbook.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            header = "".join(_string_cell(name).replace("<c ", '<c s="3" ', 1) for name in columns)
+            sheet.write((_SHEET_START + f"<row>{header}</row>").encode())
+            for rows in batches:
+                sheet.write("".join(
+                    "<row>" + "".join(_cell(value, kind) for value, kind in zip(row, kinds)) + "</row>"
+                    for row in rows
+                ).encode())
+                yield sink.drain()
+            sheet.write(_SHEET_END.encode())
+    yield sink.drain()
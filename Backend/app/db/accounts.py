@@ -0,0 +1,146 @@
+"""Bulk provisioning of login accounts for faculty and students.
+
+Provisioning is a pipeline: one query finds the people who need an account
+(or whose stored hash is unusable), password hashing, the expensive part,
+is spread over a process pool using every core, and the hashes are written
+back with one bulk statement per chunk as they arrive, so inserting
+overlaps with hashing instead of waiting for it.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import insert, literal, select, union_all, update
+from sqlalchemy.orm import Session, aliased
+
+from app.core.auth import get_password_hash, pwd_context
+from app.models.auth import User
+from app.models.faculty import Faculty
+from app.models.students import Student
+
+
+@dataclass
+class AccountPlan:
+    """One account to create (``user_id`` is ``None``) or whose password to reset."""
+
+    user_type: str
+    person_id: int
+    email: str
+    user_id: Optional[int] = None
+    password: str = ""
+
+
+def _usable_hash(hashed_password: Optional[str]) -> bool:
+    return bool(hashed_password) and pwd_context.identify(hashed_password) is not None
+
+
+def plan_accounts(db: Session) -> Tuple[List[AccountPlan], List[str]]:
+    """Accounts that are missing or have an unusable hash, from a single query.
+
+    Returns the plans and the emails that cannot be provisioned because
+    another account (or another person in this run) already uses them.
+    """
+    linked = aliased(User)
+    same_email = aliased(User)
+    people = union_all(*(
+        select(
+            literal(user_type).label("user_type"),
+            person_id.label("person_id"),
+            email.label("email"),
+            linked.user_id,
+            linked.hashed_password,
+            same_email.user_id.label("email_owner")
+        ).select_from(model).outerjoin(
+            linked, link == person_id
+        ).outerjoin(
+            same_email, same_email.email == email
+        )
+        for user_type, model, person_id, email, link in (
+            ("faculty", Faculty, Faculty.faculty_id, Faculty.email, linked.faculty_id),
+            ("student", Student, Student.student_id, Student.email, linked.student_id),
+        )
+    ))
+
+    plans, conflicts = [], []
+    new_emails = set()
+    for row in db.execute(people):
+        if row.user_id is None:
+            if row.email_owner is not None or row.email in new_emails:
+                conflicts.append(row.email)
+            else:
+                new_emails.add(row.email)
+                plans.append(AccountPlan(row.user_type, row.person_id, row.email))
+        elif not _usable_hash(row.hashed_password):
+            plans.append(AccountPlan(row.user_type, row.person_id, row.email, user_id=row.user_id))
+    return plans, conflicts
+
+
+def _hashes(passwords: List[str], workers: int) -> Iterator[str]:
+    """Hash ``passwords`` in order, across ``workers`` processes."""
+    if workers <= 1:
+        yield from map(get_password_hash, passwords)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Larger chunks amortise inter-process overhead; keep enough to balance the load
+        chunksize = max(1, min(64, len(passwords) // (workers * 4)))
+        yield from pool.map(get_password_hash, passwords, chunksize=chunksize)
+
+
+def _write_chunk(db: Session, chunk: List[Tuple[AccountPlan, str]]) -> None:
+    creates = [
+        {
+            "email": plan.email,
+            "hashed_password": hashed,
+            "user_type": plan.user_type,
+            "is_active": True,
+            "faculty_id": plan.person_id if plan.user_type == "faculty" else None,
+            "student_id": plan.person_id if plan.user_type == "student" else None,
+        }
+        for plan, hashed in chunk if plan.user_id is None
+    ]
+    resets = [
+        {"user_id": plan.user_id, "hashed_password": hashed}
+        for plan, hashed in chunk if plan.user_id is not None
+    ]
+    if creates:
+        db.execute(insert(User), creates)
+    if resets:
+        db.execute(update(User), resets)
+    db.commit()
+
+
+def provision_accounts(
+    db: Session,
+    plans: List[AccountPlan],
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, int]:
+    """Hash each plan's password and create or reset its account.
+
+    Each chunk of ``chunk_size`` accounts is committed as soon as its hashes
+    are ready; ``progress(done, total)`` is called after every chunk.
+    """
+    workers = workers or os.cpu_count() or 1
+    counts = {"created": 0, "reset": 0}
+    chunk: List[Tuple[AccountPlan, str]] = []
+    done = 0
+
+    def flush() -> None:
+        nonlocal chunk, done
+        _write_chunk(db, chunk)
+        for plan, _ in chunk:
+            counts["created" if plan.user_id is None else "reset"] += 1
+        done += len(chunk)
+        chunk = []
+        if progress:
+            progress(done, len(plans))
+
+    for plan, hashed in zip(plans, _hashes([plan.password for plan in plans], workers)):
+        chunk.append((plan, hashed))
+        if len(chunk) >= chunk_size:
+            flush()
+    if chunk:
+        flush()
+    return counts
@@ -0,0 +1,282 @@
+"""Batch create/update/delete shared by the entity routers.
+
+A batch is validated up front with set-based queries: one query loads every
+row targeted by updates and deletes, one query per referenced table checks
+foreign keys, and one query per unique column finds conflicts. Operations
+that pass are then applied in chunks, each chunk in its own transaction.
+If a chunk fails at the database, it is rolled back and replayed one
+operation per transaction so that only the offending items fail.
+"""
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import insert, inspect, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.db.cascade import cascade_delete
+from app.schemas.batch import BatchOperation
+
+# (index in request, operation, validated payload)
+_Item = Tuple[int, BatchOperation, Optional[Dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class BatchSpec:
+    """How to batch-edit one model."""
+
+    model: Any
+    create_schema: Type[BaseModel]
+    update_schema: Type[BaseModel]
+    # Used in error messages, e.g. "Faculty member not found"
+    label: str
+    # Payload field -> model it references, checked before anything is written
+    foreign_keys: Mapping[str, Any] = field(default_factory=dict)
+    # Set-based delete plan (see app.db.cascade); ORM deletes are used without one
+    cascade: Optional[Tuple[Any, ...]] = None
+
+    @property
+    def pk(self):
+        return inspect(self.model).primary_key[0]
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(p) for p in e['loc']) or 'data'}: {e['msg']}" for e in error.errors()
+    )
+
+
+def _db_error_message(error: SQLAlchemyError) -> str:
+    return str(getattr(error, "orig", None) or error).splitlines()[0]
+
+
+def _parse(spec: BatchSpec, op: BatchOperation) -> Optional[Dict[str, Any]]:
+    """Validate an operation's payload, raising ``ValueError`` on bad input."""
+    if op.op != "create" and op.id is None:
+        raise ValueError(f"'id' is required for {op.op}")
+    try:
+        if op.op == "create":
+            return spec.create_schema.model_validate(op.data or {}).model_dump()
+        if op.op == "update":
+            return spec.update_schema.model_validate(op.data or {}).model_dump(exclude_unset=True)
+    except ValidationError as e:
+        raise ValueError(_validation_message(e))
+    return None
+
+
+def _missing_references(db: Session, spec: BatchSpec, payloads: List[Dict[str, Any]]) -> Dict[str, Set[Any]]:
+    """Foreign key values in ``payloads`` that do not exist, one query per referenced table."""
+    missing = {}
+    for name, target in spec.foreign_keys.items():
+        wanted = {p[name] for p in payloads if p.get(name) is not None}
+        if not wanted:
+            continue
+        target_pk = inspect(target).primary_key[0]
+        found = {row[0] for row in db.query(target_pk).filter(target_pk.in_(wanted))}
+        missing[name] = wanted - found
+    return missing
+
+
+def _unique_conflicts(db: Session, spec: BatchSpec, items: List[_Item]) -> Dict[int, str]:
+    """Unique-column clashes with existing rows or earlier items, keyed by item index."""
+    pk = spec.pk
+    conflicts = {}
+    for column in inspect(spec.model).columns:
+        if not column.unique:
+            continue
+        claims = [(i, op, p[column.key]) for i, op, p in items if p and p.get(column.key) is not None]
+        if not claims:
+            continue
+        owners = dict(
+            db.query(getattr(spec.model, column.key), pk)
+            .filter(getattr(spec.model, column.key).in_({value for _, _, value in claims}))
+            .all()
+        )
+        for i, op, value in claims:
+            owner = owners.get(value)
+            if owner is not None and owner != op.id:
+                conflicts.setdefault(i, f"{column.key} '{value}' already exists")
+            else:
+                # Later items in the same batch cannot claim it again
+                owners[value] = op.id if op.op == "update" else -1
+    return conflicts
+
+
+_STATUS = {"create": "created", "update": "updated", "delete": "deleted"}
+
+
+def run_batch(
+    db: Session, spec: BatchSpec, operations: List[BatchOperation], atomic: bool, chunk_size: int
+) -> Dict[str, Any]:
+    """Apply ``operations`` and return per-item results.
+
+    Non-atomic batches apply every valid operation and report the rest as
+    failed. Atomic batches apply nothing unless every operation succeeds.
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(operations)
+
+    def fail(index: int, op: BatchOperation, message: str) -> None:
+        results[index] = {"index": index, "op": op.op, "status": "failed", "id": op.id, "error": message}
+
+    def succeed(index: int, op: BatchOperation, pk_value) -> None:
+        results[index] = {"index": index, "op": op.op, "status": _STATUS[op.op], "id": pk_value}
+
+    pending: List[_Item] = []
+    for index, op in enumerate(operations):
+        try:
+            pending.append((index, op, _parse(spec, op)))
+        except ValueError as e:
+            fail(index, op, str(e))
+
+    # Every row targeted by an update or delete, in one query
+    target_ids = {op.id for _, op, _ in pending if op.op != "create"}
+    targets = {}
+    if target_ids:
+        targets = {getattr(obj, spec.pk.key): obj for obj in db.query(spec.model).filter(spec.pk.in_(target_ids))}
+
+    missing = _missing_references(db, spec, [p for _, _, p in pending if p])
+
+    checked: List[_Item] = []
+    deleted: Set[int] = set()
+    for index, op, payload in pending:
+        if op.op != "create" and (op.id not in targets or op.id in deleted):
+            fail(index, op, f"{spec.label} not found")
+            continue
+        bad = [f"{name} {payload[name]}" for name, values in missing.items() if payload and payload.get(name) in values]
+        if bad:
+            fail(index, op, f"Referenced record not found: {', '.join(bad)}")
+            continue
+        if op.op == "delete":
+            deleted.add(op.id)
+        checked.append((index, op, payload))
+
+    # Only items that can otherwise be applied claim unique values
+    conflicts = _unique_conflicts(db, spec, checked)
+    valid: List[_Item] = []
+    for index, op, payload in checked:
+        if index in conflicts:
+            fail(index, op, conflicts[index])
+        else:
+            valid.append((index, op, payload))
+
+    if atomic:
+        _run_atomic(db, spec, valid, targets, results, succeed)
+    else:
+        for start in range(0, len(valid), chunk_size):
+            _run_chunk(db, spec, valid[start:start + chunk_size], targets, succeed, fail)
+
+    failed = sum(1 for r in results if r["status"] == "failed")
+    succeeded = sum(1 for r in results if r["status"] in _STATUS.values())
+    return {
+        "atomic": atomic,
+        "total": len(operations),
+        "succeeded": succeeded,
+        "failed": failed,
+        "results": results
+    }
+
+
+def _bulk_insert(db: Session, spec: BatchSpec, creates: List[_Item]) -> List[Tuple[int, BatchOperation, Any]]:
+    """Insert ``creates`` in one multi-row statement and return their new primary keys.
+
+    SQLite cannot guarantee RETURNING order for a multi-row insert, and
+    asking SQLAlchemy to sort by parameter order falls back to a statement
+    per row. Instead the inserted values are returned with the key and rows
+    are matched back to payloads by value; identical payloads are
+    interchangeable, so ties do not matter.
+    """
+    pk = spec.pk
+    keys = sorted(creates[0][2])
+    rows = db.execute(
+        insert(spec.model).returning(pk, *(getattr(spec.model, key) for key in keys)),
+        [payload for _, _, payload in creates]
+    ).all()
+
+    ids_by_values = defaultdict(list)
+    for row in rows:
+        ids_by_values[tuple(row[1:])].append(row[0])
+    return [
+        (index, op, ids_by_values[tuple(payload[key] for key in keys)].pop())
+        for index, op, payload in creates
+    ]
+
+
+def _apply_and_flush(db: Session, spec: BatchSpec, items: List[_Item], targets) -> List[Tuple[int, BatchOperation, Any]]:
+    """Apply ``items`` with one bulk statement per operation kind, returning their primary keys."""
+    pk = spec.pk
+    creates = [(index, op, payload) for index, op, payload in items if op.op == "create"]
+    updates = [(index, op, payload) for index, op, payload in items if op.op == "update"]
+    deletes = [(index, op) for index, op, _ in items if op.op == "delete"]
+
+    applied = []
+    if creates:
+        applied += _bulk_insert(db, spec, creates)
+    if updates:
+        rows = [{pk.key: op.id, **payload} for _, op, payload in updates if payload]
+        if rows:
+            # Bulk UPDATE by primary key, grouped by the set of changed columns
+            db.execute(update(spec.model), rows)
+        applied += [(index, op, op.id) for index, op, _ in updates]
+    if deletes and spec.cascade:
+        cascade_delete(db, spec.cascade, [op.id for _, op in deletes])
+        applied += [(index, op, op.id) for index, op in deletes]
+    elif deletes:
+        for index, op in deletes:
+            # ORM delete, so relationship rules for dependent rows still apply
+            db.delete(targets[op.id])
+            applied.append((index, op, op.id))
+    db.flush()
+    return sorted(applied, key=lambda item: item[0])
+
+
+def _run_chunk(db: Session, spec: BatchSpec, chunk: List[_Item], targets, succeed, fail) -> None:
+    """Apply a chunk in one transaction, isolating failures item by item if it is rejected."""
+    try:
+        applied = _apply_and_flush(db, spec, chunk, targets)
+        db.commit()
+    except SQLAlchemyError:
+        db.rollback()
+    else:
+        for index, op, pk_value in applied:
+            succeed(index, op, pk_value)
+        return
+
+    for item in chunk:
+        index, op, _ = item
+        try:
+            [(_, _, pk_value)] = _apply_and_flush(db, spec, [item], targets)
+            db.commit()
+        except SQLAlchemyError as e:
+            db.rollback()
+            fail(index, op, _db_error_message(e))
+        else:
+            succeed(index, op, pk_value)
+
+
+def _run_atomic(db: Session, spec: BatchSpec, valid: List[_Item], targets, results, succeed) -> None:
+    """Apply every operation in one transaction, or none if anything fails."""
+    error = None
+    if all(r is None for r in results):
+        try:
+            applied = _apply_and_flush(db, spec, valid, targets)
+            db.commit()
+        except SQLAlchemyError as e:
+            db.rollback()
+            error = _db_error_message(e)
+        else:
+            for index, op, pk_value in applied:
+                succeed(index, op, pk_value)
+            return
+    else:
+        db.rollback()
+
+    for index, op, _ in valid:
+        if error:
+            results[index] = {"index": index, "op": op.op, "status": "failed", "id": op.id, "error": error}
+        else:
+            results[index] = {
+                "index": index, "op": op.op, "status": "skipped", "id": op.id,
+                "error": "Not applied because another operation in the atomic batch failed"
+            }
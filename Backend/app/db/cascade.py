@@ -0,0 +1,80 @@
+"""Set-based deletes for records that other tables depend on.
+
+A cascade plan lists, in dependency order, one step per table that
+references the record: dependent rows are deleted or have their reference
+cleared, and the record itself goes last. Each step is a single
+``DELETE ... WHERE`` or ``UPDATE ... WHERE`` statement, so no rows are
+loaded into the session however many depend on the record. The same plan
+run as a dry run counts the rows each step would touch instead.
+"""
+from dataclasses import dataclass
+from typing import Any, Collection, Dict, Tuple
+
+from sqlalchemy import delete, func, update
+from sqlalchemy.orm import Session
+
+from app.models.auth import User
+from app.models.collaborators import ProjectCollaborator
+from app.models.faculty import Faculty
+from app.models.funding import FundingSource, ProjectFunding
+from app.models.projects import Project
+from app.models.publication_authors import PublicationAuthor
+from app.models.publications import Publication
+from app.models.student_research import StudentResearch
+from app.models.students import Student
+
+
+@dataclass(frozen=True)
+class CascadeStep:
+    model: Any
+    # Column holding the key of the record being deleted
+    column: str
+    # "delete" removes the rows, "unlink" sets ``column`` to NULL
+    action: str = "delete"
+
+
+PROJECT_CASCADE: Tuple[CascadeStep, ...] = (
+    CascadeStep(ProjectCollaborator, "project_id"),
+    CascadeStep(StudentResearch, "project_id"),
+    CascadeStep(ProjectFunding, "project_id"),
+    CascadeStep(Publication, "project_id", "unlink"),
+    CascadeStep(Project, "project_id"),
+)
+
+FACULTY_CASCADE: Tuple[CascadeStep, ...] = (
+    CascadeStep(ProjectCollaborator, "faculty_id"),
+    CascadeStep(PublicationAuthor, "faculty_id"),
+    CascadeStep(Project, "principal_investigator_id", "unlink"),
+    CascadeStep(Student, "advisor_id", "unlink"),
+    CascadeStep(User, "faculty_id", "unlink"),
+    CascadeStep(Faculty, "faculty_id"),
+)
+
+FUNDING_SOURCE_CASCADE: Tuple[CascadeStep, ...] = (
+    CascadeStep(ProjectFunding, "funding_id"),
+    CascadeStep(FundingSource, "funding_id"),
+)
+
+
+def cascade_delete(
+    db: Session, plan: Tuple[CascadeStep, ...], keys: Collection[int], dry_run: bool = False
+) -> Dict[str, Dict[str, int]]:
+    """Run ``plan`` for the records with ``keys`` inside the caller's transaction.
+
+    Returns the rows affected per table, split into ``deleted`` and
+    ``unlinked``; with ``dry_run`` nothing is written and the counts are
+    what a real run would affect.
+    """
+    affected = {"deleted": {}, "unlinked": {}}
+    for step in plan:
+        column = getattr(step.model, step.column)
+        condition = column.in_(keys)
+        if dry_run:
+            count = db.query(func.count()).select_from(step.model).filter(condition).scalar()
+        elif step.action == "delete":
+            count = db.execute(delete(step.model).where(condition)).rowcount
+        else:
+            count = db.execute(update(step.model).where(condition).values({step.column: None})).rowcount
+        bucket = affected["deleted" if step.action == "delete" else "unlinked"]
+        bucket[step.model.__tablename__] = count
+    return affected
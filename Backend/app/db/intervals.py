@@ -0,0 +1,83 @@
+"""Date-range indexes over projects and funding allocations.
+
+Each index is a ``SnapshotCache`` of an ``IntervalIndex``, so it is rebuilt
+when its table changes, and list endpoints turn ``?active_on=`` and
+``?overlaps=`` into a primary-key filter instead of scanning date columns.
+When a range matches more than ``INTERVAL_INDEX_MAX_KEYS`` rows the key list
+would outgrow a compact ``IN``, so the range is filtered in SQL instead,
+using the ``(start_date, end_date)`` index.
+"""
+from datetime import date
+from typing import Any, List, Optional
+
+from sqlalchemy import and_, or_, tuple_
+from sqlalchemy.orm import Session
+
+from app.core import config
+from app.core.intervals import IntervalIndex, parse_date_range
+from app.core.snapshots import SnapshotCache
+from app.models.funding import ProjectFunding
+from app.models.projects import Project
+
+
+def _project_index(db: Session) -> IntervalIndex:
+    rows = db.query(Project.project_id, Project.start_date, Project.end_date).filter(
+        Project.start_date.isnot(None)
+    ).all()
+    return IntervalIndex(
+        [row.project_id for row in rows],
+        [row.start_date for row in rows],
+        [row.end_date for row in rows]
+    )
+
+
+def _funding_index(db: Session) -> IntervalIndex:
+    rows = db.query(
+        ProjectFunding.project_id, ProjectFunding.funding_id, ProjectFunding.start_date, ProjectFunding.end_date
+    ).all()
+    return IntervalIndex(
+        [(row.project_id, row.funding_id) for row in rows],
+        [row.start_date for row in rows],
+        [row.end_date for row in rows]
+    )
+
+
+project_intervals = SnapshotCache(
+    _project_index, [Project.__tablename__], config.INTERVAL_INDEX_REFRESH_SECONDS
+)
+funding_intervals = SnapshotCache(
+    _funding_index, [ProjectFunding.__tablename__], config.INTERVAL_INDEX_REFRESH_SECONDS
+)
+
+
+def _interval_criteria(
+    snapshot: SnapshotCache, key, start, end, active_on: Optional[date], overlaps: Optional[str]
+) -> List[Any]:
+    # Validate before building the index
+    ranges = [parse_date_range(overlaps)] if overlaps else []
+    if active_on:
+        ranges.append((active_on, active_on))
+
+    criteria = []
+    for first, last in ranges:
+        keys = snapshot.get().overlapping(first, last)
+        if len(keys) <= config.INTERVAL_INDEX_MAX_KEYS:
+            criteria.append(key.in_(keys))
+        else:
+            criteria.append(and_(start <= last, or_(end.is_(None), end >= first)))
+    return criteria
+
+
+def project_date_criteria(active_on: Optional[date] = None, overlaps: Optional[str] = None) -> List[Any]:
+    """Filters keeping projects running on ``active_on`` and overlapping ``overlaps``."""
+    return _interval_criteria(
+        project_intervals, Project.project_id, Project.start_date, Project.end_date, active_on, overlaps
+    )
+
+
+def funding_date_criteria(active_on: Optional[date] = None, overlaps: Optional[str] = None) -> List[Any]:
+    """Filters keeping funding allocations running on ``active_on`` and overlapping ``overlaps``."""
+    return _interval_criteria(
+        funding_intervals, tuple_(ProjectFunding.project_id, ProjectFunding.funding_id),
+        ProjectFunding.start_date, ProjectFunding.end_date, active_on, overlaps
+    )
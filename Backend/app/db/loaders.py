@@ -0,0 +1,101 @@
+"""Batched loaders shared by endpoints that assemble related records.
+
+Each helper issues a fixed number of queries regardless of how many rows it
+returns, so composite views (portfolios, project details) never fall into
+per-row lookups.
+"""
+from typing import Any, Dict, List
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from app.models.funding import FundingSource, ProjectFunding
+from app.models.projects import Project
+from app.models.publication_authors import PublicationAuthor
+from app.models.publications import Publication
+
+
+def author_summary(author: PublicationAuthor) -> Dict[str, Any]:
+    faculty = author.faculty
+    return {
+        "faculty_id": author.faculty_id,
+        "name": f"{faculty.first_name} {faculty.last_name}" if faculty else None,
+        "author_order": author.author_order,
+        "is_corresponding": author.is_corresponding
+    }
+
+
+def publication_summary(publication: Publication) -> Dict[str, Any]:
+    authors = sorted(publication.authors, key=lambda a: a.author_order)
+    return {
+        "publication_id": publication.publication_id,
+        "title": publication.title,
+        "publication_type": publication.publication_type,
+        "journal_name": publication.journal_name,
+        "publication_date": publication.publication_date,
+        "doi": publication.doi,
+        "citation_count": publication.citation_count,
+        "project_id": publication.project_id,
+        "authors": [author_summary(a) for a in authors]
+    }
+
+
+def project_summary(project: Project, funding_total: float = 0) -> Dict[str, Any]:
+    return {
+        "project_id": project.project_id,
+        "project_title": project.project_title,
+        "description": project.description,
+        "status": project.status,
+        "start_date": project.start_date,
+        "end_date": project.end_date,
+        "budget": project.budget,
+        "dept_id": project.dept_id,
+        "principal_investigator_id": project.principal_investigator_id,
+        "funding_total": funding_total or 0
+    }
+
+
+def load_publications(db: Session, *criteria) -> List[Dict[str, Any]]:
+    """Publications matching ``criteria`` with their ordered authors (two queries)."""
+    publications = db.query(Publication).options(
+        selectinload(Publication.authors).joinedload(PublicationAuthor.faculty)
+    ).filter(*criteria).order_by(Publication.publication_date.desc()).all()
+    return [publication_summary(pub) for pub in publications]
+
+
+def funding_totals_subquery():
+    """Total allocated funding per project, for outer-joining onto projects."""
+    return select(
+        ProjectFunding.project_id,
+        func.sum(ProjectFunding.amount).label("funding_total")
+    ).group_by(ProjectFunding.project_id).subquery()
+
+
+def load_projects(db: Session, *criteria, extra_columns=(), joins=()) -> List[Any]:
+    """Projects matching ``criteria`` with their funding total, in one query.
+
+    Rows are ``(Project, funding_total, *extra_columns)``; ``joins`` are
+    ``(target, onclause)`` pairs needed by the criteria or extra columns.
+    """
+    totals = funding_totals_subquery()
+    query = db.query(Project, totals.c.funding_total, *extra_columns)
+    for target, onclause in joins:
+        query = query.join(target, onclause)
+    return query.outerjoin(
+        totals, totals.c.project_id == Project.project_id
+    ).filter(*criteria).order_by(Project.start_date.desc(), Project.project_id).all()
+
+
+def funding_by_source_type(db: Session, project_ids: List[int]) -> Dict[str, float]:
+    """Allocated funding for ``project_ids`` grouped by funding source type."""
+    if not project_ids:
+        return {}
+    rows = db.query(
+        FundingSource.source_type,
+        func.sum(ProjectFunding.amount)
+    ).join(
+        ProjectFunding, ProjectFunding.funding_id == FundingSource.funding_id
+    ).filter(
+        ProjectFunding.project_id.in_(project_ids)
+    ).group_by(FundingSource.source_type).all()
+    return {source_type: total or 0 for source_type, total in rows}
@@ -3,6 +3,8 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
 
+from app.db.versioning import seed_table_versions, track_table_versions
+
 SQLALCHEMY_DATABASE_URL = "sqlite:///./university_portal.db"
 
 # Create engine with connection arguments suitable for SQLite
@@ -20,6 +22,9 @@ except Exception as e:
 # Create a session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Keep per-table version counters (used for ETags) current on every commit
+track_table_versions(SessionLocal)
+
 # Base class for all models
 Base = declarative_base()
 
@@ -36,7 +41,7 @@ def create_tables():
     try:
         from app.models import (
             departments, faculty, students, projects, 
-            publications, funding, collaborators, student_research, auth
+            publications, funding, collaborators, student_research, auth, versions
         )
         print("✅ All models imported successfully")
         
@@ -50,6 +55,18 @@ def create_tables():
         Base.metadata.create_all(bind=engine)
         print("✅ All tables created successfully")
         
+        # create_all() only adds indexes when it creates the table, so make
+        # sure indexes added to existing models exist in older databases too
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=engine, checkfirst=True)
+        
+        db = SessionLocal()
+        try:
+            seed_table_versions(db, Base.metadata.tables.keys())
+        finally:
+            db.close()
+        
     except Exception as e:
         print(f"❌ Error in create_tables: {e}")
         import traceback
@@ -0,0 +1,70 @@
+"""Set-difference sync of project membership tables.
+
+The current members of a project are read in one query and compared with the
+desired set; the differences are written with at most one bulk DELETE,
+UPDATE and INSERT per table, inside the caller's transaction.
+"""
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from sqlalchemy import delete, insert, inspect, update
+from sqlalchemy.orm import Session
+
+
+def missing_ids(db: Session, model, ids: Iterable[int]) -> List[int]:
+    """The ids in ``ids`` with no row in ``model``, in one query."""
+    wanted = set(ids)
+    if not wanted:
+        return []
+    pk = inspect(model).primary_key[0]
+    found = {row[0] for row in db.query(pk).filter(pk.in_(wanted))}
+    return sorted(wanted - found)
+
+
+def sync_members(
+    db: Session,
+    model,
+    project_id: int,
+    key: str,
+    desired: Mapping[int, Mapping[str, Any]],
+    defaults: Optional[Mapping[str, Any]] = None
+) -> Dict[str, Any]:
+    """Make the ``model`` rows of ``project_id`` match ``desired``.
+
+    ``desired`` maps member ids (the ``key`` column) to column values. Values
+    missing from an entry keep their current value for existing members and
+    come from ``defaults`` for new ones. Returns the member ids added,
+    updated and removed, and how many were left unchanged.
+    """
+    key_column = getattr(model, key)
+    fields = [c.key for c in inspect(model).columns if c.key not in ("project_id", key)]
+    current = {
+        row[0]: dict(zip(fields, row[1:]))
+        for row in db.query(key_column, *(getattr(model, f) for f in fields))
+        .filter(model.project_id == project_id)
+    }
+    defaults = defaults or {}
+
+    added, updated = [], []
+    for member_id, values in desired.items():
+        existing = current.get(member_id)
+        row = {f: values.get(f, (existing or defaults).get(f)) for f in fields}
+        if existing is None:
+            added.append({"project_id": project_id, key: member_id, **row})
+        elif row != existing:
+            updated.append({"project_id": project_id, key: member_id, **row})
+    removed = sorted(set(current) - set(desired))
+
+    if removed:
+        db.execute(delete(model).where(model.project_id == project_id, key_column.in_(removed)))
+    if updated:
+        # Bulk UPDATE by primary key
+        db.execute(update(model), updated)
+    if added:
+        db.execute(insert(model), added)
+
+    return {
+        "added": sorted(row[key] for row in added),
+        "updated": sorted(row[key] for row in updated),
+        "removed": removed,
+        "unchanged": len(desired) - len(added) - len(updated)
+    }
@@ -0,0 +1,230 @@
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event, func, insert, select, update
+from sqlalchemy.orm import Session
+
+# Tables whose writes are bookkeeping and must not bump versions themselves
+UNTRACKED_TABLES = {"table_versions", "change_log"}
+
+_TOUCHED_KEY = "touched_tables"
+# Tables written by the transaction being committed, for commit listeners
+_COMMITTED_KEY = "committed_tables"
+# (table, row key, operation) for every row written in the current transaction
+_CHANGES_KEY = "pending_changes"
+
+
+def _touched(session: Session) -> Set[str]:
+    return session.info.setdefault(_TOUCHED_KEY, set())
+
+
+def _changes(session: Session) -> List[Tuple[str, str, str]]:
+    return session.info.setdefault(_CHANGES_KEY, [])
+
+
+def _row_key(values: Iterable) -> str:
+    return ",".join(str(value) for value in values)
+
+
+def _record_flush(session: Session, flush_context) -> None:
+    """Remember which tables and rows the ORM wrote to during this flush."""
+    touched = _touched(session)
+    changes = _changes(session)
+    for operation, objects in (("insert", session.new), ("update", session.dirty), ("delete", session.deleted)):
+        for obj in list(objects):
+            mapper = getattr(obj, "__mapper__", None)
+            if mapper is None:
+                continue
+            if operation == "update" and not session.is_modified(obj):
+                continue
+            for table in mapper.tables:
+                touched.add(table.name)
+            if mapper.local_table.name not in UNTRACKED_TABLES:
+                key = _row_key(mapper.primary_key_from_instance(obj))
+                changes.append((mapper.local_table.name, key, operation))
+
+
+def _record_bulk_statement(orm_execute_state):
+    """Remember tables and rows written by bulk ``insert``/``update``/``delete`` statements.
+
+    Row keys come from the statement's parameters when they carry the
+    primary key (bulk inserts of association rows, bulk updates by primary
+    key). Otherwise updates and deletes select the keys matching their
+    ``WHERE`` clause before running, and inserts return them via
+    ``RETURNING``, so the log never needs the rows themselves.
+    """
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return None
+    statement = orm_execute_state.statement
+    table = getattr(statement, "table", None)
+    if table is None:
+        return None
+    session = orm_execute_state.session
+    _touched(session).add(table.name)
+    if table.name in UNTRACKED_TABLES:
+        return None
+
+    operation = "insert" if orm_execute_state.is_insert else "update" if orm_execute_state.is_update else "delete"
+    pk = list(table.primary_key.columns)
+    params = orm_execute_state.parameters
+    rows = params if isinstance(params, list) else [params] if params else []
+    changes = _changes(session)
+
+    if rows and all(col.key in row for row in rows for col in pk):
+        changes.extend((table.name, _row_key(row[col.key] for col in pk), operation) for row in rows)
+        return None
+
+    if not orm_execute_state.is_insert:
+        matching = select(*pk)
+        if statement.whereclause is not None:
+            matching = matching.where(statement.whereclause)
+        changes.extend((table.name, _row_key(row), operation) for row in session.execute(matching))
+        return None
+
+    # Inserts with generated keys: make sure the keys are returned, then
+    # hand the caller a replayable copy of the result
+    returned = {column.key for column in statement.exported_columns}
+    missing = [col for col in pk if col.key not in returned]
+    if missing:
+        statement = statement.returning(*missing)
+    result = orm_execute_state.invoke_statement(statement=statement).freeze()
+    for row in result():
+        values = row._mapping
+        changes.append((table.name, _row_key(values[col.key] for col in pk), operation))
+    return result()
+
+
+def _bump_versions(session: Session) -> None:
+    """Increment the version of every table written in the committing transaction."""
+    # Flush pending objects first so they are recorded by _record_flush
+    session.flush()
+
+    tables = _touched(session) - UNTRACKED_TABLES
+    session.info[_TOUCHED_KEY] = set()
+    changes = list(dict.fromkeys(_changes(session)))
+    session.info[_CHANGES_KEY] = []
+    if not tables:
+        return
+
+    bump_table_versions(session, tables)
+    if changes:
+        _append_changes(session, changes)
+    session.info[_COMMITTED_KEY] = tables
+
+
+_commit_listeners: List[Callable[[Set[str]], None]] = []
+
+
+def add_commit_listener(callback: Callable[[Set[str]], None]) -> None:
+    """Call ``callback(tables)`` after every commit that wrote to ``tables``."""
+    _commit_listeners.append(callback)
+
+
+def _notify_commit(session: Session) -> None:
+    tables = session.info.pop(_COMMITTED_KEY, None)
+    if not tables:
+        return
+    for callback in _commit_listeners:
+        try:
+            callback(tables)
+        except Exception as e:
+            print(f"❌ Error in commit listener: {e}")
+
+
+def _discard_touched(session: Session) -> None:
+    session.info.pop(_TOUCHED_KEY, None)
+    session.info.pop(_CHANGES_KEY, None)
+    session.info.pop(_COMMITTED_KEY, None)
+
+
+def _append_changes(session: Session, changes: List[Tuple[str, str, str]]) -> None:
+    from app.models.versions import ChangeLogEntry
+
+    session.execute(
+        insert(ChangeLogEntry),
+        [{"table_name": table, "row_key": key, "operation": operation} for table, key, operation in changes]
+    )
+
+
+def get_change_version(session: Session) -> int:
+    """The latest change version, i.e. the highest ``change_id`` in the change log."""
+    from app.models.versions import ChangeLogEntry
+
+    return session.scalar(select(func.max(ChangeLogEntry.change_id))) or 0
+
+
+def changed_keys(session: Session, table: str, since: int, until: Optional[int] = None) -> Set[str]:
+    """Row keys of ``table`` written after change version ``since`` (up to ``until``)."""
+    from app.models.versions import ChangeLogEntry
+
+    query = select(ChangeLogEntry.row_key).distinct().where(
+        ChangeLogEntry.table_name == table,
+        ChangeLogEntry.change_id > since
+    )
+    if until is not None:
+        query = query.where(ChangeLogEntry.change_id <= until)
+    return set(session.scalars(query))
+
+
+def bump_table_versions(session: Session, tables: Iterable[str]) -> None:
+    """Increment the version counters of ``tables`` inside the current transaction."""
+    from app.models.versions import TableVersion
+
+    tables = set(tables)
+    now = datetime.now(timezone.utc)
+    result = session.execute(
+        update(TableVersion)
+        .where(TableVersion.table_name.in_(tables))
+        .values(version=TableVersion.version + 1, updated_at=now)
+    )
+    if result.rowcount != len(tables):
+        existing = set(session.scalars(
+            select(TableVersion.table_name).where(TableVersion.table_name.in_(tables))
+        ))
+        session.execute(
+            insert(TableVersion),
+            [{"table_name": name, "version": 1, "updated_at": now} for name in tables - existing]
+        )
+
+
+def get_data_version(session: Session) -> int:
+    """A number that grows with every commit that writes to any tracked table."""
+    from app.models.versions import TableVersion
+
+    return session.scalar(select(func.sum(TableVersion.version))) or 0
+
+
+def get_table_versions(session: Session, tables: Iterable[str]) -> Dict[str, Tuple[int, datetime]]:
+    """Return ``{table: (version, updated_at)}`` for the given tables."""
+    from app.models.versions import TableVersion
+
+    rows = session.execute(
+        select(TableVersion.table_name, TableVersion.version, TableVersion.updated_at)
+        .where(TableVersion.table_name.in_(list(tables)))
+    ).all()
+    return {row.table_name: (row.version, row.updated_at) for row in rows}
+
+
+def seed_table_versions(session: Session, tables: Iterable[str]) -> None:
+    """Create version rows for tables that do not have one yet."""
+    from app.models.versions import TableVersion
+
+    tables = set(tables) - UNTRACKED_TABLES
+    existing = set(session.scalars(select(TableVersion.table_name)))
+    missing = tables - existing
+    if missing:
+        now = datetime.now(timezone.utc)
+        session.execute(
+            insert(TableVersion),
+            [{"table_name": name, "version": 0, "updated_at": now} for name in missing]
+        )
+        session.commit()
+
+
+def track_table_versions(session_factory) -> None:
+    """Bump per-table version counters whenever a session commits writes."""
+    event.listen(session_factory, "after_flush", _record_flush)
+    event.listen(session_factory, "do_orm_execute", _record_bulk_statement)
+    event.listen(session_factory, "before_commit", _bump_versions)
+    event.listen(session_factory, "after_commit", _notify_commit)
+    event.listen(session_factory, "after_rollback", _discard_touched)
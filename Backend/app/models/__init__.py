@@ -9,6 +9,7 @@ from .publications import Publication
 from .publication_authors import PublicationAuthor
 from .funding import FundingSource, ProjectFunding
 from .auth import User
+from .versions import TableVersion
 
 __all__ = [
     "Department",
@@ -21,5 +22,6 @@ __all__ = [
     "PublicationAuthor",
     "FundingSource",
     "ProjectFunding",
-    "User"
+    "User",
+    "TableVersion"
 ]
@@ -16,7 +16,7 @@ class User(Base):
     
     # Foreign keys to link to faculty or student
     student_id = Column(Integer, ForeignKey("students.student_id"), nullable=True)
-    faculty_id = Column(Integer, ForeignKey("faculty.faculty_id"), nullable=True)
+    faculty_id = Column(Integer, ForeignKey("faculty.faculty_id", ondelete="SET NULL"), nullable=True)
     
     # Constraints
     __table_args__ = (
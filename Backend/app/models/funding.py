@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Date, ForeignKey, Text, CheckConstraint
+from sqlalchemy import Column, Integer, String, Float, Date, ForeignKey, Text, CheckConstraint, Index
 from sqlalchemy.orm import relationship
 
 from app.db.session import Base
@@ -22,8 +22,8 @@ class FundingSource(Base):
 class ProjectFunding(Base):
     __tablename__ = "project_funding"
 
-    project_id = Column(Integer, ForeignKey("research_projects.project_id"), nullable=False, primary_key=True)
-    funding_id = Column(Integer, ForeignKey("funding_sources.funding_id"), nullable=False, primary_key=True)
+    project_id = Column(Integer, ForeignKey("research_projects.project_id", ondelete="CASCADE"), nullable=False, primary_key=True)
+    funding_id = Column(Integer, ForeignKey("funding_sources.funding_id", ondelete="CASCADE"), nullable=False, primary_key=True)
     amount = Column(Float, CheckConstraint("amount > 0"), nullable=False)
     start_date = Column(Date, nullable=False)
     end_date = Column(Date, nullable=False)
@@ -32,3 +32,8 @@ class ProjectFunding(Base):
     # Relationships
     project = relationship("Project", back_populates="funding")
     funding_source = relationship("FundingSource", back_populates="project_funding")
+
+    __table_args__ = (
+        # Date-range filters (?active_on=, ?overlaps=) that match too many rows for a key list
+        Index('ix_project_funding_dates', 'start_date', 'end_date'),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, Date, ForeignKey, CheckConstraint
+from sqlalchemy import Column, Integer, String, Float, Boolean, Date, ForeignKey, CheckConstraint, Index
 from sqlalchemy.orm import relationship
 
 from app.db.session import Base
@@ -13,8 +13,8 @@ class Project(Base):
     end_date = Column(Date)
     status = Column(String(20), default='Active')
     budget = Column(Float)
-    principal_investigator_id = Column(Integer, ForeignKey("faculty.faculty_id"))
-    dept_id = Column(Integer, ForeignKey("departments.dept_id"))
+    principal_investigator_id = Column(Integer, ForeignKey("faculty.faculty_id", ondelete="SET NULL"), index=True)
+    dept_id = Column(Integer, ForeignKey("departments.dept_id"), index=True)
 
     # Relationships
     department = relationship("Department")
@@ -28,4 +28,6 @@ class Project(Base):
     __table_args__ = (
         CheckConstraint("status IN ('Active', 'Completed', 'On Hold', 'Cancelled')", name='check_status'),
         CheckConstraint('budget >= 0', name='check_budget'),
+        # Date-range filters (?active_on=, ?overlaps=) that match too many rows for a key list
+        Index('ix_research_projects_dates', 'start_date', 'end_date'),
     )
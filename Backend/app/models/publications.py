@@ -13,7 +13,7 @@ class Publication(Base):
     publication_date = Column(Date, nullable=False)
     doi = Column(String(100), unique=True)
     citation_count = Column(Integer, default=0)
-    project_id = Column(Integer, ForeignKey("research_projects.project_id"), nullable=True)
+    project_id = Column(Integer, ForeignKey("research_projects.project_id", ondelete="SET NULL"), nullable=True, index=True)
     
     # Relationships
     project = relationship("Project", back_populates="publications")
@@ -6,8 +6,8 @@ from app.db.session import Base
 class StudentResearch(Base):
     __tablename__ = "student_research"
     
-    student_id = Column(Integer, ForeignKey("students.student_id"), primary_key=True)
-    project_id = Column(Integer, ForeignKey("research_projects.project_id"), primary_key=True)
+    student_id = Column(Integer, ForeignKey("students.student_id", ondelete="CASCADE"), primary_key=True)
+    project_id = Column(Integer, ForeignKey("research_projects.project_id", ondelete="CASCADE"), primary_key=True, index=True)
     start_date = Column(Date, nullable=False)
     end_date = Column(Date, nullable=True)
     role = Column(String(100), nullable=False)
@@ -13,7 +13,7 @@ class Student(Base):
     enrollment_date = Column(Date, nullable=False)
     program_type = Column(String(20))
     dept_id = Column(Integer, ForeignKey("departments.dept_id"))
-    advisor_id = Column(Integer, ForeignKey("faculty.faculty_id"))
+    advisor_id = Column(Integer, ForeignKey("faculty.faculty_id", ondelete="SET NULL"), index=True)
     graduation_date = Column(Date)
 
     # Relationships
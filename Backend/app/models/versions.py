@@ -0,0 +1,27 @@
+from sqlalchemy import Column, DateTime, Index, Integer, String
+from sqlalchemy.sql import func
+
+from app.db.session import Base
+
+class TableVersion(Base):
+    __tablename__ = "table_versions"
+
+    table_name = Column(String(100), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class ChangeLogEntry(Base):
+    """Append-only record of every written row; ``change_id`` is the change version."""
+    __tablename__ = "change_log"
+
+    change_id = Column(Integer, primary_key=True)
+    table_name = Column(String(100), nullable=False)
+    # Primary key value(s) of the written row, comma-separated for composite keys
+    row_key = Column(String(100), nullable=False)
+    operation = Column(String(10), nullable=False)  # 'insert', 'update', 'delete'
+    changed_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_change_log_table_change", "table_name", "change_id"),
+    )
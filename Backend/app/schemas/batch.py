@@ -0,0 +1,32 @@
+from typing import Any, Dict, List, Literal, Optional
+from pydantic import BaseModel, Field
+
+from app.core.config import BATCH_MAX_OPERATIONS
+
+
+class BatchOperation(BaseModel):
+    op: Literal["create", "update", "delete"]
+    id: Optional[int] = None  # Required for update and delete
+    data: Optional[Dict[str, Any]] = None  # Create or update fields
+
+
+class BatchRequest(BaseModel):
+    operations: List[BatchOperation] = Field(..., min_length=1, max_length=BATCH_MAX_OPERATIONS)
+    # All-or-nothing: apply nothing if any operation fails
+    atomic: bool = False
+
+
+class BatchItemResult(BaseModel):
+    index: int
+    op: str
+    status: Literal["created", "updated", "deleted", "failed", "skipped"]
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+
+class BatchResponse(BaseModel):
+    atomic: bool
+    total: int
+    succeeded: int
+    failed: int
+    results: List[BatchItemResult]
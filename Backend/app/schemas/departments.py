@@ -1,5 +1,5 @@
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Optional, List
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class DepartmentBase(BaseModel):
@@ -27,3 +27,7 @@ class DepartmentInDB(DepartmentBase):
 
 class Department(DepartmentInDB):
     pass
+
+
+# Precompiled adapter for list responses
+DepartmentList = TypeAdapter(List[Department])
@@ -1,6 +1,6 @@
-from typing import Optional
+from typing import Optional, List
 from datetime import date
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, Field, EmailStr, TypeAdapter
 
 
 class FacultyBase(BaseModel):
@@ -40,3 +40,7 @@ class FacultyInDB(FacultyBase):
 
 class Faculty(FacultyInDB):
     pass
+
+
+# Precompiled adapter for list responses
+FacultyList = TypeAdapter(List[Faculty])
@@ -1,6 +1,6 @@
 from typing import List, Optional
 from datetime import date
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 # Base schema for FundingSource
 class FundingSourceBase(BaseModel):
@@ -23,6 +23,9 @@ class FundingSourceInDB(FundingSourceBase):
     class Config:
         from_attributes = True
 
+# Precompiled adapter for FundingSource list responses
+FundingSourceList = TypeAdapter(List[FundingSourceInDB])
+
 # Schema for FundingSource with funding details
 class FundingSourceWithProjects(FundingSourceInDB):
     projects: List[dict] = []
@@ -1,6 +1,6 @@
 from typing import Optional, List
 from datetime import date
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class ProjectBase(BaseModel):
@@ -18,7 +18,7 @@ class ProjectCreate(ProjectBase):
     pass
 
 
-class ProjectUpdate(BaseModel):
+class ProjectFieldsUpdate(BaseModel):
     project_title: Optional[str] = Field(None, min_length=1, max_length=200)
     description: Optional[str] = Field(None, max_length=1000)
     start_date: Optional[date] = None
@@ -28,8 +28,17 @@ class ProjectUpdate(BaseModel):
     principal_investigator_id: Optional[int] = None
     dept_id: Optional[int] = None
 
+
+class ProjectUpdate(ProjectFieldsUpdate):
+    # Replace the team by id; existing members keep their roles
+    faculty_ids: Optional[List[int]] = None
+    student_ids: Optional[List[int]] = None
+
+
 class ProjectInDB(ProjectBase):
     project_id: int
+    # Cleared when the principal investigator's faculty record is deleted
+    principal_investigator_id: Optional[int] = None
 
     class Config:
         from_attributes = True
@@ -39,6 +48,10 @@ class Project(ProjectInDB):
     pass
 
 
+# Precompiled adapter for list responses
+ProjectList = TypeAdapter(List[Project])
+
+
 # Collaborator schemas
 class ProjectCollaboratorBase(BaseModel):
     project_id: int
@@ -72,3 +85,36 @@ class StudentResearchCreate(StudentResearchBase):
 class StudentResearch(StudentResearchBase):
     class Config:
         from_attributes = True
+
+
+# Team sync schemas
+class TeamCollaborator(BaseModel):
+    faculty_id: int
+    role: str = Field(..., min_length=1, max_length=100)
+    involvement_percentage: Optional[float] = Field(None, ge=0, le=100)
+
+
+class TeamStudent(BaseModel):
+    student_id: int
+    role: str = Field(..., min_length=1, max_length=100)
+    start_date: date
+    end_date: Optional[date] = None
+
+
+class ProjectTeamUpdate(BaseModel):
+    # Omitted lists leave that part of the team untouched; empty lists clear it
+    collaborators: Optional[List[TeamCollaborator]] = None
+    students: Optional[List[TeamStudent]] = None
+
+
+class TeamChanges(BaseModel):
+    added: List[int]
+    updated: List[int]
+    removed: List[int]
+    unchanged: int
+
+
+class ProjectTeamSync(BaseModel):
+    project_id: int
+    collaborators: Optional[TeamChanges] = None
+    students: Optional[TeamChanges] = None
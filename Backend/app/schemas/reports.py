@@ -0,0 +1,44 @@
+from datetime import datetime
+from typing import Annotated, Literal, Optional, Union
+from pydantic import BaseModel, Field
+
+
+class FacultyReportJob(BaseModel):
+    report: Literal["faculty"]
+    dept_id: Optional[int] = None
+    position: Optional[str] = None
+
+
+class ProjectReportJob(BaseModel):
+    report: Literal["projects"]
+    dept_id: Optional[int] = None
+    status: Optional[str] = None
+
+
+class PublicationReportJob(BaseModel):
+    report: Literal["publications"]
+    dept_id: Optional[int] = None
+    year: Optional[int] = None
+    publication_type: Optional[str] = Field(None, alias="type")
+
+    class Config:
+        populate_by_name = True
+
+
+ReportJobRequest = Annotated[
+    Union[FacultyReportJob, ProjectReportJob, PublicationReportJob],
+    Field(discriminator="report")
+]
+
+
+class ReportJob(BaseModel):
+    job_id: str
+    report: str
+    status: Literal["queued", "running", "completed", "failed"]
+    progress: float = Field(..., ge=0, le=1)
+    # True when an identical report built from the same data was reused
+    cached: bool = False
+    error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    result_url: Optional[str] = None  # Set once the job has completed
@@ -1,6 +1,6 @@
-from typing import Optional
+from typing import Optional, List
 from datetime import date
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class StudentBase(BaseModel):
@@ -38,3 +38,7 @@ class StudentInDB(StudentBase):
 
 class Student(StudentInDB):
     pass
+
+
+# Precompiled adapter for list responses
+StudentList = TypeAdapter(List[Student])
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark password hashing costs on this machine.
+
+Times a hash at each candidate cost and recommends the highest cost whose
+hash still fits the target latency. Every login pays one hash verification,
+so the target bounds both login latency and CPU time per login.
+
+Usage:
+    python benchmark_password_hashing.py                      # bcrypt, 250 ms target
+    python benchmark_password_hashing.py --scheme argon2 --target-ms 150 --memory-kib 65536
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+# Add the current directory to sys.path
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from app.core import config
+from app.core.auth import argon2_available, build_password_context
+
+
+def time_hash(context, samples: int) -> float:
+    """Median seconds to hash a password with ``context``."""
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        context.hash("benchmark-password")
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def benchmark(scheme: str, costs, samples: int, **settings):
+    """Yield ``(cost, seconds)`` for each candidate cost."""
+    for cost in costs:
+        if scheme == "bcrypt":
+            context = build_password_context("bcrypt", bcrypt_rounds=cost)
+        else:
+            context = build_password_context("argon2", argon2_time_cost=cost, **settings)
+        yield cost, time_hash(context, samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pick password hashing costs that meet a target latency.")
+    parser.add_argument("--scheme", choices=["bcrypt", "argon2"], default=config.PASSWORD_HASH_SCHEME)
+    parser.add_argument("--target-ms", type=float, default=250.0, help="Acceptable time for one hash")
+    parser.add_argument("--samples", type=int, default=3, help="Hashes timed per cost")
+    parser.add_argument("--memory-kib", type=int, default=config.PASSWORD_ARGON2_MEMORY_KIB, help="argon2 memory cost")
+    parser.add_argument("--parallelism", type=int, default=config.PASSWORD_ARGON2_PARALLELISM, help="argon2 lanes")
+    args = parser.parse_args()
+
+    if args.scheme == "argon2" and not argon2_available():
+        print("❌ argon2-cffi is not installed (pip install argon2-cffi)")
+        sys.exit(1)
+
+    if args.scheme == "bcrypt":
+        costs, setting = range(8, 17), "PASSWORD_BCRYPT_ROUNDS"
+        settings = {}
+    else:
+        costs, setting = range(1, 11), "PASSWORD_ARGON2_TIME_COST"
+        settings = {"argon2_memory_kib": args.memory_kib, "argon2_parallelism": args.parallelism}
+
+    print(f"⏱️  Benchmarking {args.scheme} (target {args.target_ms:.0f} ms per hash, {os.cpu_count()} CPUs)")
+    best = None
+    for cost, seconds in benchmark(args.scheme, costs, args.samples, **settings):
+        ms = seconds * 1000
+        fits = ms <= args.target_ms
+        print(f"   {setting}={cost:<3} {ms:8.1f} ms   ~{1 / seconds:6.1f} logins/s per core {'✅' if fits else ''}")
+        if fits:
+            best = cost
+        elif ms > args.target_ms * 2:
+            # Each step only gets slower from here
+            break
+
+    if best is None:
+        print(f"\n⚠️ Even the lowest cost exceeds {args.target_ms:.0f} ms on this machine")
+        return
+    print(f"\n🔑 Recommended: PASSWORD_HASH_SCHEME={args.scheme} {setting}={best}")
+    if args.scheme == "argon2":
+        print(f"   PASSWORD_ARGON2_MEMORY_KIB={args.memory_kib} PASSWORD_ARGON2_PARALLELISM={args.parallelism}")
+    print("   Existing hashes are upgraded to the new cost as users log in.")
+
+
+if __name__ == "__main__":
+    main()
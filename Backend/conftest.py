@@ -0,0 +1,4 @@
+"""pytest setup for the Backend tests."""
+
+# Switch to the scratch database before any test module imports the app
+import testing  # noqa: F401
@@ -5,14 +5,91 @@ from app.api.routes import (
     departments, faculty, students, projects, publications, 
     funding, collaborators, student_research, analytics, reports, auth
 )
-from app.db.session import create_tables
+from app.core import config
+from app.core.admission import AdmissionControlMiddleware, Bulkhead
+from app.core.auth import ALGORITHM, SECRET_KEY
+from app.core.cache import ResponseCache, ResponseCacheMiddleware
+from app.core.compression import CompressionMiddleware
+from app.core.conditional import ConditionalHeadersMiddleware, NotModified, not_modified_handler
+from app.core.ratelimit import MemoryBackend, RateLimitMiddleware, RateLimitPolicy, RedisBackend
+from app.core.responses import DefaultJSONResponse
+from app.db.session import SessionLocal, create_tables
+from app.db.versioning import add_commit_listener, get_data_version
 
 app = FastAPI(
     title="University Research Portal API",
     description="Comprehensive University Research Management System API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=DefaultJSONResponse
 )
 
+# Answer conditional GETs on versioned endpoints with 304 Not Modified
+app.add_exception_handler(NotModified, not_modified_handler)
+app.add_middleware(ConditionalHeadersMiddleware)
+
+# Bound concurrent report/analytics/batch requests so they cannot take every
+# threadpool worker (added inside the cache so cache hits are never queued)
+admission_bulkheads = [
+    Bulkhead(
+        name, pattern, limit, queue_size,
+        queue_timeout=config.ADMISSION_QUEUE_TIMEOUT_SECONDS,
+        retry_after=config.ADMISSION_RETRY_AFTER_SECONDS
+    )
+    for name, pattern, limit, queue_size in config.ADMISSION_CLASSES
+]
+if config.ADMISSION_CONTROL:
+    app.add_middleware(AdmissionControlMiddleware, bulkheads=admission_bulkheads)
+
+# Serve repeated dashboard/report requests from precompressed cached bodies
+# (added before CORS so CORS headers are computed per request, not cached)
+response_cache = ResponseCache(
+    ttl=config.RESPONSE_CACHE_TTL_SECONDS,
+    max_entries=config.RESPONSE_CACHE_MAX_ENTRIES
+)
+
+
+def current_data_version() -> int:
+    db = SessionLocal()
+    try:
+        return get_data_version(db)
+    finally:
+        db.close()
+
+
+# Entries are keyed by the data version, so writes from any worker bypass
+# them; local commits also drop them straight away to free the memory
+add_commit_listener(lambda tables: response_cache.clear())
+app.add_middleware(
+    ResponseCacheMiddleware,
+    cache=response_cache,
+    path_prefixes=config.RESPONSE_CACHE_PATHS,
+    excluded_prefixes=config.RESPONSE_CACHE_EXCLUDED_PATHS,
+    minimum_size=config.COMPRESSION_MINIMUM_SIZE,
+    compression_level=config.RESPONSE_CACHE_COMPRESSION_LEVEL,
+    version=current_data_version
+)
+
+# Rate-limit logins, reports and batch writes per client (added outside the
+# cache so that cached reports count against the limit too)
+rate_limit_policies = [
+    RateLimitPolicy(
+        "auth", r"/api/auth/(login|register)$", config.RATE_LIMIT_AUTH_BURST, config.RATE_LIMIT_AUTH_PER_MINUTE,
+        methods=("POST",), key="ip"
+    ),
+    # Polling a report job's status or downloading its result is cheap
+    RateLimitPolicy("reports", r"/api/reports/(?!jobs/)", config.RATE_LIMIT_REPORTS_BURST, config.RATE_LIMIT_REPORTS_PER_MINUTE),
+    RateLimitPolicy("bulk", r"/api/[\w-]+/batch$", config.RATE_LIMIT_BULK_BURST, config.RATE_LIMIT_BULK_PER_MINUTE),
+]
+if config.RATE_LIMIT_ENABLED:
+    app.add_middleware(
+        RateLimitMiddleware,
+        policies=rate_limit_policies,
+        backend=RedisBackend(config.RATE_LIMIT_REDIS_URL) if config.RATE_LIMIT_BACKEND == "redis" else MemoryBackend(),
+        secret_key=SECRET_KEY,
+        algorithm=ALGORITHM,
+        trust_forwarded_for=config.RATE_LIMIT_TRUST_FORWARDED_FOR
+    )
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -20,6 +97,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[
+        "X-Next-Cursor", "ETag", "Last-Modified", "X-Change-Version", "Content-Range", "Retry-After",
+        "RateLimit-Limit", "RateLimit-Remaining", "RateLimit-Reset", "RateLimit-Policy"
+    ],
+)
+
+# Compress responses (added last so it wraps everything above)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=config.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=config.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=config.COMPRESSION_BROTLI_QUALITY
 )
 
 # Create tables on startup
@@ -58,6 +147,14 @@ def read_root():
 def health_check():
     return {"status": "healthy", "service": "university-research-portal"}
 
+@app.get("/health/admission")
+def admission_status():
+    """Slots in use, queue lengths and shed request counts per route class"""
+    return {
+        "enabled": config.ADMISSION_CONTROL,
+        "classes": {bulkhead.name: bulkhead.stats() for bulkhead in admission_bulkheads}
+    }
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
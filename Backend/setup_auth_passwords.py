@@ -1,87 +1,78 @@
 #!/usr/bin/env python3
 """
-Script to set up authentication passwords for all existing users.
+Script to set up authentication accounts for all existing faculty and students.
 This script will:
-1. Update all existing faculty and students to have password "password123"
-2. Create admin user with admin@gmail.com and password "admin123"
-3. Ensure all users are properly linked in the users table
+1. Create user accounts for faculty and students who don't have one
+2. Reset passwords whose stored hash is missing or unrecognised
+3. Create admin user with admin@gmail.com and password "admin123"
+
+Accounts are found with a single query, passwords are hashed in parallel on
+every core, and accounts are written in chunked bulk statements.
+
+Usage:
+    python setup_auth_passwords.py                                # everyone gets "password123"
+    python setup_auth_passwords.py --temporary-passwords new.csv  # random password per account
 """
 
-import sys
+import argparse
+import csv
 import os
-from datetime import date
+import secrets
+import sys
+import time
 
 # Add the current directory to sys.path
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
-from sqlalchemy.orm import Session
 from app.db.session import SessionLocal, create_tables
+from app.db.accounts import plan_accounts, provision_accounts
 from app.models.auth import User
-from app.models.faculty import Faculty
-from app.models.students import Student
 from app.core.auth import get_password_hash
 
-def setup_auth_passwords():
-    """Set up authentication passwords for all users."""
+
+def write_temporary_passwords(path, plans):
+    """Save the generated passwords so they can be handed out, readable by the owner only."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["email", "user_type", "temporary_password"])
+        for plan in plans:
+            writer.writerow([plan.email, plan.user_type, plan.password])
+
+
+def setup_auth_passwords(password="password123", temporary_passwords=None, workers=None, chunk_size=1000):
+    """Set up authentication accounts for all users."""
     db = SessionLocal()
     try:
-        print("🔐 Setting up authentication passwords...")
-        
+        print("🔐 Setting up authentication accounts...")
+
         # Create tables if they don't exist
         create_tables()
-        
-        # Get all faculty members
-        faculty_members = db.query(Faculty).all()
-        print(f"📚 Found {len(faculty_members)} faculty members")
-        
-        # Get all students
-        students = db.query(Student).all()
-        print(f"🎓 Found {len(students)} students")
-        
-        # Update or create user accounts for faculty
-        for faculty in faculty_members:
-            # Check if user account exists
-            user = db.query(User).filter(User.faculty_id == faculty.faculty_id).first()
-            
-            if user:
-                # Update password if needed
-                if not user.hashed_password or not user.hashed_password.startswith('$2b$'):
-                    user.hashed_password = get_password_hash("password123")
-                    print(f"✅ Updated password for faculty: {faculty.email}")
-            else:
-                # Create new user account
-                user = User(
-                    email=faculty.email,
-                    hashed_password=get_password_hash("password123"),
-                    user_type="faculty",
-                    is_active=True,
-                    faculty_id=faculty.faculty_id
-                )
-                db.add(user)
-                print(f"✅ Created user account for faculty: {faculty.email}")
-        
-        # Update or create user accounts for students
-        for student in students:
-            # Check if user account exists
-            user = db.query(User).filter(User.student_id == student.student_id).first()
-            
-            if user:
-                # Update password if needed
-                if not user.hashed_password or not user.hashed_password.startswith('$2b$'):
-                    user.hashed_password = get_password_hash("password123")
-                    print(f"✅ Updated password for student: {student.email}")
-            else:
-                # Create new user account
-                user = User(
-                    email=student.email,
-                    hashed_password=get_password_hash("password123"),
-                    user_type="student",
-                    is_active=True,
-                    student_id=student.student_id
-                )
-                db.add(user)
-                print(f"✅ Created user account for student: {student.email}")
-        
+
+        # Everyone without a usable account, in one query
+        plans, conflicts = plan_accounts(db)
+        new_accounts = sum(1 for plan in plans if plan.user_id is None)
+        print(f"📋 {new_accounts} accounts to create, {len(plans) - new_accounts} passwords to reset")
+        for email in conflicts:
+            print(f"⚠️ Skipped {email}: the email is already used by another account")
+
+        for plan in plans:
+            plan.password = secrets.token_urlsafe(12) if temporary_passwords else password
+        if temporary_passwords and plans:
+            write_temporary_passwords(temporary_passwords, plans)
+            print(f"📝 Temporary passwords written to {temporary_passwords}")
+
+        started = time.monotonic()
+
+        def report(done, total):
+            rate = done / max(time.monotonic() - started, 1e-9)
+            print(f"   {done:,}/{total:,} accounts ({done * 100 // total}%), {rate:,.0f}/s")
+
+        workers = workers or os.cpu_count()
+        print(f"⚙️  Hashing with {workers} worker processes")
+        counts = provision_accounts(db, plans, workers=workers, chunk_size=chunk_size, progress=report)
+        print(f"✅ Created {counts['created']} accounts and reset {counts['reset']} passwords")
+
         # Create admin user if it doesn't exist
         admin_user = db.query(User).filter(User.email == "admin@gmail.com").first()
         if not admin_user:
@@ -97,27 +88,30 @@ def setup_auth_passwords():
             # Update admin password
             admin_user.hashed_password = get_password_hash("admin123")
             print("✅ Updated admin password")
-        
+
         # Commit all changes
         db.commit()
-        print("🎉 All authentication passwords have been set up successfully!")
-        
+        print("🎉 All authentication accounts have been set up successfully!")
+
         # Print summary
         total_users = db.query(User).count()
         faculty_users = db.query(User).filter(User.user_type == "faculty").count()
         student_users = db.query(User).filter(User.user_type == "student").count()
         admin_users = db.query(User).filter(User.user_type == "admin").count()
-        
+
         print(f"\n📊 User Summary:")
         print(f"   Total users: {total_users}")
         print(f"   Faculty users: {faculty_users}")
         print(f"   Student users: {student_users}")
         print(f"   Admin users: {admin_users}")
-        
+
         print(f"\n🔑 Default Passwords:")
-        print(f"   Faculty/Students: password123")
+        if temporary_passwords:
+            print(f"   New faculty/student accounts: see {temporary_passwords}")
+        else:
+            print(f"   Faculty/Students: {password}")
         print(f"   Admin: admin123")
-        
+
     except Exception as e:
         print(f"❌ Error setting up authentication: {e}")
         db.rollback()
@@ -126,5 +120,15 @@ def setup_auth_passwords():
     finally:
         db.close()
 
+
 if __name__ == "__main__":
-    setup_auth_passwords()
+    parser = argparse.ArgumentParser(description="Create login accounts for faculty and students.")
+    parser.add_argument("--password", default="password123", help="Initial password for every new account")
+    parser.add_argument(
+        "--temporary-passwords", metavar="CSV",
+        help="Give each account a random password instead, and write them to this CSV file"
+    )
+    parser.add_argument("--workers", type=int, help="Hashing processes (default: one per CPU)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Accounts written per bulk statement")
+    args = parser.parse_args()
+    setup_auth_passwords(args.password, args.temporary_passwords, args.workers, args.chunk_size)
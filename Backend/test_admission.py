@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Tests for the bulkhead slot accounting (app/core/admission.py).
+
+    python test_admission.py      # or: python -m pytest test_admission.py
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from app.core.admission import Bulkhead
+
+
+def bulkhead(limit=1, queue_size=1, queue_timeout=5.0):
+    return Bulkhead("reports", r"^/api/reports", limit, queue_size, queue_timeout, retry_after=1)
+
+
+def test_handoff():
+    """A released slot goes straight to the next waiter, in arrival order"""
+    async def scenario():
+        b = bulkhead(limit=1, queue_size=2)
+        assert await b.acquire()
+        first = asyncio.create_task(b.acquire())
+        second = asyncio.create_task(b.acquire())
+        await asyncio.sleep(0)
+        assert b.stats()["waiting"] == 2
+
+        b.release()
+        assert await first is True
+        assert not second.done()
+        assert b.active == 1
+
+        b.release()
+        assert await second is True
+        b.release()
+        assert b.active == 0 and b.stats()["waiting"] == 0
+        assert b.admitted == 3 and b.shed == 0
+
+    asyncio.run(scenario())
+
+
+def test_queue_full_is_shed():
+    """Requests beyond the slots and the queue are rejected without waiting"""
+    async def scenario():
+        b = bulkhead(limit=1, queue_size=1)
+        assert await b.acquire()
+        waiting = asyncio.create_task(b.acquire())
+        await asyncio.sleep(0)
+        assert await b.acquire() is False
+        assert b.shed == 1 and b.timed_out == 0
+
+        b.release()
+        assert await waiting is True
+        b.release()
+        assert b.active == 0
+
+    asyncio.run(scenario())
+
+
+def test_timeout():
+    """A waiter that times out is shed and leaves the slot count unchanged"""
+    async def scenario():
+        b = bulkhead(limit=1, queue_size=1, queue_timeout=0.01)
+        assert await b.acquire()
+        assert await b.acquire() is False
+        assert b.timed_out == 1 and b.shed == 1
+        assert b.active == 1 and b.stats()["waiting"] == 0
+        b.release()
+        assert b.active == 0
+
+    asyncio.run(scenario())
+
+
+def test_timeout_after_handoff():
+    """A slot handed over just as the wait times out is kept, not leaked"""
+    async def scenario():
+        b = bulkhead(limit=1, queue_size=1)
+        assert await b.acquire()
+
+        async def late_wait_for(waiter, timeout):
+            # What wait_for can do since Python 3.12: the result is set, then it times out
+            b.release()
+            raise asyncio.TimeoutError
+
+        wait_for = asyncio.wait_for
+        asyncio.wait_for = late_wait_for
+        try:
+            assert await b.acquire() is True
+        finally:
+            asyncio.wait_for = wait_for
+        assert b.timed_out == 0 and b.active == 1
+        b.release()
+        assert b.active == 0
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter():
+    """A client that goes away while queued gives up its place, or its slot"""
+    async def scenario():
+        b = bulkhead(limit=1, queue_size=1)
+        assert await b.acquire()
+
+        waiting = asyncio.create_task(b.acquire())
+        await asyncio.sleep(0)
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+        assert b.stats()["waiting"] == 0 and b.active == 1
+
+        # Cancelled after the slot was handed over but before it ran
+        waiting = asyncio.create_task(b.acquire())
+        await asyncio.sleep(0)
+        b.release()
+        waiting.cancel()
+        [outcome] = await asyncio.gather(waiting, return_exceptions=True)
+        if outcome is True:
+            # Some Python versions let the wait finish with the slot instead
+            b.release()
+        assert b.active == 0 and b.stats()["waiting"] == 0
+
+    asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    test_handoff()
+    test_queue_full_is_shed()
+    test_timeout()
+    test_timeout_after_handoff()
+    test_cancelled_waiter()
+    print("✅ Admission control tests passed")
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+In-process tests for the API endpoints.
+
+Runs the app against a scratch copy of the database (see testing.py), so no
+server is needed and the development database is left untouched. Run from
+the Backend directory:
+
+    python test_endpoints.py      # or: python -m pytest test_endpoints.py
+"""
+
+from testing import api_client
+
+client = api_client()
+client.__enter__()
+
+ENDPOINTS = [
+    "/api/departments/",
+    "/api/faculty/",
+    "/api/students/",
+    "/api/projects/",
+    "/api/publications",
+    "/api/funding-sources",
+    "/api/funding-sources?type=Government",
+    "/api/funding-sources/summary",
+    "/api/project-funding",
+    "/api/analytics/dashboard",
+    "/api/analytics/funding-trends",
+    "/api/analytics/publications-by-department",
+    "/api/reports/faculty",
+    "/api/reports/projects",
+    "/api/reports/publications",
+    "/api/project-collaborators/",
+    "/api/project-collaborators/?sort=-faculty_name",
+    "/api/student-research/",
+    "/api/student-research/?sort=-start_date",
+    "/api/analytics/overview",
+    "/api/projects/?principal_investigator_id=1",
+    "/api/publications?faculty_id=1",
+    "/api/faculty/1/portfolio",
+    "/api/students/1/portfolio",
+    "/api/projects/1/full",
+    "/api/faculty/?fields=first_name,last_name",
+    "/api/publications?fields=title,authors",
+    "/api/faculty/?since=0",
+    "/api/publications?since=0",
+    "/health/admission",
+    "/api/reports/publications?year=2023",
+    "/api/analytics/departments",
+    "/api/analytics/departments?sort=-faculty_count",
+    "/api/analytics/pivot?measure=citations&by=department",
+    "/api/analytics/pivot?measure=funding&by=source_type&by=year",
+    "/api/analytics/funding-burn?period=year",
+    "/api/analytics/funding-burn?period=month&granularity=month",
+    "/api/projects/active",
+    "/api/projects/?active_on=2023-06-01",
+    "/api/projects/?overlaps=2023-01-01,2023-12-31",
+    "/api/project-funding?active_on=2023-06-01",
+]
+
+
+def test_endpoints():
+    """Every endpoint answers 200"""
+    failures = []
+    for path in ENDPOINTS:
+        response = client.get(path)
+        if response.status_code != 200:
+            failures.append(f"{path}: {response.status_code} {response.text[:200]}")
+    assert not failures, "\n".join(failures)
+
+
+def walk_pages(path, **params):
+    """Follow X-Next-Cursor through every page of a keyset-paginated listing"""
+    rows, cursor = [], None
+    while True:
+        response = client.get(path, params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200, response.text
+        rows += response.json()
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return rows
+
+
+def test_keyset_pagination():
+    """Small pages add up to the full listing, in order and without repeats"""
+    for path, key, sort in (
+        ("/api/project-collaborators/", ("project_id", "faculty_id"), "project_title"),
+        ("/api/student-research/", ("student_id", "project_id"), "-start_date"),
+    ):
+        everything = client.get(path, params={"sort": sort, "limit": 1000}).json()
+        paged = walk_pages(path, sort=sort, limit=3)
+        assert [tuple(row[k] for k in key) for row in paged] == [tuple(row[k] for k in key) for row in everything]
+        assert len({tuple(row[k] for k in key) for row in paged}) == len(paged)
+
+    assert client.get("/api/project-collaborators/", params={"sort": "salary"}).status_code == 400
+    assert client.get("/api/project-collaborators/", params={"cursor": "not-a-cursor"}).status_code == 400
+
+
+def create_faculty(email, **fields):
+    data = {"first_name": "Test", "last_name": "Member", "email": email, "hire_date": "2024-01-15", "dept_id": 1}
+    response = client.post("/api/faculty/", json={**data, **fields})
+    assert response.status_code in (200, 201), response.text
+    return response.json()
+
+
+def test_compressed_cached_reports():
+    """Reports are served compressed, and a write makes the next request recompute them"""
+    response = client.get("/api/reports/faculty", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    before = response.json()["summary"]["total_faculty"]
+    assert client.get("/api/reports/faculty", headers={"Accept-Encoding": "gzip"}).json() == response.json()
+
+    create_faculty("cache-test@example.edu")
+    assert client.get("/api/reports/faculty").json()["summary"]["total_faculty"] == before + 1
+
+
+def test_conditional_get():
+    """A current ETag gets 304 until the table is written to"""
+    response = client.get("/api/departments/")
+    etag = response.headers["ETag"]
+    assert client.get("/api/departments/", headers={"If-None-Match": etag}).status_code == 304
+
+    department = response.json()[0]
+    client.put(f"/api/departments/{department['dept_id']}", json={"research_focus": "Conditional requests"})
+    response = client.get("/api/departments/", headers={"If-None-Match": etag})
+    assert response.status_code == 200 and response.headers["ETag"] != etag
+
+
+def test_overview():
+    """The overview carries the same statistics as the separate dashboard endpoints"""
+    overview = client.get("/api/analytics/overview").json()
+    assert overview["statistics"] == client.get("/api/analytics/dashboard").json()
+    assert overview["funding_trends"] == client.get("/api/analytics/funding-trends").json()
+
+
+def test_faculty_filters():
+    """Faculty filters keep exactly the faculty member's projects and publications"""
+    projects = client.get("/api/projects/", params={"principal_investigator_id": 1}).json()
+    assert projects and all(project["principal_investigator_id"] == 1 for project in projects)
+
+    publications = client.get("/api/publications", params={"faculty_id": 1, "limit": 100}).json()["items"]
+    assert publications
+    assert all(any(author["faculty_id"] == 1 for author in pub["authors"]) for pub in publications)
+    assert len({pub["publication_id"] for pub in publications}) == len(publications)
+
+
+def test_portfolios():
+    portfolio = client.get("/api/faculty/1/portfolio").json()
+    assert portfolio["faculty"]["faculty_id"] == 1
+    assert portfolio["department"]["dept_id"] == portfolio["faculty"]["dept_id"]
+    assert all(advisee["advisor_id"] == 1 for advisee in portfolio["advisees"])
+
+    partial = client.get("/api/faculty/1/portfolio", params={"sections": "department"}).json()
+    assert "department" in partial and "advisees" not in partial
+    assert client.get("/api/faculty/1/portfolio", params={"sections": "salary"}).status_code == 400
+    assert client.get("/api/faculty/999999/portfolio").status_code == 404
+
+    portfolio = client.get("/api/students/1/portfolio").json()
+    assert portfolio["student"]["student_id"] == 1
+    assert portfolio["advisor"]["faculty_id"] == portfolio["student"]["advisor_id"]
+
+
+def test_project_full():
+    """The aggregate matches the separate listings for the project"""
+    full = client.get("/api/projects/1/full").json()
+    collaborators = client.get("/api/project-collaborators/", params={"project_id": 1}).json()
+    assert sorted(c["faculty_id"] for c in full["collaborators"]) == sorted(c["faculty_id"] for c in collaborators)
+    assert full["department"]["dept_id"] == full["dept_id"]
+    assert client.get("/api/projects/999999/full").status_code == 404
+
+
+def test_sparse_fieldsets():
+    """Only the requested fields (plus the key) are returned"""
+    faculty = client.get("/api/faculty/", params={"fields": "first_name,email"}).json()
+    assert faculty and all(set(member) == {"faculty_id", "first_name", "email"} for member in faculty)
+
+    publications = client.get("/api/publications", params={"fields": "title"}).json()["items"]
+    assert publications and all(set(pub) == {"publication_id", "title"} for pub in publications)
+
+    assert client.get("/api/faculty/", params={"fields": "password"}).status_code == 400
+
+
+def test_batch_operations():
+    """Valid items are applied, invalid ones reported, and failed items claim no unique values"""
+    faculty = {"first_name": "Batch", "last_name": "Member", "hire_date": "2024-01-15", "dept_id": 1}
+    response = client.post("/api/faculty/batch", json={"operations": [
+        {"op": "create", "data": {**faculty, "email": "batch-claim@example.edu", "dept_id": 999999}},
+        {"op": "update", "id": 999999, "data": {"email": "batch-other@example.edu"}},
+        {"op": "create", "data": {**faculty, "email": "batch-claim@example.edu"}},
+        {"op": "create", "data": {**faculty, "email": "batch-other@example.edu"}},
+        {"op": "create", "data": {**faculty, "email": "batch-claim@example.edu"}},
+        {"op": "create", "data": {**faculty}},
+    ]})
+    assert response.status_code == 207
+    results = response.json()["results"]
+    assert [r["status"] for r in results] == ["failed", "failed", "created", "created", "failed", "failed"]
+    assert "already exists" in results[4]["error"]
+
+    # Atomic batches write nothing when an item fails
+    response = client.post("/api/faculty/batch", json={"atomic": True, "operations": [
+        {"op": "create", "data": {**faculty, "email": "batch-atomic@example.edu"}},
+        {"op": "delete", "id": 999999},
+    ]})
+    assert response.status_code == 400
+    assert [r["status"] for r in response.json()["results"]] == ["skipped", "failed"]
+    emails = {member["email"] for member in client.get("/api/faculty/").json()}
+    assert "batch-atomic@example.edu" not in emails
+
+
+def test_team_sync():
+    """The team becomes exactly the given set; omitted lists are left alone"""
+    students_before = client.get("/api/student-research/", params={"project_id": 2}).json()
+    team = {"collaborators": [
+        {"faculty_id": 1, "role": "Co-Investigator", "involvement_percentage": 20},
+        {"faculty_id": 3, "role": "Advisor", "involvement_percentage": 10},
+    ]}
+    assert client.put("/api/projects/2/team", json=team).status_code == 200
+
+    collaborators = client.get("/api/project-collaborators/", params={"project_id": 2}).json()
+    assert sorted((c["faculty_id"], c["role"]) for c in collaborators) == [(1, "Co-Investigator"), (3, "Advisor")]
+    assert client.get("/api/student-research/", params={"project_id": 2}).json() == students_before
+
+    team["collaborators"].append({"faculty_id": 999999, "role": "Ghost"})
+    assert client.put("/api/projects/2/team", json=team).status_code == 404
+
+
+def test_cascading_delete():
+    """A dry run reports what a delete would remove; the delete removes it"""
+    project = client.post("/api/projects/", json={
+        "project_title": "Cascade test", "start_date": "2024-01-01", "status": "Active", "dept_id": 1,
+        "principal_investigator_id": 1,
+    }).json()
+    project_id = project["project_id"]
+    client.post("/api/project-collaborators/json", json={"project_id": project_id, "faculty_id": 1, "role": "Lead"})
+
+    plan = client.delete(f"/api/projects/{project_id}", params={"dry_run": True}).json()
+    assert plan["dry_run"] and plan["deleted"]["project_collaborators"] == 1
+    assert client.get(f"/api/projects/{project_id}").status_code == 200
+
+    assert client.delete(f"/api/projects/{project_id}").status_code == 200
+    assert client.get(f"/api/projects/{project_id}").status_code == 404
+    assert client.get("/api/project-collaborators/", params={"project_id": project_id}).json() == []
+
+
+def test_delta_sync():
+    """Changed and deleted rows since a version, including embedded authors"""
+    version = int(client.get("/api/faculty/").headers["X-Change-Version"])
+    member = create_faculty("delta-test@example.edu")
+    delta = client.get("/api/faculty/", params={"since": version}).json()
+    assert [m["faculty_id"] for m in delta["changed"]] == [member["faculty_id"]] and delta["deleted"] == []
+
+    version = delta["version"]
+    client.delete(f"/api/faculty/{member['faculty_id']}")
+    delta = client.get("/api/faculty/", params={"since": version}).json()
+    assert delta["changed"] == [] and delta["deleted"] == [member["faculty_id"]]
+
+    # Adding an author changes the publication as clients see it
+    version = delta["version"]
+    publication = client.get("/api/publications", params={"limit": 1}).json()["items"][0]
+    author = create_faculty("delta-author@example.edu")
+    client.post("/api/publications/authors", json={
+        "publication_id": publication["publication_id"], "faculty_id": author["faculty_id"], "author_order": 9
+    })
+    changed = client.get("/api/publications", params={"since": version}).json()["changed"]
+    assert [p["publication_id"] for p in changed] == [publication["publication_id"]]
+    assert author["faculty_id"] in [a["faculty_id"] for a in changed[0]["authors"]]
+
+    assert client.get("/api/faculty/", params={"since": 10 ** 9}).status_code == 410
+
+
+def test_report_jobs():
+    """A job runs in the background; its result downloads in full or by range"""
+    import time
+
+    response = client.post("/api/reports/jobs", json={"report": "faculty"})
+    assert response.status_code in (200, 202)
+    job_id = response.json()["job_id"]
+    for _ in range(100):
+        job = client.get(f"/api/reports/jobs/{job_id}").json()
+        if job["status"] in ("completed", "failed"):
+            break
+        time.sleep(0.05)
+    assert job["status"] == "completed", job
+
+    result = client.get(f"/api/reports/jobs/{job_id}/result")
+    assert result.status_code == 200
+    assert result.json()["summary"] == client.get("/api/reports/faculty").json()["summary"]
+    partial = client.get(f"/api/reports/jobs/{job_id}/result", headers={"Range": "bytes=0-9"})
+    assert partial.status_code == 206 and partial.content == result.content[:10]
+
+    # Unchanged data: the same job is returned
+    assert client.post("/api/reports/jobs", json={"report": "faculty"}).json()["job_id"] == job_id
+    assert client.get("/api/reports/jobs/no-such-job").status_code == 404
+
+
+def test_xlsx_exports():
+    """Report datasets download as spreadsheets with one row per record"""
+    import io
+    import zipfile
+
+    response = client.get("/api/reports/publications", params={"format": "xlsx"})
+    assert response.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(response.content)) as workbook:
+        sheet = workbook.read("xl/worksheets/sheet1.xml").decode()
+    total = client.get("/api/reports/publications").json()["summary"]["total_publications"]
+    assert sheet.count("<row>") == total + 1
+
+    response = client.get("/api/project-funding", params={"format": "xlsx"})
+    assert response.status_code == 200 and response.content[:2] == b"PK"
+    assert client.get("/api/project-funding", params={"format": "csv"}).status_code == 422
+
+
+def test_admission_stats():
+    classes = client.get("/health/admission").json()["classes"]
+    assert set(classes) == {"reports", "analytics", "batch"}
+    assert all(stats["active"] == 0 for stats in classes.values())
+
+
+def test_publication_report_summary():
+    """Facet counts agree with the listed publications"""
+    report = client.get("/api/reports/publications").json()
+    publications = report["publications"]
+    summary = report["summary"]
+    assert summary["total_publications"] == len(publications)
+    assert summary["total_citations"] == sum(p["citation_count"] or 0 for p in publications)
+    assert sum(summary["by_type"].values()) == len(publications)
+    assert sum(summary["by_year"].values()) == len(publications)
+
+
+def test_department_analytics():
+    """All departments at once, matching the per-department endpoint"""
+    departments = client.get("/api/analytics/departments", params={"sort": "-faculty_count"}).json()
+    counts = [d["faculty_count"] for d in departments]
+    assert counts == sorted(counts, reverse=True)
+    single = client.get(f"/api/analytics/department/{departments[0]['dept_id']}").json()
+    assert single["faculty_count"] == departments[0]["faculty_count"]
+    assert client.get("/api/analytics/departments", params={"sort": "salary"}).status_code == 400
+
+
+def test_pivot():
+    """Cells add up to the total, and totals match the source data"""
+    pivot = client.get("/api/analytics/pivot", params={"measure": "citations", "by": ["department", "year"]}).json()
+    assert sum(row["value"] for row in pivot["rows"]) == pivot["total"]
+    publications = client.get("/api/reports/publications").json()["publications"]
+    assert pivot["total"] == sum(p["citation_count"] or 0 for p in publications)
+
+    count = client.get("/api/analytics/pivot", params={"measure": "publications", "type": "Journal"}).json()
+    assert count["total"] == sum(1 for p in publications if p["publication_type"] == "Journal")
+    assert client.get("/api/analytics/pivot", params={"measure": "salary"}).status_code == 400
+
+
+def test_funding_burn():
+    """Prorating keeps the total of the allocations"""
+    allocations = client.get("/api/project-funding", params={"limit": 100}).json()["items"]
+    for period in ("month", "year"):
+        burn = client.get("/api/analytics/funding-burn", params={"period": period}).json()
+        assert abs(burn["total"] - sum(a["amount"] for a in allocations)) < 0.01
+        # Periods are rounded to cents separately
+        assert abs(sum(p["amount"] for p in burn["series"]) - burn["total"]) < 0.01 * len(burn["series"])
+
+
+def test_date_range_filters():
+    """active_on and overlaps keep the rows whose date range includes or meets the given one"""
+    projects = client.get("/api/projects/", params={"limit": 100}).json()
+
+    def running(project, first, last):
+        return project["start_date"] <= last and (project["end_date"] is None or project["end_date"] >= first)
+
+    active = client.get("/api/projects/", params={"active_on": "2023-06-01", "limit": 100}).json()
+    assert {p["project_id"] for p in active} == {p["project_id"] for p in projects if running(p, "2023-06-01", "2023-06-01")}
+    overlapping = client.get("/api/projects/", params={"overlaps": "2024-01-01,2024-03-31", "limit": 100}).json()
+    assert {p["project_id"] for p in overlapping} == {p["project_id"] for p in projects if running(p, "2024-01-01", "2024-03-31")}
+
+    assert client.get("/api/projects/", params={"overlaps": "2024-03-31,2024-01-01"}).status_code == 400
+
+
+if __name__ == "__main__":
+    test_endpoints()
+    test_keyset_pagination()
+    test_compressed_cached_reports()
+    test_conditional_get()
+    test_overview()
+    test_faculty_filters()
+    test_portfolios()
+    test_project_full()
+    test_sparse_fieldsets()
+    test_batch_operations()
+    test_team_sync()
+    test_cascading_delete()
+    test_delta_sync()
+    test_report_jobs()
+    test_xlsx_exports()
+    test_admission_stats()
+    test_publication_report_summary()
+    test_department_analytics()
+    test_pivot()
+    test_funding_burn()
+    test_date_range_filters()
+    print("✅ All endpoint tests passed")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for ranged file downloads (app/core/files.py).
+
+    python test_file_ranges.py      # or: python -m pytest test_file_ranges.py
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.core.files import _parse_range, ranged_file_response
+
+CONTENT = bytes(range(256)) * 4
+
+
+def raises_value_error(header, size):
+    try:
+        _parse_range(header, size)
+    except ValueError:
+        return True
+    return False
+
+
+def test_parse_range():
+    """Ranges resolve to inclusive offsets, clamped to the file"""
+    assert _parse_range("bytes=0-99", 1000) == (0, 99)
+    assert _parse_range("bytes=900-", 1000) == (900, 999)
+    assert _parse_range("bytes=900-5000", 1000) == (900, 999)
+    assert _parse_range("bytes=999-999", 1000) == (999, 999)
+
+
+def test_suffix_ranges():
+    """bytes=-N is the last N bytes, or the whole file when it is shorter"""
+    assert _parse_range("bytes=-100", 1000) == (900, 999)
+    assert _parse_range("bytes=-5000", 1000) == (0, 999)
+    assert raises_value_error("bytes=-0", 1000)
+
+
+def test_unsatisfiable_ranges():
+    """Well-formed ranges outside the file are rejected (416)"""
+    assert raises_value_error("bytes=1000-", 1000)
+    assert raises_value_error("bytes=1000-1100", 1000)
+    assert raises_value_error("bytes=0-", 0)
+
+
+def test_ignored_ranges():
+    """Anything not understood falls back to the whole file"""
+    for header in ("bytes=0-1,5-9", "items=0-9", "bytes=abc", "bytes=-", "bytes=50-10", ""):
+        assert _parse_range(header, 1000) is None, header
+
+
+def test_ranged_file_response():
+    """Full, partial and unsatisfiable downloads through the response helper"""
+    with tempfile.NamedTemporaryFile(delete=False) as f:
+        f.write(CONTENT)
+    app = FastAPI()
+
+    @app.get("/file")
+    def download(request: Request):
+        return ranged_file_response(request, f.name, "application/octet-stream", "data.bin")
+
+    try:
+        client = TestClient(app)
+        response = client.get("/file")
+        assert response.status_code == 200
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.content == CONTENT
+
+        response = client.get("/file", headers={"Range": "bytes=100-199"})
+        assert response.status_code == 206
+        assert response.headers["content-range"] == f"bytes 100-199/{len(CONTENT)}"
+        assert response.content == CONTENT[100:200]
+
+        response = client.get("/file", headers={"Range": "bytes=-10"})
+        assert response.status_code == 206
+        assert response.content == CONTENT[-10:]
+
+        response = client.get("/file", headers={"Range": f"bytes={len(CONTENT)}-"})
+        assert response.status_code == 416
+        assert response.headers["content-range"] == f"bytes */{len(CONTENT)}"
+
+        # A stale If-Range validator gets the whole file
+        response = client.get("/file", headers={"Range": "bytes=0-9", "If-Range": '"stale"'})
+        assert response.status_code == 200
+        assert response.content == CONTENT
+    finally:
+        os.unlink(f.name)
+
+
+if __name__ == "__main__":
+    test_parse_range()
+    test_suffix_ranges()
+    test_unsatisfiable_ranges()
+    test_ignored_ranges()
+    test_ranged_file_response()
+    print("✅ File range tests passed")
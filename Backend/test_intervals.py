@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for the date interval index (app/core/intervals.py).
+
+    python test_intervals.py      # or: python -m pytest test_intervals.py
+"""
+
+import os
+import sys
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from fastapi import HTTPException
+
+from app.core.intervals import IntervalIndex, parse_date_range
+
+INDEX = IntervalIndex(
+    ["spring", "year", "open", "single", "later"],
+    [date(2023, 3, 1), date(2023, 1, 1), date(2022, 6, 1), date(2023, 7, 15), date(2024, 1, 1)],
+    [date(2023, 5, 31), date(2023, 12, 31), None, date(2023, 7, 15), date(2024, 6, 30)],
+)
+
+
+def test_edge_days_are_inclusive():
+    """Intervals include both their first and their last day"""
+    assert sorted(INDEX.active_on(date(2023, 3, 1))) == ["open", "spring", "year"]
+    assert sorted(INDEX.active_on(date(2023, 5, 31))) == ["open", "spring", "year"]
+    assert sorted(INDEX.active_on(date(2023, 6, 1))) == ["open", "year"]
+    assert sorted(INDEX.active_on(date(2023, 7, 15))) == ["open", "single", "year"]
+    assert sorted(INDEX.overlapping(date(2022, 1, 1), date(2023, 1, 1))) == ["open", "year"]
+    assert sorted(INDEX.overlapping(date(2023, 12, 31), date(2024, 1, 1))) == ["later", "open", "year"]
+
+
+def test_open_ends():
+    """An interval without an end stays active indefinitely, but not before its start"""
+    assert INDEX.active_on(date(2030, 1, 1)) == ["open"]
+    assert INDEX.active_on(date(2022, 5, 31)) == []
+    assert INDEX.overlapping(date(2022, 1, 1), date(2022, 5, 31)) == []
+
+
+def test_matches_brute_force():
+    """Every range query agrees with checking each interval"""
+    intervals = [
+        ("spring", date(2023, 3, 1), date(2023, 5, 31)),
+        ("year", date(2023, 1, 1), date(2023, 12, 31)),
+        ("open", date(2022, 6, 1), date.max),
+        ("single", date(2023, 7, 15), date(2023, 7, 15)),
+        ("later", date(2024, 1, 1), date(2024, 6, 30)),
+    ]
+    day = date(2022, 1, 1)
+    while day < date(2025, 1, 1):
+        last = day + timedelta(days=45)
+        expected = sorted(key for key, start, end in intervals if start <= last and end >= day)
+        assert sorted(INDEX.overlapping(day, last)) == expected, day
+        day += timedelta(days=17)
+
+
+def test_empty_index():
+    empty = IntervalIndex([], [], [])
+    assert len(empty) == 0
+    assert empty.active_on(date(2023, 1, 1)) == []
+
+
+def test_parse_date_range():
+    assert parse_date_range("2023-01-01, 2023-06-30") == (date(2023, 1, 1), date(2023, 6, 30))
+    for value in ("2023-01-01", "2023-01-01,2023-13-01", "a,b", "2023-06-30,2023-01-01"):
+        try:
+            parse_date_range(value)
+        except HTTPException as e:
+            assert e.status_code == 400
+        else:
+            raise AssertionError(f"{value!r} was accepted")
+
+
+if __name__ == "__main__":
+    test_edge_days_are_inclusive()
+    test_open_ends()
+    test_matches_brute_force()
+    test_empty_index()
+    test_parse_date_range()
+    print("✅ Interval index tests passed")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for the merge patches sent to live dashboards (app/core/broadcast.py).
+
+    python test_merge_patch.py      # or: python -m pytest test_merge_patch.py
+"""
+
+import copy
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from app.core.broadcast import UnrepresentablePatch, merge_patch
+
+
+def apply_patch(target, patch):
+    """Apply a merge patch the way a client does (RFC 7396)"""
+    if not isinstance(patch, dict):
+        return copy.deepcopy(patch)
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = apply_patch(result.get(key), value)
+    return result
+
+
+def assert_round_trip(old, new):
+    patch = merge_patch(old, new)
+    assert apply_patch(old, patch) == new, (old, new, patch)
+    return patch
+
+
+def test_unchanged():
+    assert merge_patch({"a": 1, "b": {"c": [1, 2]}}, {"a": 1, "b": {"c": [1, 2]}}) == {}
+
+
+def test_changed_added_and_removed_keys():
+    patch = assert_round_trip({"a": 1, "b": 2, "c": 3}, {"a": 1, "b": 5, "d": 4})
+    assert patch == {"b": 5, "c": None, "d": 4}
+
+
+def test_nested_objects_are_diffed():
+    """Only the changed members of nested objects are sent"""
+    old = {"totals": {"projects": 10, "faculty": 5}, "by_department": {"CS": {"projects": 4}}}
+    new = {"totals": {"projects": 11, "faculty": 5}, "by_department": {"CS": {"projects": 4}, "EE": {"projects": 1}}}
+    patch = assert_round_trip(old, new)
+    assert patch == {"totals": {"projects": 11}, "by_department": {"EE": {"projects": 1}}}
+
+
+def test_object_emptied():
+    """An object that loses all its members removes each of them"""
+    patch = assert_round_trip({"a": {"x": 1, "y": {"z": 2}}}, {"a": {}})
+    assert patch == {"a": {"x": None, "y": None}}
+
+
+def test_lists_are_replaced():
+    patch = assert_round_trip({"top": [{"id": 1}, {"id": 2}]}, {"top": [{"id": 2}]})
+    assert patch == {"top": [{"id": 2}]}
+
+
+def test_type_changes():
+    assert_round_trip({"a": {"x": 1}}, {"a": [1]})
+    assert_round_trip({"a": 3}, {"a": {"x": 1}})
+
+
+def test_nulls_are_unrepresentable():
+    """A value becoming null cannot be expressed, so callers send a snapshot instead"""
+    cases = [
+        ({"a": 1}, {"a": None}),
+        ({}, {"a": None}),
+        ({"a": {"x": 1}}, {"a": {"x": None}}),
+        ({"a": 1}, {"a": 1, "b": {"x": None}}),
+        ({"a": 1}, {"a": {"x": {"y": None}}}),
+    ]
+    for old, new in cases:
+        try:
+            merge_patch(old, new)
+        except UnrepresentablePatch:
+            pass
+        else:
+            raise AssertionError(f"{old!r} -> {new!r} produced a patch")
+
+    # Nulls that do not change are fine, and lists may hold them
+    assert merge_patch({"a": None, "b": 1}, {"a": None, "b": 2}) == {"b": 2}
+    assert_round_trip({"a": [1]}, {"a": [None, 1]})
+
+
+if __name__ == "__main__":
+    test_unchanged()
+    test_changed_added_and_removed_keys()
+    test_nested_objects_are_diffed()
+    test_object_emptied()
+    test_lists_are_replaced()
+    test_type_changes()
+    test_nulls_are_unrepresentable()
+    print("✅ Merge patch tests passed")
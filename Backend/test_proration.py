@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for funding proration (app/core/proration.py).
+
+    python test_proration.py      # or: python -m pytest test_proration.py
+"""
+
+import os
+import sys
+from datetime import date
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+import numpy as np
+
+from app.core.proration import prorate
+
+
+def series(periods, totals):
+    return {str(period): round(float(total), 6) for period, total in zip(periods, totals)}
+
+
+def test_amounts_are_conserved():
+    """Every amount ends up in some period, whatever the granularity"""
+    rng = np.random.default_rng(0)
+    starts = np.datetime64("2015-01-01") + rng.integers(0, 3000, 500)
+    ends = starts + rng.integers(0, 1500, 500)
+    amounts = rng.random(500) * 1e6
+    for period in ("month", "year"):
+        for granularity in ("day", "month"):
+            _, totals = prorate(starts, ends, amounts, period=period, granularity=granularity)
+            assert abs(totals.sum() - amounts.sum()) < 1e-6 * amounts.sum()
+
+
+def test_daily_proration_of_partial_months():
+    """A grant over 31 days starting mid-December splits 17/14 across the months"""
+    periods, totals = prorate([date(2023, 12, 15)], [date(2024, 1, 14)], [31.0], period="month")
+    assert series(periods, totals) == {"2023-12": 17.0, "2024-01": 14.0}
+
+
+def test_monthly_granularity_splits_evenly():
+    """With month granularity each month touched gets an equal share"""
+    periods, totals = prorate([date(2023, 12, 31)], [date(2024, 2, 1)], [300.0], granularity="month")
+    assert series(periods, totals) == {"2023-12": 100.0, "2024-01": 100.0, "2024-02": 100.0}
+
+
+def test_yearly_periods_and_gaps():
+    """Years between allocations are reported as zero"""
+    periods, totals = prorate(
+        [date(2020, 1, 1), date(2023, 1, 1)], [date(2020, 12, 31), date(2023, 12, 31)], [10.0, 20.0], period="year"
+    )
+    assert series(periods, totals) == {"2020": 10.0, "2021": 0.0, "2022": 0.0, "2023": 20.0}
+
+
+def test_missing_or_reversed_end_uses_start():
+    """A missing end, or one before the start, puts the whole amount on the start"""
+    periods, totals = prorate(
+        [date(2024, 3, 10), date(2024, 5, 10)], [None, date(2024, 1, 1)], [100.0, 50.0], period="month"
+    )
+    assert series(periods, totals) == {"2024-03": 100.0, "2024-04": 0.0, "2024-05": 50.0}
+
+
+def test_empty_input():
+    periods, totals = prorate([], [], [])
+    assert len(periods) == 0 and len(totals) == 0
+
+
+if __name__ == "__main__":
+    test_amounts_are_conserved()
+    test_daily_proration_of_partial_months()
+    test_monthly_granularity_splits_evenly()
+    test_yearly_periods_and_gaps()
+    test_missing_or_reversed_end_uses_start()
+    test_empty_input()
+    print("✅ Proration tests passed")
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Tests for token-bucket rate limiting (app/core/ratelimit.py).
+
+    python test_rate_limit.py      # or: python -m pytest test_rate_limit.py
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.auth import ALGORITHM, SECRET_KEY, create_access_token
+from app.core.ratelimit import MemoryBackend, RateLimitMiddleware, RateLimitPolicy
+from main import rate_limit_policies
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def limited_client(policies, backend=None):
+    """A client for a tiny app whose every route answers 200, behind the rate limiter"""
+    app = FastAPI()
+
+    @app.api_route("/{path:path}", methods=["GET", "POST"])
+    def anything(path: str):
+        return {"path": path}
+
+    app.add_middleware(
+        RateLimitMiddleware, policies=policies, backend=backend or MemoryBackend(),
+        secret_key=SECRET_KEY, algorithm=ALGORITHM
+    )
+    return TestClient(app)
+
+
+def bearer(user_id):
+    return {"Authorization": f"Bearer {create_access_token({'sub': 'x@example.edu', 'user_id': user_id})}"}
+
+
+def test_token_bucket():
+    """Burst, refill at the policy rate up to the burst, and the wait until the next token"""
+    clock = FakeClock()
+    backend = MemoryBackend(clock=clock)
+    policy = RateLimitPolicy("test", r"/", burst=3, per_minute=60)
+
+    def consume():
+        return asyncio.run(backend.consume("client", policy))
+
+    assert [consume().remaining for _ in range(3)] == [2, 1, 0]
+    refused = consume()
+    assert not refused.allowed and refused.retry_after == 1.0 and refused.reset_after == 3.0
+
+    clock.now += 0.5
+    refused = consume()
+    assert not refused.allowed and abs(refused.retry_after - 0.5) < 1e-9
+
+    clock.now += 0.5
+    assert consume().allowed
+    assert not consume().allowed
+
+    # Refills stop at the burst
+    clock.now += 3600
+    assert consume().remaining == 2
+
+
+def test_least_recently_used_buckets_are_dropped():
+    backend = MemoryBackend(max_keys=2, clock=FakeClock())
+    policy = RateLimitPolicy("test", r"/", burst=1, per_minute=1)
+    for key in ("a", "b", "c"):
+        assert asyncio.run(backend.consume(key, policy)).allowed
+    # "a" was dropped and starts full again; "c" is still empty
+    assert asyncio.run(backend.consume("a", policy)).allowed
+    assert not asyncio.run(backend.consume("c", policy)).allowed
+
+
+def test_refusal_headers():
+    client = limited_client([RateLimitPolicy("test", r"/api/", burst=1, per_minute=6)])
+    response = client.get("/api/x")
+    assert response.status_code == 200
+    assert response.headers["RateLimit-Limit"] == "1"
+    assert response.headers["RateLimit-Remaining"] == "0"
+
+    response = client.get("/api/x")
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "10"
+    assert response.headers["RateLimit-Policy"] == "1;w=10"
+
+    # Paths outside every policy are untouched
+    response = client.get("/health")
+    assert response.status_code == 200 and "RateLimit-Limit" not in response.headers
+
+
+def test_client_keys():
+    """Users with a valid token get their own bucket; everyone else shares the IP's"""
+    client = limited_client([RateLimitPolicy("test", r"/api/", burst=1, per_minute=1)])
+    assert client.get("/api/x", headers=bearer(7)).status_code == 200
+    assert client.get("/api/x", headers=bearer(7)).status_code == 429
+    assert client.get("/api/x", headers=bearer(8)).status_code == 200
+
+    assert client.get("/api/x").status_code == 200
+    assert client.get("/api/x").status_code == 429
+    assert client.get("/api/x", headers={"Authorization": "Bearer not-a-token"}).status_code == 429
+    forged = create_access_token({"user_id": 9}).rsplit(".", 1)[0] + ".forged"
+    assert client.get("/api/x", headers={"Authorization": f"Bearer {forged}"}).status_code == 429
+
+    # IP-keyed policies ignore the token
+    client = limited_client([RateLimitPolicy("test", r"/api/", burst=1, per_minute=1, key="ip")])
+    assert client.get("/api/x", headers=bearer(7)).status_code == 200
+    assert client.get("/api/x", headers=bearer(8)).status_code == 429
+
+
+def test_report_jobs_polling_is_exempt():
+    """Job status and result downloads are not limited, but submitting and building reports are"""
+    client = limited_client(rate_limit_policies)
+    reports = next(policy for policy in rate_limit_policies if policy.name == "reports")
+    for _ in range(reports.burst + 5):
+        response = client.get("/api/reports/jobs/abc123")
+        assert response.status_code == 200 and "RateLimit-Limit" not in response.headers
+        assert client.get("/api/reports/jobs/abc123/result").status_code == 200
+
+    statuses = [client.post("/api/reports/jobs").status_code for _ in range(reports.burst + 1)]
+    assert statuses[-1] == 429
+    assert client.get("/api/reports/faculty").status_code == 429
+
+
+if __name__ == "__main__":
+    test_token_bucket()
+    test_least_recently_used_buckets_are_dropped()
+    test_refusal_headers()
+    test_client_keys()
+    test_report_jobs_polling_is_exempt()
+    print("✅ Rate limit tests passed")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming XLSX writer (app/core/xlsx.py).
+
+    python test_xlsx.py      # or: python -m pytest test_xlsx.py
+"""
+
+import io
+import os
+import sys
+import zipfile
+import xml.etree.ElementTree as ET
+from datetime import date, datetime
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from app.core.xlsx import BOOLEAN, DATE, DATETIME, NUMBER, STRING, stream_xlsx
+
+NS = {"x": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+
+COLUMNS = ["id", "title", "active", "start_date", "updated_at"]
+KINDS = [NUMBER, STRING, BOOLEAN, DATE, DATETIME]
+
+
+def read_rows(workbook_bytes):
+    with zipfile.ZipFile(io.BytesIO(workbook_bytes)) as workbook:
+        assert workbook.testzip() is None
+        sheet = ET.fromstring(workbook.read("xl/worksheets/sheet1.xml"))
+    return sheet.findall("x:sheetData/x:row", NS)
+
+
+def test_workbook_parts():
+    data = b"".join(stream_xlsx(COLUMNS, KINDS, [], sheet_name='R&D "2023"'))
+    with zipfile.ZipFile(io.BytesIO(data)) as workbook:
+        assert workbook.namelist() == [
+            "[Content_Types].xml",
+            "_rels/.rels",
+            "xl/workbook.xml",
+            "xl/_rels/workbook.xml.rels",
+            "xl/styles.xml",
+            "xl/worksheets/sheet1.xml",
+        ]
+        sheet = ET.fromstring(workbook.read("xl/workbook.xml")).find("x:sheets/x:sheet", NS)
+        assert sheet.get("name") == 'R&D "2023"'
+
+
+def test_cells():
+    """Header, numbers, booleans, dates, escaped strings and blanks"""
+    rows = [
+        (1, "Quantum <Networks> & Co", True, date(2023, 1, 1), datetime(2023, 1, 1, 12, 0)),
+        (2.5, "tab\there\x00\x07", False, None, None),
+    ]
+    sheet_rows = read_rows(b"".join(stream_xlsx(COLUMNS, KINDS, [rows])))
+    assert len(sheet_rows) == 3
+
+    header = sheet_rows[0].findall("x:c", NS)
+    assert [cell.get("s") for cell in header] == ["3"] * len(COLUMNS)
+    assert [cell.find("x:is/x:t", NS).text for cell in header] == COLUMNS
+
+    number, text, boolean, day, moment = sheet_rows[1].findall("x:c", NS)
+    assert number.find("x:v", NS).text == "1"
+    assert text.get("t") == "inlineStr"
+    assert text.find("x:is/x:t", NS).text == "Quantum <Networks> & Co"
+    assert boolean.get("t") == "b" and boolean.find("x:v", NS).text == "1"
+    # Serial days since 1899-12-30
+    assert day.get("s") == "1" and day.find("x:v", NS).text == "44927"
+    assert moment.get("s") == "2" and float(moment.find("x:v", NS).text) == 44927.5
+
+    number, text, boolean, day, moment = sheet_rows[2].findall("x:c", NS)
+    assert number.find("x:v", NS).text == "2.5"
+    # Control characters XML cannot hold are dropped; tabs are kept
+    assert text.find("x:is/x:t", NS).text == "tab\there"
+    assert boolean.find("x:v", NS).text == "0"
+    assert list(day) == [] and list(moment) == []
+
+
+def test_streams_batches():
+    """Each batch is written out before the next one is read"""
+    consumed = []
+
+    def batches():
+        for i in range(3):
+            consumed.append(i)
+            yield [(n, f"row {n}", n % 2 == 0, None, None) for n in range(i * 1000, (i + 1) * 1000)]
+
+    chunks = []
+    for chunk in stream_xlsx(COLUMNS, KINDS, batches()):
+        chunks.append((chunk, len(consumed)))
+    # The fixed parts come out before any row is read
+    assert chunks[0][1] == 0 and chunks[0][0]
+
+    sheet_rows = read_rows(b"".join(chunk for chunk, _ in chunks))
+    assert len(sheet_rows) == 3001
+    assert sheet_rows[-1].find("x:c/x:v", NS).text == "2999"
+
+
+if __name__ == "__main__":
+    test_workbook_parts()
+    test_cells()
+    test_streams_batches()
+    print("✅ XLSX writer tests passed")
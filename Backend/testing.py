@@ -0,0 +1,34 @@
+"""Shared setup for the in-process API tests.
+
+The app opens ``./university_portal.db`` relative to the working directory
+(SQLAlchemy resolves the path when the engine is created), and startup adds
+its bookkeeping tables and indexes to it. Importing this module therefore
+copies the development database into a temporary directory and moves there,
+so the tracked database is never modified. It must be imported before
+anything from ``app``; conftest.py does that for pytest runs.
+"""
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, BACKEND_DIR)
+
+# The tests make far more report requests than the limits allow; the limiter
+# itself is covered by test_rate_limit.py
+os.environ.setdefault("RATE_LIMIT_ENABLED", "0")
+
+SCRATCH_DIR = tempfile.mkdtemp(prefix="portal-tests-")
+shutil.copy(os.path.join(BACKEND_DIR, "university_portal.db"), SCRATCH_DIR)
+atexit.register(shutil.rmtree, SCRATCH_DIR, True)
+os.chdir(SCRATCH_DIR)
+
+
+def api_client():
+    """A ``TestClient`` for the app, running against the scratch database."""
+    from fastapi.testclient import TestClient
+
+    import main
+    return TestClient(main.app)
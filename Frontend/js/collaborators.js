@@ -240,20 +240,14 @@ document.addEventListener('DOMContentLoaded', function() {
         
         try {
             console.log('📡 Loading collaborators from API...');
-            const response = await fetch(CONFIG.API_BASE_URL + CONFIG.ENDPOINTS.PROJECT_COLLABORATORS);
+            allCollaborators = await fetchAllPages(CONFIG.API_BASE_URL + CONFIG.ENDPOINTS.PROJECT_COLLABORATORS);
+            console.log('Collaborators loaded:', allCollaborators);
             
-            if (response.ok) {
-                allCollaborators = await response.json();
-                console.log('Collaborators loaded:', allCollaborators);
-                
-                // Apply initial filters
-                filterCollaborators();
-                
-                // Load statistics
-                loadStatistics();
-            } else {
-                throw new Error(`HTTP error! status: ${response.status}`);
-            }
+            // Apply initial filters
+            filterCollaborators();
+            
+            // Load statistics
+            loadStatistics();
         } catch (error) {
             console.error('Error loading collaborators:', error);
             showNotification('Failed to load collaborators', 'error');
@@ -37,10 +37,14 @@ const CONFIG = {
         PROJECT_COLLABORATORS: '/api/project-collaborators/',
         
         // Analytics
+        ANALYTICS_OVERVIEW: '/api/analytics/overview',
+        ANALYTICS_STREAM: '/api/analytics/stream',
         ANALYTICS_DASHBOARD: '/api/analytics/dashboard',
         ANALYTICS_DEPARTMENT: '/api/analytics/department',
+        ANALYTICS_DEPARTMENTS: '/api/analytics/departments',
         ANALYTICS_PUBLICATIONS_BY_DEPT: '/api/analytics/publications-by-department',
         ANALYTICS_FUNDING_TRENDS: '/api/analytics/funding-trends',
+        ANALYTICS_FUNDING_BURN: '/api/analytics/funding-burn',
         
         // Reports
         REPORTS_FACULTY: '/api/reports/faculty',
@@ -1,121 +1,130 @@
 // University Research Portal Dashboard functionality
 
-document.addEventListener('DOMContentLoaded', async () => {
+document.addEventListener('DOMContentLoaded', () => {
+    // Live updates where Server-Sent Events are supported, one request otherwise
+    if (window.EventSource) {
+        subscribeToDashboard();
+    } else {
+        loadDashboardOnce();
+    }
+});
+
+/**
+ * Load the dashboard from a single aggregate request
+ */
+async function loadDashboardOnce() {
     try {
-        // Load dashboard data
-        await loadDashboardStats();
-        await loadDashboardCharts();
-        await loadRecentProjects();
-        await loadTopResearchers();
-        await loadResearchAreas();
+        // Everything on the dashboard comes from a single aggregate request
+        const overview = await fetchAPI(CONFIG.ENDPOINTS.ANALYTICS_OVERVIEW);
+        renderDashboard(overview);
         
     } catch (error) {
         console.error('Error loading dashboard:', error);
         showNotification('Error loading dashboard data. Please try again.', 'error');
     }
-});
+}
 
 /**
- * Load and display dashboard statistics
+ * Keep the dashboard current from the analytics stream: a full snapshot on
+ * connect, then merge patches touching only the sections that changed
  */
-async function loadDashboardStats() {
-    try {
-        console.log('🔄 Loading dashboard statistics...');
-        
-        // Use the analytics dashboard endpoint for comprehensive stats
-        const analyticsResponse = await fetch(CONFIG.API_BASE_URL + CONFIG.ENDPOINTS.ANALYTICS_DASHBOARD);
-        
-        if (analyticsResponse.ok) {
-            const analyticsData = await analyticsResponse.json();
-            console.log('📊 Analytics data received:', analyticsData);
-            
-            // Update stat cards with data from analytics endpoint
-            document.getElementById('total-faculty').textContent = analyticsData.faculty_count || 0;
-            document.getElementById('active-projects').textContent = analyticsData.active_projects || 0;
-            document.getElementById('total-publications').textContent = analyticsData.total_publications || 0;
-            
-            // Format total funding using the more accurate total_budget
-            const totalFunding = analyticsData.total_budget || analyticsData.total_project_budget || 0;
-            document.getElementById('total-funding').textContent = `$${(totalFunding / 1000000).toFixed(1)}M`;
-            
-            console.log('✅ Dashboard stats updated successfully');
-            
+function subscribeToDashboard() {
+    let overview = null;
+    const source = new EventSource(`${CONFIG.API_BASE_URL}${CONFIG.ENDPOINTS.ANALYTICS_STREAM}`);
+    
+    source.addEventListener('snapshot', (event) => {
+        overview = JSON.parse(event.data);
+        renderDashboard(overview);
+    });
+    
+    source.addEventListener('patch', (event) => {
+        if (!overview) return;
+        const patch = JSON.parse(event.data);
+        overview = applyMergePatch(overview, patch);
+        renderDashboard(overview, Object.keys(patch));
+    });
+    
+    source.onerror = () => {
+        if (!overview) {
+            // Never connected: fall back to a one-off load
+            source.close();
+            loadDashboardOnce();
         } else {
-            console.warn('⚠️ Analytics endpoint failed, falling back to individual endpoints');
-            console.warn('Response status:', analyticsResponse.status);
-            console.warn('Response text:', await analyticsResponse.text());
-            
-            // Fallback to individual endpoints if analytics fails
-            const [facultyResponse, projectsResponse, publicationsResponse] = await Promise.all([
-                fetch(CONFIG.API_BASE_URL + CONFIG.ENDPOINTS.FACULTY),
-                fetch(CONFIG.API_BASE_URL + CONFIG.ENDPOINTS.PROJECTS),
-                fetch(CONFIG.API_BASE_URL + CONFIG.ENDPOINTS.PUBLICATIONS)
-            ]);
-
-            const facultyData = facultyResponse.ok ? await facultyResponse.json() : [];
-            const projectsData = projectsResponse.ok ? await projectsResponse.json() : [];
-            const publicationsData = publicationsResponse.ok ? await publicationsResponse.json() : [];
-
-            // Update stat cards
-            document.getElementById('total-faculty').textContent = facultyData.length || 0;
-            document.getElementById('active-projects').textContent = 
-                projectsData.filter(p => p.status === 'Active').length || 0;
-            document.getElementById('total-publications').textContent = publicationsData.length || 0;
-            
-            // Calculate total funding
-            const totalFunding = projectsData.reduce((sum, project) => sum + (project.total_budget || 0), 0);
-            document.getElementById('total-funding').textContent = `$${(totalFunding / 1000000).toFixed(1)}M`;
-            
-            console.log('✅ Dashboard stats updated using fallback method');
+            console.warn('⚠️ Dashboard stream interrupted, reconnecting...');
         }
-        
-    } catch (error) {
-        console.error('❌ Error loading stats:', error);
-        // Show error notification
-        showNotification('Error loading dashboard statistics. Please try again.', 'error');
+    };
+}
+
+/**
+ * Apply a JSON merge patch (RFC 7396)
+ * @param {*} target - Current value
+ * @param {*} patch - Patch from the analytics stream
+ * @returns {*} Patched value
+ */
+function applyMergePatch(target, patch) {
+    if (patch === null || typeof patch !== 'object' || Array.isArray(patch)) {
+        return patch;
     }
+    const result = (target && typeof target === 'object' && !Array.isArray(target)) ? { ...target } : {};
+    for (const [key, value] of Object.entries(patch)) {
+        if (value === null) {
+            delete result[key];
+        } else {
+            result[key] = applyMergePatch(result[key], value);
+        }
+    }
+    return result;
 }
 
 /**
- * Load and display dashboard charts
+ * Render dashboard sections from the analytics overview
+ * @param {Object} overview - Analytics overview
+ * @param {Array} [sections] - Top-level keys that changed; all sections when omitted
  */
-async function loadDashboardCharts() {
+function renderDashboard(overview, sections) {
+    const changed = (key) => !sections || sections.includes(key);
+    
+    if (changed('statistics')) loadDashboardStats(overview.statistics);
+    if (changed('funding_trends')) createFundingTrendsChart(overview.funding_trends);
+    if (changed('publications_by_department')) createPublicationsByDepartmentChart(overview.publications_by_department);
+    if (changed('recent_projects')) loadRecentProjects(overview.recent_projects);
+    if (changed('top_researchers')) loadTopResearchers(overview.top_researchers);
+    if (changed('research_areas')) loadResearchAreas(overview.research_areas);
+}
+
+/**
+ * Display dashboard statistics
+ * @param {Object} stats - Statistics section of the analytics overview
+ */
+function loadDashboardStats(stats) {
     try {
-        console.log('🔄 Loading dashboard charts...');
+        console.log('📊 Dashboard statistics:', stats);
         
-        const [projectsData, departmentsData] = await Promise.all([
-            fetchAPI(CONFIG.ENDPOINTS.PROJECTS),
-            fetchAPI(CONFIG.ENDPOINTS.DEPARTMENTS)
-        ]);
-
-        // Create funding trends chart
-        await createFundingTrendsChart();
+        // Update stat cards with data from analytics overview
+        document.getElementById('total-faculty').textContent = stats.faculty_count || 0;
+        document.getElementById('active-projects').textContent = stats.active_projects || 0;
+        document.getElementById('total-publications').textContent = stats.total_publications || 0;
         
-        // Create publications by department chart
-        await createPublicationsByDepartmentChart();
+        // Format total funding using the more accurate total_budget
+        const totalFunding = stats.total_budget || stats.total_project_budget || 0;
+        document.getElementById('total-funding').textContent = `$${(totalFunding / 1000000).toFixed(1)}M`;
         
-        console.log('✅ Dashboard charts loaded successfully');
+        console.log('✅ Dashboard stats updated successfully');
         
     } catch (error) {
-        console.error('❌ Error loading charts:', error);
+        console.error('❌ Error loading stats:', error);
+        // Show error notification
+        showNotification('Error loading dashboard statistics. Please try again.', 'error');
     }
 }
 
 /**
  * Create funding trends chart
+ * @param {Object} fundingByYear - Combined funding keyed by year
  */
-async function createFundingTrendsChart() {
+function createFundingTrendsChart(fundingByYear) {
     try {
         console.log('🔄 Creating funding trends chart...');
-        
-        // Fetch funding trends data from the analytics endpoint
-        const response = await fetch(CONFIG.API_BASE_URL + CONFIG.ENDPOINTS.ANALYTICS_FUNDING_TRENDS);
-        
-        if (!response.ok) {
-            throw new Error(`HTTP error! status: ${response.status}`);
-        }
-        
-        const fundingByYear = await response.json();
         console.log('💰 Funding trends data:', fundingByYear);
         
         if (!fundingByYear || Object.keys(fundingByYear).length === 0) {
@@ -210,50 +219,19 @@ async function createFundingTrendsChart() {
         
     } catch (error) {
         console.error('❌ Error creating funding trends chart:', error);
-        
-        // Fallback: try to create a simple text-based display
-        try {
-            console.log('🔄 Attempting fallback display...');
-            const fallbackResponse = await fetch(CONFIG.API_BASE_URL + CONFIG.ENDPOINTS.PROJECTS);
-            if (fallbackResponse.ok) {
-                const projects = await fallbackResponse.json();
-                const totalBudget = projects.reduce((sum, p) => sum + (p.budget || 0), 0);
-                
-                document.getElementById('funding-chart').innerHTML = `
-                    <div class="flex flex-col items-center justify-center h-64 text-center">
-                        <div class="text-4xl font-bold text-blue-600 mb-2">$${(totalBudget / 1000000).toFixed(1)}M</div>
-                        <div class="text-lg text-gray-600">Total Project Budget</div>
-                        <div class="text-sm text-gray-500 mt-2">Chart temporarily unavailable</div>
-                    </div>
-                `;
-                console.log('✅ Fallback display created successfully');
-            } else {
-                throw new Error('Fallback also failed');
-            }
-        } catch (fallbackError) {
-            console.error('❌ Fallback also failed:', fallbackError);
-            // Show error message in chart area
-            document.getElementById('funding-chart').innerHTML = 
-                '<div class="flex items-center justify-center h-64 text-red-500">Error loading funding trends chart</div>';
-        }
+        // Show error message in chart area
+        document.getElementById('funding-chart').innerHTML = 
+            '<div class="flex items-center justify-center h-64 text-red-500">Error loading funding trends chart</div>';
     }
 }
 
 /**
  * Create publications by department chart
+ * @param {Object} publicationsByDept - Publication counts keyed by department name
  */
-async function createPublicationsByDepartmentChart() {
+function createPublicationsByDepartmentChart(publicationsByDept) {
     try {
         console.log('🔄 Creating publications by department chart...');
-        
-        // Fetch publications by department data from the analytics endpoint
-        const response = await fetch(CONFIG.API_BASE_URL + CONFIG.ENDPOINTS.ANALYTICS_PUBLICATIONS_BY_DEPT);
-        
-        if (!response.ok) {
-            throw new Error(`HTTP error! status: ${response.status}`);
-        }
-        
-        const publicationsByDept = await response.json();
         console.log('📊 Publications by department data:', publicationsByDept);
         
         if (!publicationsByDept || Object.keys(publicationsByDept).length === 0) {
@@ -334,90 +312,54 @@ async function createPublicationsByDepartmentChart() {
         
     } catch (error) {
         console.error('❌ Error creating publications by department chart:', error);
-        
-        // Fallback: try to create a simple text-based display
-        try {
-            console.log('🔄 Attempting fallback display...');
-            const fallbackResponse = await fetch(CONFIG.API_BASE_URL + CONFIG.ENDPOINTS.PUBLICATIONS);
-            if (fallbackResponse.ok) {
-                const publications = await fallbackResponse.json();
-                const totalPubs = publications.length;
-                
-                document.getElementById('publications-chart').innerHTML = `
-                    <div class="flex flex-col items-center justify-center h-64 text-center">
-                        <div class="text-4xl font-bold text-blue-600 mb-2">${totalPubs}</div>
-                        <div class="text-lg text-gray-600">Total Publications</div>
-                        <div class="text-sm text-gray-500 mt-2">Chart temporarily unavailable</div>
-                    </div>
-                `;
-                console.log('✅ Fallback display created successfully');
-            } else {
-                throw new Error('Fallback also failed');
-            }
-        } catch (fallbackError) {
-            console.error('❌ Fallback also failed:', fallbackError);
-            // Show error message in chart area
-            document.getElementById('publications-chart').innerHTML = 
-                '<div class="flex items-center justify-center h-64 text-red-500">Error loading publications chart</div>';
-        }
+        // Show error message in chart area
+        document.getElementById('publications-chart').innerHTML = 
+            '<div class="flex items-center justify-center h-64 text-red-500">Error loading publications chart</div>';
     }
 }
 
 /**
  * Test function for publications chart
  */
-function testPublicationsChart() {
+async function testPublicationsChart() {
     console.log('🧪 Testing publications chart...');
-    createPublicationsByDepartmentChart();
+    const overview = await fetchAPI(CONFIG.ENDPOINTS.ANALYTICS_OVERVIEW);
+    createPublicationsByDepartmentChart(overview.publications_by_department);
 }
 
 /**
  * Test function for funding trends chart
  */
-function testFundingChart() {
+async function testFundingChart() {
     console.log('🧪 Testing funding trends chart...');
-    createFundingTrendsChart();
+    const overview = await fetchAPI(CONFIG.ENDPOINTS.ANALYTICS_OVERVIEW);
+    createFundingTrendsChart(overview.funding_trends);
 }
 
 /**
  * Test function for recent projects
  */
-function testRecentProjects() {
+async function testRecentProjects() {
     console.log('🧪 Testing recent projects...');
-    loadRecentProjects();
+    const overview = await fetchAPI(CONFIG.ENDPOINTS.ANALYTICS_OVERVIEW);
+    loadRecentProjects(overview.recent_projects);
 }
 
 /**
  * Test function for top researchers
  */
-function testTopResearchers() {
+async function testTopResearchers() {
     console.log('🧪 Testing top researchers...');
-    loadTopResearchers();
+    const overview = await fetchAPI(CONFIG.ENDPOINTS.ANALYTICS_OVERVIEW);
+    loadTopResearchers(overview.top_researchers);
 }
 
 /**
- * Load and display recent projects
+ * Display recent projects
+ * @param {Array} recentProjects - Most recent active projects with PI and department names
  */
-async function loadRecentProjects() {
+function loadRecentProjects(recentProjects) {
     try {
-        console.log('🔄 Loading recent projects...');
-        
-        const [projectsData, facultyData, departmentsData] = await Promise.all([
-            fetchAPI(CONFIG.ENDPOINTS.PROJECTS),
-            fetchAPI(CONFIG.ENDPOINTS.FACULTY),
-            fetchAPI(CONFIG.ENDPOINTS.DEPARTMENTS)
-        ]);
-
-        console.log('📊 Projects data:', projectsData);
-        console.log('👥 Faculty data:', facultyData);
-        console.log('🏢 Departments data:', departmentsData);
-
-        // Get 5 most recent active projects
-        const recentProjects = projectsData
-            .filter(p => p.status === 'Active')
-            .sort((a, b) => new Date(b.start_date) - new Date(a.start_date))
-            .slice(0, 5);
-
         console.log('📋 Recent active projects:', recentProjects);
 
         const container = document.getElementById('recent-projects');
@@ -429,9 +371,6 @@ async function loadRecentProjects() {
         }
 
         recentProjects.forEach(project => {
-            const faculty = facultyData.find(f => f.faculty_id === project.principal_investigator_id);
-            const department = departmentsData.find(d => d.dept_id === project.dept_id);
-            
             const projectCard = document.createElement('div');
             projectCard.className = 'border border-gray-200 rounded-lg p-4 hover:shadow-md transition-shadow bg-white';
             projectCard.innerHTML = `
@@ -448,13 +387,13 @@ async function loadRecentProjects() {
                     <div class="flex items-center text-xs text-gray-600">
                         <i class="fas fa-user mr-2 text-blue-500"></i>
                         <span class="font-medium">PI:</span>
-                        <span class="ml-1">${faculty ? `${faculty.first_name} ${faculty.last_name}` : 'Unknown'}</span>
+                        <span class="ml-1">${project.principal_investigator_name || 'Unknown'}</span>
                     </div>
                     
                     <div class="flex items-center text-xs text-gray-600">
                         <i class="fas fa-building mr-2 text-green-500"></i>
                         <span class="font-medium">Dept:</span>
-                        <span class="ml-1">${department ? department.dept_name : 'Unknown Department'}</span>
+                        <span class="ml-1">${project.dept_name || 'Unknown Department'}</span>
                     </div>
                 </div>
                 
@@ -478,49 +417,11 @@ async function loadRecentProjects() {
 }
 
 /**
- * Load and display top researchers
+ * Display top researchers
+ * @param {Array} topResearchers - Faculty ranked by projects led and their budget
  */
-async function loadTopResearchers() {
+function loadTopResearchers(topResearchers) {
     try {
-        console.log('🔄 Loading top researchers...');
-        
-        const [facultyData, projectsData] = await Promise.all([
-            fetchAPI(CONFIG.ENDPOINTS.FACULTY),
-            fetchAPI(CONFIG.ENDPOINTS.PROJECTS)
-        ]);
-
-        console.log('👥 Faculty data:', facultyData);
-        console.log('📊 Projects data:', projectsData);
-
-        // Calculate research metrics for each faculty
-        const facultyMetrics = facultyData.map(faculty => {
-            const projects = projectsData.filter(proj => 
-                proj.principal_investigator_id === faculty.faculty_id
-            );
-
-            const metrics = {
-                ...faculty,
-                projectCount: projects.length,
-                totalFunding: projects.reduce((sum, p) => sum + (p.budget || 0), 0)
-            };
-            
-            console.log(`📊 Faculty ${faculty.faculty_id} (${faculty.first_name} ${faculty.last_name}):`, metrics);
-            return metrics;
-        });
-
-        console.log('📋 Faculty metrics:', facultyMetrics);
-
-        // Sort by project count and funding
-        const topResearchers = facultyMetrics
-            .sort((a, b) => {
-                // First sort by project count, then by funding
-                if (b.projectCount !== a.projectCount) {
-                    return b.projectCount - a.projectCount;
-                }
-                return b.totalFunding - a.totalFunding;
-            })
-            .slice(0, 5);
-
         console.log('🏆 Top researchers:', topResearchers);
 
         const container = document.getElementById('top-researchers');
@@ -544,8 +445,8 @@ async function loadTopResearchers() {
                     </h4>
                     <p class="text-sm text-gray-600">${faculty.position || 'Faculty Member'}</p>
                     <div class="flex space-x-3 text-xs text-gray-500 mt-1">
-                        <span><i class="fas fa-project-diagram mr-1"></i>${faculty.projectCount} projects</span>
-                        <span><i class="fas fa-dollar-sign mr-1"></i>$${(faculty.totalFunding/1000).toFixed(0)}K</span>
+                        <span><i class="fas fa-project-diagram mr-1"></i>${faculty.project_count} projects</span>
+                        <span><i class="fas fa-dollar-sign mr-1"></i>$${(faculty.total_funding/1000).toFixed(0)}K</span>
                     </div>
                 </div>
                 <div class="bg-gray-100 rounded-full w-6 h-6 flex items-center justify-center text-xs font-bold text-gray-600">
@@ -566,39 +467,11 @@ async function loadTopResearchers() {
 }
 
 /**
- * Load and display research areas dynamically
+ * Display research areas
+ * @param {Array} sortedDepartments - Departments ordered by active project count
  */
-async function loadResearchAreas() {
+function loadResearchAreas(sortedDepartments) {
     try {
-        console.log('🔄 Loading research areas...');
-        
-        const [departmentsData, projectsData] = await Promise.all([
-            fetchAPI(CONFIG.ENDPOINTS.DEPARTMENTS),
-            fetchAPI(CONFIG.ENDPOINTS.PROJECTS)
-        ]);
-
-        console.log('🏢 Departments data:', departmentsData);
-        console.log('📊 Projects data:', projectsData);
-
-        // Calculate active projects per department
-        const departmentStats = departmentsData.map(dept => {
-            const deptProjects = projectsData.filter(proj => 
-                proj.dept_id === dept.dept_id && 
-                (proj.status === 'Active' || proj.is_active)
-            );
-            
-            return {
-                ...dept,
-                activeProjects: deptProjects.length
-            };
-        });
-
-        // Sort by active projects count (descending)
-        const sortedDepartments = departmentStats
-            .sort((a, b) => b.activeProjects - a.activeProjects)
-            .slice(0, 6); // Show top 6 departments
-
-        console.log('📋 Department stats:', departmentStats);
         console.log('🏆 Top departments:', sortedDepartments);
 
         // Get the research areas container - find section with "Research Areas" heading
@@ -658,10 +531,10 @@ async function loadResearchAreas() {
                     <h3 class="text-xl font-semibold">${dept.dept_name}</h3>
                 </div>
                 <p class="text-${colorScheme.includes('blue') ? 'blue' : colorScheme.includes('green') ? 'green' : colorScheme.includes('purple') ? 'purple' : colorScheme.includes('orange') ? 'orange' : colorScheme.includes('teal') ? 'teal' : 'indigo'}-100 mb-4">
-                    ${dept.activeProjects} Active Research Projects
+                    ${dept.active_projects} Active Research Projects
                 </p>
                 <div class="flex justify-between items-center">
-                    <span class="text-sm">${dept.activeProjects} Active Projects</span>
+                    <span class="text-sm">${dept.active_projects} Active Projects</span>
                     <i class="fas fa-arrow-right"></i>
                 </div>
             `;
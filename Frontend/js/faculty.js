@@ -768,13 +768,10 @@ document.addEventListener('DOMContentLoaded', function() {
 
     async function loadFacultyProjects(facultyId) {
         try {
-            // Try to get projects where faculty is principal investigator
-            const projectsResponse = await fetch(CONFIG.API_BASE_URL + CONFIG.ENDPOINTS.PROJECTS);
+            // Get projects where faculty is principal investigator
+            const projectsResponse = await fetch(CONFIG.API_BASE_URL + `${CONFIG.ENDPOINTS.PROJECTS}?principal_investigator_id=${facultyId}`);
             if (projectsResponse.ok) {
-                const allProjects = await projectsResponse.json();
-                const facultyProjects = allProjects.filter(project => 
-                    project.principal_investigator_id === facultyId
-                );
+                const facultyProjects = await projectsResponse.json();
                 console.log(`📊 Found ${facultyProjects.length} projects for faculty ${facultyId}`);
                 return facultyProjects;
             }
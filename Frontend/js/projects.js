@@ -692,12 +692,18 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
 
-    function viewProject(projectId) {
-        const project = allProjects.find(p => p.project_id === projectId);
-        if (!project) return;
+    async function viewProject(projectId) {
+        let project;
+        try {
+            // Project with PI, department, team, funding and publications in one request
+            project = await fetchAPI(`${CONFIG.ENDPOINTS.PROJECTS}${projectId}/full`);
+        } catch (error) {
+            console.error('❌ Error loading project details:', error);
+            return;
+        }
         
         currentProjectId = projectId;
-        const departmentName = getDepartmentName(project.dept_id);
+        const departmentName = project.department ? project.department.dept_name : 'Unknown Department';
         
         // Show project details
         const projectDetails = document.getElementById('project-details');
@@ -737,21 +743,22 @@ document.addEventListener('DOMContentLoaded', function() {
                 </div>
                 <div>
                     <p class="text-gray-500 text-sm">Principal Investigator</p>
-                    <p class="text-gray-800 font-medium">${project.principal_investigator_id ? getFacultyName(project.principal_investigator_id) : 'Not specified'}</p>
+                    <p class="text-gray-800 font-medium">${project.principal_investigator ? project.principal_investigator.name : 'Not specified'}</p>
                 </div>
             </div>
         `;
         
         // Show faculty members
         const facultyMembersDiv = document.getElementById('faculty-members');
-        if (project.faculty_members && project.faculty_members.length > 0) {
-            facultyMembersDiv.innerHTML = project.faculty_members.map(f => `
+        if (project.collaborators.length > 0) {
+            facultyMembersDiv.innerHTML = project.collaborators.map(f => `
                 <div class="flex items-center p-2 hover:bg-gray-50 rounded">
                     <div class="h-10 w-10 bg-indigo-100 rounded-full flex items-center justify-center text-indigo-700 font-bold mr-3">
-                        ${f.first_name.charAt(0)}${f.last_name.charAt(0)}
+                        ${getInitials(f.name)}
                     </div>
                     <div>
-                        <p class="font-medium">${f.first_name} ${f.last_name}</p>
+                        <p class="font-medium">${f.name}</p>
+                        <p class="text-xs text-gray-500">${f.role}</p>
                     </div>
                 </div>
             `).join('');
@@ -761,14 +768,15 @@ document.addEventListener('DOMContentLoaded', function() {
         
         // Show student researchers
         const studentResearchersDiv = document.getElementById('student-researchers');
-        if (project.students && project.students.length > 0) {
+        if (project.students.length > 0) {
             studentResearchersDiv.innerHTML = project.students.map(s => `
                 <div class="flex items-center p-2 hover:bg-gray-50 rounded">
                     <div class="h-10 w-10 bg-green-100 rounded-full flex items-center justify-center text-green-700 font-bold mr-3">
-                        ${s.first_name.charAt(0)}${s.last_name.charAt(0)}
+                        ${getInitials(s.name)}
                     </div>
                     <div>
-                        <p class="font-medium">${s.first_name} ${s.last_name}</p>
+                        <p class="font-medium">${s.name}</p>
+                        <p class="text-xs text-gray-500">${s.role}</p>
                     </div>
                 </div>
             `).join('');
@@ -780,6 +788,10 @@ document.addEventListener('DOMContentLoaded', function() {
     }
 
     // Utility functions
+    function getInitials(name) {
+        return (name || '').split(' ').filter(Boolean).map(part => part.charAt(0)).slice(0, 2).join('');
+    }
+
     function formatDate(dateString) {
         if (!dateString) return 'N/A';
         try {
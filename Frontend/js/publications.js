@@ -164,7 +164,8 @@ document.addEventListener('DOMContentLoaded', function() {
      */
     async function loadFaculty() {
         try {
-            facultyList = await fetchAPI(CONFIG.ENDPOINTS.FACULTY);
+            // Only names are needed for the author dropdown
+            facultyList = await fetchAPI(`${CONFIG.ENDPOINTS.FACULTY}?fields=first_name,last_name`);
         } catch (error) {
             console.error('Error loading faculty:', error);
             showNotification('Error loading faculty data', 'error');
@@ -176,7 +177,7 @@ document.addEventListener('DOMContentLoaded', function() {
      */
     async function loadProjects() {
         try {
-            const projects = await fetchAPI(CONFIG.ENDPOINTS.PROJECTS);
+            const projects = await fetchAPI(`${CONFIG.ENDPOINTS.PROJECTS}?fields=project_title`);
             
             // Clear existing options except the default one
             projectIdSelect.innerHTML = '<option value="">Select Project</option>';
@@ -385,25 +385,16 @@ document.addEventListener('DOMContentLoaded', function() {
                 return;
             }
             
-            // Get faculty's projects
-            const projectsResponse = await fetch(CONFIG.API_BASE_URL + `${CONFIG.ENDPOINTS.PROJECTS}?principal_investigator_id=${facultyId}`);
+            // Get faculty's projects, advisees and publications in one request
+            const portfolioResponse = await fetch(CONFIG.API_BASE_URL + `${CONFIG.ENDPOINTS.FACULTY}${facultyId}/portfolio?sections=advisees,projects,publications`);
             let projects = [];
-            if (projectsResponse.ok) {
-                projects = await projectsResponse.json();
-            }
-            
-            // Get faculty's students (advisees)
-            const studentsResponse = await fetch(CONFIG.API_BASE_URL + `${CONFIG.ENDPOINTS.STUDENTS}?advisor_id=${facultyId}`);
             let students = [];
-            if (studentsResponse.ok) {
-                students = await studentsResponse.json();
-            }
-            
-            // Get faculty's publications
-            const publicationsResponse = await fetch(CONFIG.API_BASE_URL + `${CONFIG.ENDPOINTS.PUBLICATIONS}?faculty_id=${facultyId}`);
             let publications = [];
-            if (publicationsResponse.ok) {
-                publications = await publicationsResponse.json();
+            if (portfolioResponse.ok) {
+                const portfolio = await portfolioResponse.json();
+                projects = portfolio.projects.as_principal_investigator;
+                students = portfolio.advisees;
+                publications = portfolio.publications;
             }
             
             const departmentName = getDepartmentName(facultyMember.dept_id);
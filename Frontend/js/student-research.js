@@ -312,20 +312,14 @@ document.addEventListener('DOMContentLoaded', function() {
         
         try {
             console.log('📡 Loading research activities from API...');
-            const response = await fetch(CONFIG.API_BASE_URL + CONFIG.ENDPOINTS.STUDENT_RESEARCH);
+            allResearch = await fetchAllPages(CONFIG.API_BASE_URL + CONFIG.ENDPOINTS.STUDENT_RESEARCH);
+            console.log('Research activities loaded:', allResearch);
             
-            if (response.ok) {
-                allResearch = await response.json();
-                console.log('Research activities loaded:', allResearch);
-                
-                // Apply initial filters
-                filterResearch();
-                
-                // Load statistics
-                loadStatistics();
-            } else {
-                throw new Error(`HTTP error! status: ${response.status}`);
-            }
+            // Apply initial filters
+            filterResearch();
+            
+            // Load statistics
+            loadStatistics();
         } catch (error) {
             console.error('Error loading research activities:', error);
             showNotification('Failed to load research activities', 'error');
@@ -22,6 +22,31 @@ async function fetchAPI(endpoint, options = {}) {
     }
 }
 
+/**
+ * Fetch every page of a cursor-paginated list endpoint
+ * @param {string} url - Full URL of the list endpoint
+ * @returns {Promise<Array>} - Promise with all rows across pages
+ */
+async function fetchAllPages(url) {
+    const rows = [];
+    let cursor = null;
+    
+    do {
+        const pageUrl = new URL(url);
+        if (cursor) pageUrl.searchParams.set('cursor', cursor);
+        
+        const response = await fetch(pageUrl);
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        
+        rows.push(...await response.json());
+        cursor = response.headers.get('X-Next-Cursor');
+    } while (cursor);
+    
+    return rows;
+}
+
 /**
  * Format date to a readable string
  * @param {string} dateString - ISO date string